@@ -0,0 +1,291 @@
+"""
+SQL 쿼리 계측 / 슬로우 쿼리 로그
+- back.db.conn 의 SQLAlchemy Engine, back.db.pool 의 mysql.connector 커넥션에 자동으로 연결됨
+- 문장별 실행 시간, 반환/영향 행 수, 호출 위치(파일:줄)를 기록하고 지연시간 히스토그램 유지
+- SLOW_QUERY_MS(기본 200ms) 이상 걸린 쿼리는 logs/slow_query.log 에 기록
+- DB_INSTRUMENT=0 으로 끌 수 있음
+
+사용 예)
+    from back.db.instrument import get_query_stats, print_report
+    print_report()
+"""
+
+from pathlib import Path
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import weakref
+
+from sqlalchemy import event
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 경로
+ROOT = Path(__file__).resolve().parents[2]
+LOG_DIR = ROOT / "logs"
+SLOW_LOG_FILE = LOG_DIR / "slow_query.log"
+
+ENABLED = os.getenv("DB_INSTRUMENT", "1") != "0"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 200))
+
+# 히스토그램 구간 상한(ms). 마지막 구간은 그 이상 전부
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# 호출 위치 추적 시 건너뛸 모듈 경로
+_SKIP_PATHS = (
+    str(Path(__file__).resolve()),
+    str(ROOT / "back" / "db" / "pool.py"),
+    os.sep + "sqlalchemy" + os.sep,
+    os.sep + "pandas" + os.sep,
+    os.sep + "mysql" + os.sep,
+    os.sep + "contextlib.py",
+)
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str, max_len: int = 300) -> str:
+    """공백을 정리한 문장을 통계 키로 사용"""
+    return _WS_RE.sub(" ", str(statement)).strip()[:max_len]
+
+
+def _call_site() -> str:
+    """DB 계층 바깥에서 쿼리를 호출한 첫 프레임 (파일:줄 함수)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(p in filename for p in _SKIP_PATHS):
+            try:
+                rel = Path(filename).resolve().relative_to(ROOT)
+            except ValueError:
+                rel = Path(filename).name
+            return f"{rel}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def _get_slow_logger() -> logging.Logger:
+    slow_logger = logging.getLogger("dochicar.slow_query")
+    if not slow_logger.handlers:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(SLOW_LOG_FILE, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_logger.addHandler(handler)
+        slow_logger.setLevel(logging.INFO)
+    return slow_logger
+
+
+class QueryStats:
+    """문장별 지연시간/행 수 통계"""
+
+    def __init__(self, slow_ms: float = SLOW_QUERY_MS):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    def _entry(self, key: str) -> dict:
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = {
+                "statement": key,
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "rows": 0,
+                "histogram": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+                "call_sites": {},
+            }
+            self._stats[key] = entry
+        return entry
+
+    def record(self, statement: str, elapsed_ms: float, rowcount: int | None = None, call_site: str | None = None):
+        key = normalize_statement(statement)
+        bucket = len(HISTOGRAM_BUCKETS_MS)
+        for i, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                bucket = i
+                break
+
+        with self._lock:
+            entry = self._entry(key)
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            if rowcount is not None and rowcount >= 0:
+                entry["rows"] += rowcount
+            entry["histogram"][bucket] += 1
+            if call_site:
+                entry["call_sites"][call_site] = entry["call_sites"].get(call_site, 0) + 1
+
+        if elapsed_ms >= self.slow_ms:
+            _get_slow_logger().info(
+                f"{elapsed_ms:.1f}ms rows={rowcount if rowcount is not None else '?'} "
+                f"at={call_site or '?'} sql={key}"
+            )
+
+    def add_rows(self, statement: str, rows: int):
+        """실행 후 fetch 시점에야 행 수를 알 수 있는 경우 (mysql.connector 비버퍼 커서)"""
+        key = normalize_statement(statement)
+        with self._lock:
+            self._entry(key)["rows"] += rows
+
+    def snapshot(self) -> list[dict]:
+        """총 소요시간 내림차순 통계 목록"""
+        with self._lock:
+            items = [
+                {**e, "histogram": list(e["histogram"]), "call_sites": dict(e["call_sites"])}
+                for e in self._stats.values()
+            ]
+        for e in items:
+            e["avg_ms"] = e["total_ms"] / e["count"] if e["count"] else 0.0
+        return sorted(items, key=lambda e: e["total_ms"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+_STATS = QueryStats()
+
+
+def get_query_stats() -> QueryStats:
+    return _STATS
+
+
+# ============== SQLAlchemy ==============
+_INSTRUMENTED_ENGINES = weakref.WeakSet()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 실행 컨텍스트에 저장 (커넥션에 쌓아두면 실패한 문장의 값이 남음)
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    if start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _STATS.record(statement, elapsed_ms, getattr(cursor, "rowcount", None), _call_site())
+
+
+def _handle_error(exception_context):
+    """실패한 문장도 실행 시간 기록 (mysql.connector 경로와 동일)"""
+    context = exception_context.execution_context
+    start = getattr(context, "_query_start", None)
+    if start is None:
+        return
+    context._query_start = None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _STATS.record(exception_context.statement, elapsed_ms, None, _call_site())
+
+
+def instrument_engine(engine):
+    """Engine에 실행 시간 측정 이벤트를 등록 (중복 등록 안 함)"""
+    if not ENABLED or engine in _INSTRUMENTED_ENGINES:
+        return engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _INSTRUMENTED_ENGINES.add(engine)
+    return engine
+
+
+# ============== mysql.connector ==============
+class InstrumentedCursor:
+    """mysql.connector 커서 래퍼. execute/executemany 시간과 행 수를 기록
+
+    행 수는 한 번만 센다: DML 은 실행 직후 rowcount(영향 행 수),
+    SELECT 는 fetch/반복으로 실제로 꺼낸 행 수 (비버퍼 커서는 실행 시점에 rowcount 를 모름)
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._statement = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._add_rows(1)
+            yield row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+        return False
+
+    def _timed(self, method, statement, params):
+        start = time.perf_counter()
+        self._statement = None
+        try:
+            return method(statement, params) if params is not None else method(statement)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            # 결과셋이 있으면(SELECT 등) fetch 할 때 세고, 없으면(DML) 영향 행 수 기록
+            if self._cursor.description is None:
+                rowcount = self._cursor.rowcount
+            else:
+                rowcount = None
+                self._statement = statement
+            _STATS.record(statement, elapsed_ms, rowcount, _call_site())
+
+    def _add_rows(self, rows: int):
+        if self._statement is not None and rows:
+            _STATS.add_rows(self._statement, rows)
+
+    def execute(self, statement, params=None, *args, **kwargs):
+        if args or kwargs:
+            return self._cursor.execute(statement, params, *args, **kwargs)
+        return self._timed(self._cursor.execute, statement, params)
+
+    def executemany(self, statement, seq_params):
+        return self._timed(self._cursor.executemany, statement, seq_params)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._add_rows(1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._add_rows(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._add_rows(len(rows))
+        return rows
+
+
+def instrument_cursor(cursor):
+    if not ENABLED:
+        return cursor
+    return InstrumentedCursor(cursor)
+
+
+# ============== 리포트 ==============
+def print_report(top: int = 20):
+    """총 소요시간 상위 쿼리와 히스토그램 출력"""
+    labels = [f"≤{b}" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}"]
+    print("📊 쿼리 통계 (총 소요시간 순)")
+    for e in _STATS.snapshot()[:top]:
+        print(
+            f"- {e['count']}회 total={e['total_ms']:.1f}ms avg={e['avg_ms']:.1f}ms "
+            f"max={e['max_ms']:.1f}ms rows={e['rows']}"
+        )
+        print(f"  {e['statement'][:120]}")
+        hist = " ".join(f"{label}ms:{n}" for label, n in zip(labels, e["histogram"]) if n)
+        print(f"  histogram: {hist}")
+        for site, n in sorted(e["call_sites"].items(), key=lambda x: -x[1])[:3]:
+            print(f"  at {site} ({n}회)")
@@ -16,6 +16,13 @@ CREATE TABLE IF NOT EXISTS vehicle_reg (
   reg_count   INT          NOT NULL COMMENT '계',
   created_at  TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (id),
-  UNIQUE KEY uk_vehicle_reg (reg_month, region, gender, age_group),
+  UNIQUE KEY uk_vehicle_reg (reg_year, reg_month, region, gender, age_group),
   KEY idx_vehicle_reg_region_month (region, reg_month)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
\ No newline at end of file
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+# 4. (기존 DB) 연도가 빠진 유니크 키 교체 - 여러 해를 적재하면 같은 월끼리 덮어쓰던 문제
+# ALTER TABLE vehicle_reg DROP INDEX uk_vehicle_reg,
+#   ADD UNIQUE KEY uk_vehicle_reg (reg_year, reg_month, region, gender, age_group);
+
+# 5. 사전 집계(롤업) 테이블: vehicle_reg_month_region / _month_age / _month_gender / _region_age_window
+#    스키마와 갱신 쿼리는 rollups.py 참고 (적재 스크립트가 마지막에 자동 생성/갱신)
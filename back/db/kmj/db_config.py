@@ -1,18 +1,53 @@
-import mysql.connector
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
+from sqlalchemy.engine import URL
+
+# 스크립트로 직접 실행될 때도 back 패키지를 import 할 수 있도록 루트 경로 추가
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.db.conn import get_engine_for_url  # noqa: E402
+from back.db.pool import get_pool  # noqa: E402
 
 load_dotenv()
 
 
-def get_conn():
-    return mysql.connector.connect(
+def _connect_kwargs() -> dict:
+    return dict(
         host=os.getenv("HOST", "127.0.0.1"),  # 기본값 명시
         user=os.getenv("USER"),
         password=os.getenv("PASSWORD"),
         database=os.getenv("DATABASE"),
-        port=os.getenv("PORT", 3306),  # 필요시 포트도 명시
+        port=int(os.getenv("PORT", 3306)),  # 필요시 포트도 명시
+    )
+
+
+def get_conn(**extra):
+    """공용 풀에서 커넥션을 빌려온다. close() 하면 풀에 반납된다.
+
+    extra 로 접속 옵션을 추가하면(예: allow_local_infile=True) 별도의 풀을 사용한다.
+    """
+    return get_pool("kmj", **_connect_kwargs(), **extra).connect()
+
+
+def get_engine():
+    """get_conn() 과 같은 접속 정보(HOST/USER/DATABASE...)로 만든 SQLAlchemy Engine
+
+    적재 매니페스트처럼 SQLAlchemy 로 다루는 테이블도 vehicle_reg 와 같은 DB에 기록되도록 한다.
+    """
+    kwargs = _connect_kwargs()
+    url = URL.create(
+        "mysql+mysqlconnector",
+        username=kwargs["user"],
+        password=kwargs["password"],
+        host=kwargs["host"],
+        port=kwargs["port"],
+        database=kwargs["database"],
     )
+    return get_engine_for_url(url.render_as_string(hide_password=False))
 
 
 # 연결 확인
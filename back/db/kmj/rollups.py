@@ -0,0 +1,159 @@
+"""
+vehicle_reg 사전 집계(롤업) 테이블
+- 월×지역, 월×연령대, 월×성별 합계와 최근 N개월 지역×연령대 집계를 미리 계산해 둠
+- 등록자료 적재(vehicle_registration_overview.py) 마지막에 refresh_rollups() 로 갱신
+- 화면(추천 페이지)의 옵션 목록/추이 조회는 원본 대신 이 테이블을 조회
+
+실행 예)
+    python back/db/kmj/rollups.py        # 수동 갱신
+"""
+
+import time
+
+try:
+    from db_config import get_conn
+except ImportError:  # 패키지(back.db.kmj)로 import 된 경우
+    from back.db.kmj.db_config import get_conn
+
+# 최근 N개월 지역×연령대 집계 구간
+TRAILING_WINDOWS = (3, 12)
+
+ROLLUP_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_reg_month_region (
+      reg_year   VARCHAR(10) NOT NULL,
+      reg_month  VARCHAR(10) NOT NULL,
+      region     VARCHAR(20) NOT NULL,
+      reg_count  BIGINT      NOT NULL,
+      PRIMARY KEY (reg_year, reg_month, region),
+      KEY idx_vrmr_region (region, reg_year, reg_month)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_reg_month_age (
+      reg_year   VARCHAR(10) NOT NULL,
+      reg_month  VARCHAR(10) NOT NULL,
+      age_group  VARCHAR(20) NOT NULL,
+      reg_count  BIGINT      NOT NULL,
+      PRIMARY KEY (reg_year, reg_month, age_group),
+      KEY idx_vrma_age (age_group, reg_year, reg_month)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_reg_month_gender (
+      reg_year   VARCHAR(10) NOT NULL,
+      reg_month  VARCHAR(10) NOT NULL,
+      gender     VARCHAR(10) NOT NULL,
+      reg_count  BIGINT      NOT NULL,
+      PRIMARY KEY (reg_year, reg_month, gender),
+      KEY idx_vrmg_gender (gender, reg_year, reg_month)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_reg_region_age_window (
+      window_months  INT         NOT NULL COMMENT '최근 N개월',
+      region         VARCHAR(20) NOT NULL,
+      age_group      VARCHAR(20) NOT NULL,
+      from_ym        CHAR(6)     NOT NULL COMMENT '구간 시작 YYYYMM',
+      to_ym          CHAR(6)     NOT NULL COMMENT '구간 끝 YYYYMM',
+      months         INT         NOT NULL COMMENT '구간 안에 데이터가 있는 개월 수',
+      total_count    BIGINT      NOT NULL,
+      avg_count      BIGINT      NOT NULL COMMENT '월평균 등록대수',
+      PRIMARY KEY (window_months, region, age_group)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+]
+
+# (테이블, 집계 차원 컬럼)
+MONTHLY_ROLLUPS = [
+    ("vehicle_reg_month_region", "region"),
+    ("vehicle_reg_month_age", "age_group"),
+    ("vehicle_reg_month_gender", "gender"),
+]
+
+
+def _shift_ym(ym: str, months: int) -> str:
+    """'202507' 기준 months 개월 이전 → 'YYYYMM'"""
+    total = int(ym[:4]) * 12 + int(ym[4:]) - 1 - months
+    return f"{total // 12:04d}{total % 12 + 1:02d}"
+
+
+def _split_ym(ym: str) -> tuple[str, str]:
+    """'202507' → ('2025', '07') (vehicle_reg 의 reg_year/reg_month 값 형식)"""
+    return ym[:4], ym[4:]
+
+
+def ensure_rollup_tables(cur):
+    for ddl in ROLLUP_DDL:
+        cur.execute(ddl)
+
+
+def refresh_rollups(conn=None) -> dict:
+    """롤업 테이블 전체 재계산 (하나의 트랜잭션). 테이블별 행 수 반환"""
+    own_conn = conn is None
+    conn = conn or get_conn()
+    counts = {}
+    try:
+        with conn.cursor() as cur:
+            ensure_rollup_tables(cur)
+
+            for table, dim in MONTHLY_ROLLUPS:
+                cur.execute(f"DELETE FROM {table}")
+                cur.execute(
+                    f"""
+                    INSERT INTO {table} (reg_year, reg_month, {dim}, reg_count)
+                    SELECT reg_year, reg_month, {dim}, SUM(reg_count)
+                    FROM vehicle_reg
+                    GROUP BY reg_year, reg_month, {dim}
+                    """
+                )
+                counts[table] = cur.rowcount
+
+            # uk_vehicle_reg(reg_year, reg_month, ...) 인덱스 끝에서 한 행만 읽음
+            cur.execute("SELECT reg_year, reg_month FROM vehicle_reg ORDER BY reg_year DESC, reg_month DESC LIMIT 1")
+            latest = cur.fetchone()
+            latest_ym = f"{latest[0]}{latest[1]}" if latest else None
+
+            cur.execute("DELETE FROM vehicle_reg_region_age_window")
+            counts["vehicle_reg_region_age_window"] = 0
+            if latest_ym:
+                for window in TRAILING_WINDOWS:
+                    from_ym = _shift_ym(latest_ym, window - 1)
+                    (from_year, from_month), (to_year, to_month) = _split_ym(from_ym), _split_ym(latest_ym)
+                    # 컬럼을 CONCAT 으로 감싸지 않아야 uk_vehicle_reg 의 reg_year 범위 검색을 쓸 수 있음
+                    cur.execute(
+                        """
+                        INSERT INTO vehicle_reg_region_age_window
+                            (window_months, region, age_group, from_ym, to_ym, months, total_count, avg_count)
+                        SELECT %s, region, age_group, %s, %s,
+                               COUNT(DISTINCT reg_year, reg_month),
+                               SUM(reg_count),
+                               ROUND(SUM(reg_count) / COUNT(DISTINCT reg_year, reg_month))
+                        FROM vehicle_reg
+                        WHERE reg_year BETWEEN %s AND %s
+                          AND (reg_year, reg_month) BETWEEN (%s, %s) AND (%s, %s)
+                        GROUP BY region, age_group
+                        """,
+                        (
+                            window, from_ym, latest_ym,
+                            from_year, to_year,
+                            from_year, from_month, to_year, to_month,
+                        ),
+                    )
+                    counts["vehicle_reg_region_age_window"] += cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if own_conn:
+            conn.close()
+    return counts
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    result = refresh_rollups()
+    print(f"[SUCCESS] 롤업 갱신 완료 ({time.perf_counter() - start:.2f}s)")
+    for table, rows in result.items():
+        print(f"   - {table}: {rows}행")
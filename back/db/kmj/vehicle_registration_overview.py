@@ -1,6 +1,52 @@
+"""
+자동차 등록자료 통계(월별 엑셀) → vehicle_reg 적재
+- data/kmj/ 의 YYYY년_MM월_자동차_등록자료_통계.xlsx 를 모두 찾아 파싱 (기본 순차, --workers N 이면 프로세스 풀)
+- 파일별 tidy 데이터를 하나로 합쳐 한 번에 적재
+- 적재 후 사전 집계(롤업) 테이블 갱신 (rollups.py)
+- 기본 파서는 스트리밍 모드(대상 시트 XML만 행 단위로 읽음). --parser readonly/full 로 openpyxl 사용
+
+실행 예)
+    python back/db/kmj/vehicle_registration_overview.py                 # data/kmj 전체
+    python back/db/kmj/vehicle_registration_overview.py 파일1.xlsx 파일2.xlsx
+    python back/db/kmj/vehicle_registration_overview.py --workers 4 --dry-run
+    python back/db/kmj/vehicle_registration_overview.py --bench           # 파서 모드별 시간/메모리 비교
+    python back/db/kmj/vehicle_registration_overview.py --load-strategy load_data
+    python back/db/kmj/vehicle_registration_overview.py --compare-load    # 적재 방식별 시간 비교
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import multiprocessing
+import tempfile
+import time
+
 from openpyxl import load_workbook
 import pandas as pd
-from db_config import get_conn
+
+try:
+    from db_config import get_conn, get_engine
+    from rollups import refresh_rollups
+except ImportError:  # 패키지(back.db.kmj)로 import 된 경우
+    from back.db.kmj.db_config import get_conn, get_engine
+    from back.db.kmj.rollups import refresh_rollups
+from back.db.manifest import IngestManifest, report_skipped  # db_config 에서 루트 경로 추가됨
+from back.utils.frame_cache import cached_frame
+from back.utils.xlsx_stream import iter_sheet_rows
+
+ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = ROOT / "data" / "kmj"
+FILE_PATTERN = "*년_*월_자동차_등록자료_통계.xlsx"
+
+SHEET_NAME = "04.성별_연령별"
+HEADER_ROW_IDX = 3  # 1-based (엑셀 줄 번호)
+
+TIDY_COLUMNS = ["reg_year", "reg_month", "region", "gender", "age_group", "reg_count"]
+GENDER_MAP = {"남자": "남성", "여자": "여성", "전체": "합계"}
+DROP_GENDERS = {"합계", "계", "기타", "미상", "무응답", "불명", ""}
+DROP_AGES = {"계", "합계", "기타", ""}
+PARSER_MODES = ("stream", "readonly", "full")
+MANIFEST_LOADER = "kmj.vehicle_reg"
 
 
 def infer_reg_month(filename: str, ws) -> pd.Timestamp:
@@ -22,7 +68,9 @@ def infer_reg_month(filename: str, ws) -> pd.Timestamp:
         return pd.Timestamp(y, mm, 1)
 
     # 2) 워크시트 상단 몇 줄에서 시도 (예: "조회년월: 2023.01")
-    for row in ws.iter_rows(min_row=1, max_row=5, values_only=True):
+    #    ws 대신 이미 읽은 상단 행 목록을 넘겨도 됨 (스트리밍 모드)
+    top_rows = ws.iter_rows(min_row=1, max_row=5, values_only=True) if hasattr(ws, "iter_rows") else ws
+    for row in top_rows:
         text = " ".join(str(x) for x in row if x is not None)
         m = pattern.search(text)
         if m:
@@ -32,98 +80,268 @@ def infer_reg_month(filename: str, ws) -> pd.Timestamp:
     raise ValueError("기준월(YYYY.MM/년월)을 파일명이나 시트 상단에서 찾지 못했습니다.")
 
 
-filename = "./data/kmj/2023년_01월_자동차_등록자료_통계.xlsx"
+def read_sheet(filename) -> tuple[pd.DataFrame, pd.Timestamp]:
+    """워크북에서 성별/연령별 시트를 읽어 (원본 DataFrame, 기준월) 반환"""
+    wb = load_workbook(filename=filename, data_only=True)
+    ws = wb[SHEET_NAME]
 
-wb = load_workbook(filename=filename, data_only=True)
-sheet_name = "04.성별_연령별"
-ws = wb[sheet_name]
+    # (2-1) 헤더 행(2번째 줄) 읽기
+    header = [c.value for c in ws[HEADER_ROW_IDX]]
 
-# (2-1) 헤더 행(2번째 줄) 읽기
-header_row_idx = 3  # 1-based (엑셀 줄 번호)
-header = [c.value for c in ws[header_row_idx]]
+    # (2-2) 데이터 행(3번째 줄부터 끝까지) 읽기
+    data_rows = []
+    for row in ws.iter_rows(min_row=HEADER_ROW_IDX + 1, values_only=True):
+        data_rows.append(list(row))
 
+    reg_month = infer_reg_month(Path(filename).name, ws)
+    wb.close()
 
-# (2-2) 데이터 행(3번째 줄부터 끝까지) 읽기
-data_rows = []
-for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-    data_rows.append(list(row))
-# print("rows read:", len(data_rows))
+    # (3-1) DataFrame 생성
+    return pd.DataFrame(data_rows, columns=header), reg_month
 
-# (3-1) DataFrame 생성
-df = pd.DataFrame(data_rows, columns=header)
 
-# (3-2) 가짜/빈 컬럼 제거
-df = df.loc[:, df.columns.notna()]  # None 컬럼 제거
-df = df.loc[:, ~df.columns.astype(str).str.startswith("Unnamed")]  # Unnamed 제거
+def to_tidy(df: pd.DataFrame, reg_month: pd.Timestamp) -> pd.DataFrame:
+    """wide 시트 → (reg_year, reg_month, region, gender, age_group, reg_count) long 포맷"""
+    # (3-2) 가짜/빈 컬럼 제거
+    df = df.loc[:, df.columns.notna()]  # None 컬럼 제거
+    df = df.loc[:, ~df.columns.astype(str).str.startswith("Unnamed")]  # Unnamed 제거
 
-# (3-3) 성별 보정(ffill)
-if "성별" in df.columns:
-    df["성별"] = pd.Series(df["성별"]).ffill().astype(str).str.strip()
+    # (3-3) 성별 보정(ffill)
+    if "성별" in df.columns:
+        df["성별"] = pd.Series(df["성별"]).ffill().astype(str).str.strip()
 
-    # (3-3-1) 성별 정규화(동의어 통합)
-    gender_map = {"남자": "남성", "여자": "여성", "전체": "합계"}
-    df["성별"] = df["성별"].replace(gender_map).str.replace(r"\s+", "", regex=True)
+        # (3-3-1) 성별 정규화(동의어 통합)
+        df["성별"] = df["성별"].replace(GENDER_MAP).str.replace(r"\s+", "", regex=True)
 
-    # (3-3-2) 불필요 성별 제거: 합계/계/기타/미상 등
-    drop_genders = {"합계", "계", "기타", "미상", "무응답", "불명", ""}
-    df = df[~df["성별"].isin(drop_genders)]
+        # (3-3-2) 불필요 성별 제거: 합계/계/기타/미상 등
+        df = df[~df["성별"].isin(DROP_GENDERS)]
 
-# (3-4) 합계 행 제거
-if "연령/시도" in df.columns:
-    df["연령/시도"] = df["연령/시도"].astype(str).str.strip()
-    # 기존: df = df[df["연령/시도"] != "계"]
-    drop_age = {"계", "합계", "기타", ""}
-    df = df[~df["연령/시도"].isin(drop_age)]
+    # (3-4) 합계 행 제거
+    if "연령/시도" in df.columns:
+        df["연령/시도"] = df["연령/시도"].astype(str).str.strip()
+        df = df[~df["연령/시도"].isin(DROP_AGES)]
 
+    # (3-5) 지역 컬럼 목록 (총계는 DB에 안 넣을 거면 제외)
+    id_cols = ["성별", "연령/시도"]
+    region_cols = [c for c in df.columns if c not in id_cols + ["총계"]]
 
-# (3-5) 지역 컬럼 목록 (총계는 DB에 안 넣을 거면 제외)
-id_cols = ["성별", "연령/시도"]
-region_cols = [c for c in df.columns if c not in id_cols + ["총계"]]
+    # (3-6) 쉼표 제거 후 숫자화
+    df = df.copy()
+    for c in region_cols:
+        df[c] = (
+            pd.Series(df[c])
+            .astype(str)
+            .str.replace(",", "", regex=False)
+            .str.replace(" ", "", regex=False)
+        )
+        df[c] = pd.to_numeric(df[c], errors="coerce")
 
-# (3-6) 쉼표 제거 후 숫자화
-for c in region_cols:
-    df[c] = (
-        pd.Series(df[c])
-        .astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace(" ", "", regex=False)
+    # === (4) Wide → Long ===
+    # 안전 체크: 꼭 있어야 할 컬럼
+    required = set(["성별", "연령/시도"])
+    missing = required - set(df.columns)
+    if missing:
+        raise KeyError(f"필수 컬럼 누락: {missing}. 실제 컬럼: {list(df.columns)}")
+
+    # Long 포맷으로 녹이기
+    tidy = (
+        df.melt(
+            id_vars=["성별", "연령/시도"],
+            value_vars=region_cols,
+            var_name="region",
+            value_name="reg_count",
+        )
+        .dropna(subset=["reg_count"])
+        .rename(columns={"성별": "gender", "연령/시도": "age_group"})
     )
-    df[c] = pd.to_numeric(df[c], errors="coerce")
-
-# === (4) Wide → Long ===
-# 안전 체크: 꼭 있어야 할 컬럼
-required = set(["성별", "연령/시도"])
-missing = required - set(df.columns)
-if missing:
-    raise KeyError(f"필수 컬럼 누락: {missing}. 실제 컬럼: {list(df.columns)}")
-
-# Long 포맷으로 녹이기
-tidy = (
-    df.melt(
-        id_vars=["성별", "연령/시도"],
-        value_vars=region_cols,
-        var_name="region",
-        value_name="reg_count",
+
+    # 타입/공백 정리
+    tidy["gender"] = tidy["gender"].astype(str).str.strip()
+    tidy["age_group"] = tidy["age_group"].astype(str).str.strip()
+    tidy["region"] = tidy["region"].astype(str).str.strip()
+    tidy["reg_count"] = tidy["reg_count"].astype("Int64")
+
+    # reg_month에서 연도와 월 분리
+    tidy["reg_year"] = reg_month.year
+    tidy["reg_month"] = f"{reg_month.month:02d}"
+    return tidy[TIDY_COLUMNS]
+
+
+def _to_count(value):
+    """셀 값 → 정수 등록대수 (숫자가 아니면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else int(value)  # NaN 제외
+    text = str(value).replace(",", "").replace(" ", "")
+    try:
+        return int(float(text))
+    except ValueError:
+        return None
+
+
+def iter_records(filename, backend: str = "xml"):
+    """스트리밍 모드: 대상 시트만 행 단위로 읽어 tidy 레코드(tuple)를 생성
+
+    backend="xml"      : 시트 XML 직접 iterparse (styles.xml 등을 읽지 않아 가장 빠름)
+    backend="readonly" : openpyxl read-only 워크북 (셀 객체 모델 없이 순차 파싱)
+    어느 쪽이든 다른 시트는 읽지 않고 메모리 사용량이 시트 크기와 무관하게 일정하다.
+    """
+    wb = None
+    if backend == "xml":
+        rows = iter_sheet_rows(filename, SHEET_NAME)
+    else:
+        wb = load_workbook(filename=filename, read_only=True, data_only=True)
+        rows = wb[SHEET_NAME].iter_rows(values_only=True)
+
+    try:
+        top_rows = [next(rows, ()) for _ in range(HEADER_ROW_IDX - 1)]
+        reg_month = infer_reg_month(Path(filename).name, top_rows)
+        reg_year, reg_month_num = reg_month.year, f"{reg_month.month:02d}"
+
+        header = [str(h).strip() if h is not None else None for h in next(rows, ())]
+        if "성별" not in header or "연령/시도" not in header:
+            raise KeyError(f"필수 컬럼 누락: 성별/연령/시도. 실제 컬럼: {header}")
+        gender_idx, age_idx = header.index("성별"), header.index("연령/시도")
+
+        # 지역 컬럼 (총계/빈 컬럼 제외)
+        region_idx = [
+            (i, h)
+            for i, h in enumerate(header)
+            if h and not h.startswith("Unnamed") and h not in ("성별", "연령/시도", "총계")
+        ]
+
+        gender = None
+        for row in rows:
+            # 성별은 병합 셀이라 첫 행에만 값이 있음 (ffill)
+            g = row[gender_idx] if gender_idx < len(row) else None
+            if g is not None:
+                g = "".join(str(g).split())
+                gender = GENDER_MAP.get(g, g)
+            if gender is None or gender in DROP_GENDERS:
+                continue
+
+            age = row[age_idx] if age_idx < len(row) else None
+            if age is None:
+                continue
+            age = str(age).strip()
+            if age in DROP_AGES:
+                continue
+
+            for i, region in region_idx:
+                count = _to_count(row[i]) if i < len(row) else None
+                if count is not None:
+                    yield (reg_year, reg_month_num, region, gender, age, count)
+    finally:
+        if wb is not None:
+            wb.close()
+
+
+def parse_workbook(filename, mode: str = "stream") -> pd.DataFrame:
+    """워크북 1개 → tidy DataFrame (mode: stream | readonly | full)"""
+    if mode in ("stream", "readonly"):
+        backend = "xml" if mode == "stream" else "readonly"
+        tidy = pd.DataFrame.from_records(iter_records(filename, backend), columns=TIDY_COLUMNS)
+        tidy["reg_count"] = tidy["reg_count"].astype("Int64")
+        return tidy
+    if mode == "full":
+        df, reg_month = read_sheet(filename)
+        return to_tidy(df, reg_month)
+    raise ValueError(f"알 수 없는 파서 모드: {mode} (가능: {PARSER_MODES})")
+
+
+def _parse_timed(filename, mode: str = "stream", use_cache: bool = True) -> tuple[str, pd.DataFrame, float]:
+    """프로세스 풀 작업 단위: (파일명, tidy, 소요초)
+
+    use_cache=True 면 파싱 결과를 원본 해시 기준 Arrow 캐시(data/interim/frame_cache)에서 재사용
+    """
+    start = time.perf_counter()
+    if use_cache:
+        tidy = cached_frame(filename, lambda: parse_workbook(filename, mode), name="vehicle_reg")
+    else:
+        tidy = parse_workbook(filename, mode)
+    return str(filename), tidy, time.perf_counter() - start
+
+
+def discover_workbooks(data_dir: Path = DATA_DIR) -> list[Path]:
+    """data/kmj 의 월별 등록자료 통계 파일 목록 (이름순 = 기준월순)"""
+    return sorted(data_dir.glob(FILE_PATTERN))
+
+
+def parse_many(
+    files: list[Path],
+    workers: int | None = None,
+    mode: str = "stream",
+    file_rows: dict | None = None,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """여러 워크북을 파싱 후 하나의 tidy DataFrame으로 병합
+
+    기본은 순차 파싱. 스트리밍 파서는 파일당 수십 ms 라 spawn 프로세스 기동/임포트 비용이 더 크다
+    (data/kmj 기준 workers=4 5.88s vs workers=1 0.23s). workers>1 을 명시하면 프로세스 풀 사용
+    (파일이 크거나 openpyxl 파서(--parser readonly/full)일 때. --bench 로 파일당 시간 확인).
+    file_rows 에 dict를 넘기면 {파일 경로: 행 수}를 채워준다.
+    """
+    file_rows = file_rows if file_rows is not None else {}
+    if not files:
+        return pd.DataFrame(columns=TIDY_COLUMNS)
+
+    workers = min(workers or 1, len(files))
+    frames = []
+    start = time.perf_counter()
+
+    if workers <= 1:
+        results = (_parse_timed(f, mode, use_cache) for f in files)
+        for name, tidy, elapsed in results:
+            print(f"   ✅ {Path(name).name}: {len(tidy):,}행, {elapsed:.2f}s")
+            file_rows[name] = len(tidy)
+            frames.append(tidy)
+    else:
+        # spawn: 스레드에서 호출돼도(00_setup_database 파이프라인) fork 로 잠긴 락을 물려받지 않도록
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = {pool.submit(_parse_timed, f, mode, use_cache): f for f in files}
+            for fut in as_completed(futures):
+                name, tidy, elapsed = fut.result()
+                print(f"   ✅ {Path(name).name}: {len(tidy):,}행, {elapsed:.2f}s")
+                file_rows[name] = len(tidy)
+                frames.append(tidy)
+
+    merged = pd.concat(frames, ignore_index=True)
+    print(
+        f"[INFO] 파싱 완료: {len(files)}개 파일, {len(merged):,}행, "
+        f"{time.perf_counter() - start:.2f}s (workers={workers}, parser={mode})"
     )
-    .dropna(subset=["reg_count"])
-    .rename(columns={"성별": "gender", "연령/시도": "age_group"})
-)
+    return merged
 
-# 타입/공백 정리
-tidy["gender"] = tidy["gender"].astype(str).str.strip()
-tidy["age_group"] = tidy["age_group"].astype(str).str.strip()
-tidy["region"] = tidy["region"].astype(str).str.strip()
-tidy["reg_count"] = tidy["reg_count"].astype("Int64")
 
+def _bench_mode(files: list[Path], mode: str) -> tuple[float, int, int]:
+    """새 프로세스에서 실행: (총 소요초, 최대 RSS(KB), 행 수)"""
+    start = time.perf_counter()
+    rows = sum(len(parse_workbook(f, mode)) for f in files)
+    elapsed = time.perf_counter() - start
+    try:
+        import resource  # Unix 전용
+        max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:  # Windows: psutil 의 최대 작업 집합(peak_wset)
+        import psutil
+        mem = psutil.Process().memory_info()
+        max_rss_kb = getattr(mem, "peak_wset", mem.rss) // 1024
+    return elapsed, max_rss_kb, rows
 
-# reg_month에서 연도와 월 분리
-reg_month = infer_reg_month(filename, ws)
-reg_year = reg_month.year
-reg_month_num = f"{reg_month.month:02d}"
 
-tidy["reg_year"] = reg_year
-tidy["reg_month"] = reg_month_num
-tidy = tidy[["reg_year", "reg_month", "region", "gender", "age_group", "reg_count"]]
+def benchmark(files: list[Path]):
+    """파서 모드별 wall time / peak RSS 비교 (모드마다 새 프로세스에서 측정)"""
+    ctx = multiprocessing.get_context("spawn")
+    print(f"📊 파서 벤치마크: {len(files)}개 파일")
+    for mode in PARSER_MODES:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            elapsed, max_rss_kb, rows = pool.submit(_bench_mode, files, mode).result()
+        print(
+            f"   {mode:>8}: {elapsed:7.2f}s ({elapsed / len(files):.3f}s/파일), "
+            f"peak RSS {max_rss_kb / 1024:7.1f} MB, {rows:,}행"
+        )
+
 
 insert_sql = """
 INSERT INTO vehicle_reg
@@ -134,23 +352,189 @@ ON DUPLICATE KEY UPDATE
     reg_count = VALUES(reg_count)
 """
 
-params = [
-    (
-        row["reg_year"],
-        row["reg_month"],
-        row["region"],
-        row["gender"],
-        row["age_group"],
-        int(row["reg_count"]) if pd.notna(row["reg_count"]) else None,
+
+LOAD_STRATEGIES = ("executemany", "load_data")
+
+STAGE_DDL = """
+CREATE TEMPORARY TABLE IF NOT EXISTS vehicle_reg_stage (
+  reg_year    VARCHAR(10) NOT NULL,
+  reg_month   VARCHAR(10) NOT NULL,
+  region      VARCHAR(20) NOT NULL,
+  gender      VARCHAR(10) NOT NULL,
+  age_group   VARCHAR(20) NOT NULL,
+  reg_count   INT         NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+STAGE_UPSERT_SQL = """
+INSERT INTO vehicle_reg
+    (reg_year, reg_month, region, gender, age_group, reg_count)
+SELECT s.reg_year, s.reg_month, s.region, s.gender, s.age_group, s.reg_count
+FROM vehicle_reg_stage s
+ON DUPLICATE KEY UPDATE
+    reg_count = s.reg_count
+"""
+
+
+def _tidy_params(tidy: pd.DataFrame) -> list[tuple]:
+    """tidy → executemany 파라미터 (행 루프 없이 컬럼 단위로 변환)"""
+    counts = tidy["reg_count"].astype("Int64").astype(object)
+    counts = counts.where(counts.notna(), None)
+    columns = [
+        tidy["reg_year"].astype(str).tolist(),
+        tidy["reg_month"].astype(str).tolist(),
+        tidy["region"].tolist(),
+        tidy["gender"].tolist(),
+        tidy["age_group"].tolist(),
+        [int(c) if c is not None else None for c in counts.tolist()],
+    ]
+    return list(zip(*columns))
+
+
+def _load_executemany(tidy: pd.DataFrame, batch_size: int, conn=None) -> int:
+    """multi-row INSERT ... ON DUPLICATE KEY UPDATE (mysql.connector/pymysql 모두 배치를 한 문장으로 묶음)
+
+    conn 을 넘기면 그 커넥션에서 커밋만 하고 닫지 않음 (00_setup_database 의 공유 Engine 커넥션)
+    """
+    params = _tidy_params(tidy)
+    own_conn = conn is None
+    conn = conn or get_conn()
+    try:
+        with conn.cursor() as cur:
+            for i in range(0, len(params), batch_size):
+                cur.executemany(insert_sql, params[i : i + batch_size])
+        conn.commit()
+    finally:
+        if own_conn:
+            conn.close()
+    return len(params)
+
+
+def _load_data_infile(tidy: pd.DataFrame) -> int:
+    """임시 TSV → LOAD DATA LOCAL INFILE 로 스테이징 테이블 적재 → 한 번의 set-based upsert"""
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8", newline="", delete=False) as f:
+        tidy[TIDY_COLUMNS].to_csv(f, sep="\t", header=False, index=False, na_rep="\\N", lineterminator="\n")
+        tsv_path = Path(f.name)
+
+    conn = get_conn(allow_local_infile=True)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(STAGE_DDL)
+            cur.execute("TRUNCATE TABLE vehicle_reg_stage")
+            cur.execute(
+                f"LOAD DATA LOCAL INFILE '{tsv_path.as_posix()}' INTO TABLE vehicle_reg_stage "
+                "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                "(reg_year, reg_month, region, gender, age_group, reg_count)"
+            )
+            cur.execute(STAGE_UPSERT_SQL)
+            cur.execute("DROP TEMPORARY TABLE IF EXISTS vehicle_reg_stage")
+        conn.commit()
+    finally:
+        conn.close()
+        tsv_path.unlink(missing_ok=True)
+    return len(tidy)
+
+
+def load_tidy(tidy: pd.DataFrame, strategy: str = "executemany", batch_size: int = 5000, conn=None) -> int:
+    """tidy 데이터를 vehicle_reg 에 upsert. 보낸 행 수 반환
+
+    strategy="executemany" : 배치 단위 multi-row INSERT ... ON DUPLICATE KEY UPDATE
+    strategy="load_data"   : TSV + LOAD DATA LOCAL INFILE 스테이징 후 INSERT ... SELECT 한 번
+                             (서버에 local_infile=ON 필요)
+    """
+    if strategy == "executemany":
+        return _load_executemany(tidy, batch_size, conn)
+    if strategy == "load_data":
+        # LOCAL INFILE 은 allow_local_infile 로 연 mysql.connector 커넥션이 필요해 conn 을 쓰지 않음
+        return _load_data_infile(tidy)
+    raise ValueError(f"알 수 없는 적재 방식: {strategy} (가능: {LOAD_STRATEGIES})")
+
+
+def compare_load_strategies(tidy: pd.DataFrame):
+    """적재 방식별 소요시간 비교 (upsert 라 반복 실행해도 결과는 같음)"""
+    print(f"📊 적재 방식 비교: {len(tidy):,}행")
+    for strategy in LOAD_STRATEGIES:
+        start = time.perf_counter()
+        try:
+            load_tidy(tidy, strategy)
+        except Exception as e:
+            print(f"   {strategy:>11}: 실패 ({e})")
+            continue
+        print(f"   {strategy:>11}: {time.perf_counter() - start:.2f}s")
+
+
+def main(argv=None, engine=None):
+    """engine 을 넘기면(00_setup_database) 적재 이력/적재/롤업 갱신에 그 Engine 의 커넥션 풀을 사용
+
+    생략하면 db_config 의 kmj 접속 정보(mysql.connector 공용 풀)로 적재
+    """
+    parser = argparse.ArgumentParser(description="자동차 등록자료 통계 → vehicle_reg 일괄 적재")
+    parser.add_argument("files", nargs="*", help="적재할 워크북 (생략 시 data/kmj 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본 1: 순차. 큰 파일/openpyxl 파서일 때만 2 이상 권장)")
+    parser.add_argument("--parser", choices=PARSER_MODES, default="stream", help="워크북 파서 모드")
+    parser.add_argument("--load-strategy", choices=LOAD_STRATEGIES, default="executemany", help="DB 적재 방식")
+    parser.add_argument("--compare-load", action="store_true", help="적재 방식별 소요시간 비교")
+    parser.add_argument("--dry-run", action="store_true", help="파싱만 하고 DB에 적재하지 않음")
+    parser.add_argument("--bench", action="store_true", help="파서 모드별 시간/메모리 비교 후 종료")
+    parser.add_argument("--force", action="store_true", help="적재 이력과 관계없이 모든 파일 다시 적재")
+    parser.add_argument("--no-cache", action="store_true", help="파싱 결과 캐시를 쓰지 않고 원본을 다시 파싱")
+    args = parser.parse_args(argv)
+
+    files = [Path(f) for f in args.files] if args.files else discover_workbooks()
+    if not files:
+        raise FileNotFoundError(f"등록자료 통계 파일을 찾을 수 없습니다: {DATA_DIR / FILE_PATTERN}")
+
+    if args.bench:
+        benchmark(files)
+        return None
+
+    # 적재 이력(매니페스트) 기준으로 내용이 바뀐 파일만 처리
+    manifest = None
+    if not args.dry_run:
+        manifest = IngestManifest(MANIFEST_LOADER, engine or get_engine())  # vehicle_reg 와 같은 DB
+        if not args.force:
+            files, skipped = manifest.partition(files)
+            report_skipped(skipped)
+            if not files:
+                print("[SUCCESS] 새로 적재할 파일이 없습니다.")
+                return pd.DataFrame(columns=TIDY_COLUMNS)
+
+    print(f"[START] 등록자료 통계 {len(files)}개 파일 파싱...")
+    file_rows = {}
+    tidy = parse_many(
+        files, workers=args.workers, mode=args.parser, file_rows=file_rows, use_cache=not args.no_cache
     )
-    for _, row in tidy.iterrows()
-]
 
-conn = get_conn()
-try:
-    with conn.cursor() as cur:
-        for i in range(0, len(params), 1000):
-            cur.executemany(insert_sql, params[i : i + 1000])
-    conn.commit()
-finally:
-    conn.close()
+    if args.dry_run:
+        print("[INFO] --dry-run: DB 적재 생략")
+        return tidy
+
+    if args.compare_load:
+        compare_load_strategies(tidy)
+        return tidy
+
+    # Engine 을 받았으면 그 풀에서 DBAPI 커넥션 하나를 빌려 적재와 롤업 갱신에 같이 사용
+    conn = engine.raw_connection() if engine is not None else None
+    try:
+        start = time.perf_counter()
+        sent = load_tidy(tidy, strategy=args.load_strategy, conn=conn)
+        print(
+            f"[SUCCESS] vehicle_reg 적재 완료: {sent:,}행, {time.perf_counter() - start:.2f}s "
+            f"({args.load_strategy})"
+        )
+
+        for name, rows in file_rows.items():
+            manifest.record(name, row_count=rows)
+
+        # 화면에서 조회하는 사전 집계 테이블 갱신
+        start = time.perf_counter()
+        rollup_rows = refresh_rollups(conn)
+        print(f"[SUCCESS] 롤업 갱신: {sum(rollup_rows.values()):,}행, {time.perf_counter() - start:.2f}s")
+    finally:
+        if conn is not None:
+            conn.close()
+    return tidy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+적재 매니페스트 (ingest_manifest 테이블)
+- 적재 스크립트별로 원본 파일의 내용 해시(SHA-256), 행 수, 적재 시각을 기록
+- 다시 실행했을 때 내용이 바뀌지 않은 파일은 건너뛰도록 판단
+
+사용 예)
+    manifest = IngestManifest("service_center")
+    changed, skipped = manifest.partition([CSV_PATH])
+    ... changed 만 적재 ...
+    manifest.record(CSV_PATH, row_count=len(df))
+"""
+
+from datetime import datetime
+from pathlib import Path
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from back.db.conn import get_engine
+from back.utils.paths import file_sha256
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 경로
+ROOT = Path(__file__).resolve().parents[2]
+
+MANIFEST_DDL = """
+CREATE TABLE IF NOT EXISTS ingest_manifest (
+  loader        VARCHAR(50)  NOT NULL COMMENT '적재 스크립트 구분',
+  source_path   VARCHAR(500) NOT NULL COMMENT '원본 파일 경로(프로젝트 루트 기준)',
+  content_hash  CHAR(64)     NOT NULL COMMENT '파일 내용 SHA-256',
+  file_size     BIGINT       NOT NULL,
+  row_count     INT          NULL     COMMENT '적재 행 수',
+  loaded_at     DATETIME     NOT NULL,
+  PRIMARY KEY (loader, source_path)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+
+def source_key(path) -> str:
+    """매니페스트에 저장할 경로: 프로젝트 루트 기준 상대 경로 (다른 PC에서도 동일)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class IngestManifest:
+    """적재 스크립트 하나(loader)의 원본 파일 적재 이력"""
+
+    def __init__(self, loader: str, engine: Engine | None = None):
+        self.loader = loader
+        self.engine = engine or get_engine()
+        self._hashes: dict[str, str] = {}
+        with self.engine.begin() as conn:
+            conn.execute(text(MANIFEST_DDL))
+
+    def content_hash(self, path) -> str:
+        """파일 해시 (한 번 계산한 값은 재사용)"""
+        key = source_key(path)
+        if key not in self._hashes:
+            self._hashes[key] = file_sha256(path)
+        return self._hashes[key]
+
+    def entries(self) -> dict[str, dict]:
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text("""
+                    SELECT source_path, content_hash, file_size, row_count, loaded_at
+                    FROM ingest_manifest
+                    WHERE loader = :loader
+                """),
+                {"loader": self.loader},
+            ).mappings()
+            return {row["source_path"]: dict(row) for row in rows}
+
+    def partition(self, paths) -> tuple[list[Path], list[Path]]:
+        """(새로 적재할 파일, 변경이 없어 건너뛸 파일)로 나눈다"""
+        known = self.entries()
+        changed, skipped = [], []
+        for path in map(Path, paths):
+            entry = known.get(source_key(path))
+            if entry is not None and entry["content_hash"] == self.content_hash(path):
+                skipped.append(path)
+            else:
+                changed.append(path)
+        return changed, skipped
+
+    def is_unchanged(self, path) -> bool:
+        return not self.partition([path])[0]
+
+    def record(self, path, row_count: int | None = None):
+        """적재 완료 기록 (기존 기록은 갱신)"""
+        path = Path(path)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO ingest_manifest
+                        (loader, source_path, content_hash, file_size, row_count, loaded_at)
+                    VALUES (:loader, :source_path, :content_hash, :file_size, :row_count, :loaded_at)
+                    ON DUPLICATE KEY UPDATE
+                        content_hash = VALUES(content_hash),
+                        file_size = VALUES(file_size),
+                        row_count = VALUES(row_count),
+                        loaded_at = VALUES(loaded_at)
+                """),
+                {
+                    "loader": self.loader,
+                    "source_path": source_key(path),
+                    "content_hash": self.content_hash(path),
+                    "file_size": path.stat().st_size,
+                    "row_count": row_count,
+                    "loaded_at": datetime.now(),
+                },
+            )
+
+
+def report_skipped(skipped: list[Path]):
+    """건너뛴 파일 목록 출력"""
+    if not skipped:
+        return
+    print(f"[SKIP] 변경 없는 파일 {len(skipped)}개 건너뜀 (--force 로 강제 적재)")
+    for path in skipped:
+        print(f"   - {source_key(path)}")
@@ -2,158 +2,146 @@
 00_setup_database.py
 DOCHICAR 프로젝트 - 데이터베이스 자동 설정 스크립트
 팀원들이 git pull 후 한 번에 실행할 수 있는 통합 스크립트
+
+- 모든 팀의 적재(정비소, 시군구 등록대수, 등록자료 통계, 다나와 차량/연료)를 한 프로세스에서 실행
+- 단계별 선행 관계만 지키고 서로 무관한 적재는 동시에 실행 (back/db/pipeline.py)
+- SQLAlchemy 단계들은 Engine 하나(커넥션 풀)를 공유, 끝나면 단계별 소요시간/행 수 보고
+
+실행 예)
+    python back/db/ohj/00_setup_database.py
+    python back/db/ohj/00_setup_database.py --force             # 적재 이력과 관계없이 모두 다시 적재
+    python back/db/ohj/00_setup_database.py --only service_center registrations
+    python back/db/ohj/00_setup_database.py --workers 1         # 순차 실행
 """
 
-import subprocess
+import argparse
+import importlib.util
 import sys
+import time
 from pathlib import Path
 import os
 from dotenv import load_dotenv
 
-def run_sql_script(sql_file: Path):
-    """SQL 스크립트 실행"""
-    print(f"🔧 SQL 스크립트 실행: {sql_file.name}")
-    
-    # MySQL 명령어 구성
-    cmd = [
-        "mysql",
-        "-u", "root",  # 또는 적절한 사용자명
-        "-p",  # 비밀번호 입력 요청
-        "-e", f"source {sql_file.absolute()}"
+ROOT = Path(__file__).resolve().parents[3]  # project_1st/ 까지 올라가기
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+
+def _load_script(path: Path):
+    """숫자로 시작하는 스크립트(03_...)는 import 문으로 불러올 수 없어 파일 경로로 로드"""
+    spec = importlib.util.spec_from_file_location(path.stem.lstrip("0123456789_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_steps(force: bool = False):
+    """적재 단계 목록 (단계 함수 안에서 import → import 실패도 해당 단계 실패로 보고)"""
+    from back.db.conn import get_engine
+    from back.db.pipeline import Step, create_tables_from_sql
+
+    engine = get_engine()
+
+    def service_center_schema():
+        return create_tables_from_sql(engine, SCRIPT_DIR / "01_service_center_table.sql")
+
+    def service_center():
+        return _load_script(SCRIPT_DIR / "03_insert_service_centers_data.py").main(force=force, engine=engine)
+
+    def registrations():
+        from back.db.ohj import registration_timeseries
+        return registration_timeseries.main(force=force, engine=engine)
+
+    def vehicle_reg_schema():
+        return create_tables_from_sql(engine, ROOT / "back" / "db" / "kmj" / "db.sql")
+
+    def vehicle_reg():
+        from back.db.kmj import vehicle_registration_overview
+        return vehicle_registration_overview.main(["--force"] if force else [], engine=engine)
+
+    def car_fuel():
+        from back.db.pdy import danawa_db_save
+        return danawa_db_save.main(force=force, engine=engine)
+
+    return [
+        Step("service_center_schema", service_center_schema),
+        Step("service_center", service_center, after=("service_center_schema",)),
+        Step("registrations", registrations),
+        Step("vehicle_reg_schema", vehicle_reg_schema),
+        Step("vehicle_reg", vehicle_reg, after=("vehicle_reg_schema",)),
+        Step("car_fuel", car_fuel),
     ]
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, input="\n")
-        if result.returncode == 0:
-            print(f"✅ {sql_file.name} 실행 완료")
-            return True
-        else:
-            print(f"❌ {sql_file.name} 실행 실패:")
-            print(result.stderr)
-            return False
-    except FileNotFoundError:
-        print("❌ MySQL 클라이언트를 찾을 수 없습니다. MySQL이 설치되어 있는지 확인하세요.")
-        return False
-    except Exception as e:
-        print(f"❌ SQL 실행 중 오류: {e}")
-        return False
 
-def run_python_script(script_file: Path):
-    """Python 스크립트 실행"""
-    print(f"🐍 Python 스크립트 실행: {script_file.name}")
-    
-    try:
-        result = subprocess.run([sys.executable, str(script_file)], 
-                              capture_output=True, text=True, cwd=script_file.parent)
-        if result.returncode == 0:
-            print(f"✅ {script_file.name} 실행 완료")
-            if result.stdout:
-                print(result.stdout)
-            return True
-        else:
-            print(f"❌ {script_file.name} 실행 실패:")
-            print(result.stderr)
-            return False
-    except Exception as e:
-        print(f"❌ Python 스크립트 실행 중 오류: {e}")
-        return False
 
 def check_requirements():
     """필수 요구사항 확인"""
     print("🔍 필수 요구사항 확인 중...")
-    
+
     # 1) .env 파일 확인
-    ROOT = Path(__file__).resolve().parents[3]  # project_1st/ 까지 올라가기
     env_file = ROOT / ".env"
-    
+
     if not env_file.exists():
         print("❌ .env 파일이 없습니다.")
         print("   env.example을 복사하여 .env를 생성하고 DB_URL을 설정하세요.")
         return False
-    
+
     # 2) .env에서 DB_URL 확인
     load_dotenv(env_file)
     db_url = os.getenv("DB_URL")
     if not db_url:
         print("❌ .env 파일에 DB_URL이 설정되지 않았습니다.")
         return False
-    
+
     print(f"✅ .env 파일 확인 완료: {db_url[:20]}...")
-    
-    # 3) CSV 파일 확인
-    csv_file = ROOT / "data" / "ohj" / "auto_repair_standard.csv"
-    if not csv_file.exists():
-        print(f"❌ CSV 파일을 찾을 수 없습니다: {csv_file}")
-        return False
-    
-    print(f"✅ CSV 파일 확인 완료: {csv_file.name}")
-    
+
+    # 원본 데이터 파일은 단계별로 확인 (없으면 해당 단계만 실패)
     return True
 
-def main():
+def main(argv=None):
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="DOCHICAR 데이터베이스 설정 (전체 적재 파이프라인)")
+    parser.add_argument("--force", action="store_true", help="적재 이력과 관계없이 모든 원본 다시 적재")
+    parser.add_argument("--only", nargs="+", metavar="STEP", help="지정한 단계만 실행 (선행 단계는 포함하지 않음)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 단계 수 (1 = 순차)")
+    args = parser.parse_args(argv)
+
     print("🚀 DOCHICAR 데이터베이스 자동 설정 시작")
     print("=" * 50)
-    
+
     # 0) 요구사항 확인
     if not check_requirements():
         print("❌ 필수 요구사항을 만족하지 않습니다. 위의 오류를 해결한 후 다시 실행하세요.")
         return False
-    
-    # 스크립트 파일 경로
-    script_dir = Path(__file__).parent
-    scripts = [
-        ("01_service_center_table.sql", "SQL"),
-        ("02_load_data_sources.py", "Python"),
-        ("03_insert_service_centers_data.py", "Python"),
-    ]
-    
-    # MySQL 클라이언트 확인
-    mysql_available = True
-    try:
-        subprocess.run(["mysql", "--version"], capture_output=True, check=True)
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        mysql_available = False
-        print("⚠️ MySQL 클라이언트를 찾을 수 없습니다. Python 스크립트만 실행합니다.")
-    
-    success_count = 0
-    
-    # 각 스크립트 순차 실행
-    for script_name, script_type in scripts:
-        script_path = script_dir / script_name
-        
-        if not script_path.exists():
-            print(f"⚠️ 스크립트 파일을 찾을 수 없습니다: {script_name}")
-            continue
-        
-        print(f"\n📋 {script_name} 실행 중...")
-        
-        if script_type == "SQL":
-            if mysql_available:
-                success = run_sql_script(script_path)
-            else:
-                print(f"⚠️ {script_name} 건너뜀 (MySQL 클라이언트 없음)")
-                success = True  # 건너뛰기로 처리
-        else:  # Python
-            success = run_python_script(script_path)
-        
-        if success:
-            success_count += 1
-        else:
-            print(f"❌ {script_name} 실행 실패로 중단됩니다.")
-            break
-    
+
+    from back.db.pipeline import OK, print_report, run_pipeline
+
+    steps = build_steps(force=args.force)
+    if args.only:
+        unknown = set(args.only) - {s.name for s in steps}
+        if unknown:
+            parser.error(f"알 수 없는 단계: {', '.join(sorted(unknown))} (가능: {', '.join(s.name for s in steps)})")
+        steps = [s for s in steps if s.name in args.only]
+        for s in steps:
+            s.after = tuple(d for d in s.after if d in args.only)
+
+    start = time.perf_counter()
+    results = run_pipeline(steps, workers=args.workers)
+
     # 결과 요약
     print("\n" + "=" * 50)
     print("📊 실행 결과 요약")
-    print(f"   성공: {success_count}/{len(scripts)}")
-    
-    if success_count == len(scripts):
-        print("🎉 모든 스크립트가 성공적으로 실행되었습니다!")
+    print_report(results, elapsed=time.perf_counter() - start)
+
+    success_count = sum(r.status == OK for r in results)
+    print(f"   성공: {success_count}/{len(results)}")
+    if success_count == len(results):
+        print("🎉 모든 적재가 성공적으로 끝났습니다!")
         print("   이제 streamlit run front/main.py로 애플리케이션을 실행할 수 있습니다.")
         return True
     else:
-        print("❌ 일부 스크립트 실행에 실패했습니다.")
+        print("❌ 일부 적재에 실패했습니다.")
         print("   오류 메시지를 확인하고 문제를 해결한 후 다시 실행하세요.")
         return False
 
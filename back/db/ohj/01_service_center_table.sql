@@ -32,6 +32,7 @@ CREATE TABLE IF NOT EXISTS service_center (
   addr_jibun       VARCHAR(300) NULL     COMMENT '소재지지번주소',
   lat              DECIMAL(10,7) NULL    COMMENT '위도',
   lon              DECIMAL(10,7) NULL    COMMENT '경도',
+  coord_approx     TINYINT      NOT NULL DEFAULT 0 COMMENT '좌표 근사 단계(0 원본, 1 읍면동 평균, 2 시군구 평균, 3 시도 대표 좌표)',
   biz_reg_date     DATE         NULL     COMMENT '사업등록일자',
   area_text        VARCHAR(100) NULL     COMMENT '면적(원문 텍스트 보존)',
   status_code      INT          NULL     COMMENT '영업상태(코드)',
@@ -40,6 +41,8 @@ CREATE TABLE IF NOT EXISTS service_center (
   pause_to         DATE         NULL     COMMENT '휴업종료일자',
   open_time        VARCHAR(10)  NULL     COMMENT '운영시작시각(HH:MM 등 원문 보존)',
   close_time       VARCHAR(10)  NULL     COMMENT '운영종료시각',
+  open_min         SMALLINT     NULL     COMMENT '운영시작(자정 기준 분)',
+  close_min        SMALLINT     NULL     COMMENT '운영종료(자정 기준 분, 익일 종료는 +1440)',
   phone            VARCHAR(30)  NULL     COMMENT '전화번호',
   mgmt_office_name VARCHAR(100) NULL     COMMENT '관리기관명',
   mgmt_office_tel  VARCHAR(30)  NULL     COMMENT '관리기관전화번호',
@@ -48,15 +51,29 @@ CREATE TABLE IF NOT EXISTS service_center (
   provider_name    VARCHAR(100) NULL     COMMENT '제공기관명',
 
   -- 편의 컬럼
-  region_code      VARCHAR(20)  NULL     COMMENT '지역코드(추후 맵핑 시)',
+  sido             VARCHAR(10)  NULL     COMMENT '시도(짧은 이름)',
+  sigungu          VARCHAR(30)  NULL     COMMENT '시군구',
+  region_code      VARCHAR(20)  NULL     COMMENT '지역코드(시도 2자리 행정구역코드)',
+  natural_key      BIGINT       NULL     COMMENT '자연키 해시(업체명+정규화 주소)',
+  row_hash         BIGINT       NULL     COMMENT '행 내용 해시(변경 감지)',
   created_at       DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
   updated_at       DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
   -- 인덱스
+  UNIQUE INDEX uk_natural_key (natural_key),
   INDEX idx_provider_name (provider_name),
   INDEX idx_status (status_code),
   INDEX idx_geo (lat, lon),
-  INDEX idx_name_addr (name_ko, addr_road)
+  INDEX idx_region (sido, sigungu),
+  INDEX idx_region_code (region_code),
+  INDEX idx_name_addr (name_ko, addr_road),
+  -- 검색 결과 키셋 페이지네이션 (ORDER BY name_ko, id)
+  INDEX idx_name_id (name_ko, id),
+  -- 영업시간 범위 검색 (기존 DB는 03 적재 시 자동 추가)
+  INDEX idx_open_close (open_min, close_min),
+  INDEX idx_close_min (close_min),
+  -- 이름/주소 부분 검색용 n-gram 전문 인덱스 (기존 DB는 03 적재 시 자동 추가)
+  FULLTEXT INDEX ft_name_addr (name_ko, addr_road, addr_jibun) WITH PARSER ngram
 );
 
 -- 4) 테이블 생성 확인
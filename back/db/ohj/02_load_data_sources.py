@@ -10,6 +10,17 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
+import sys
+
+ROOT = Path(__file__).resolve().parents[3]  # project_1st/
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.utils.csv_stream import sniff_encoding  # noqa: E402
+from back.utils.frame_cache import cached_frame  # noqa: E402
+
+sys.path.append(str(Path(__file__).resolve().parent))
+from registration_timeseries import parse_registration_csv  # noqa: E402
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -22,16 +33,12 @@ class DataLoader:
         self.data_dir = data_dir
     
     def load_csv(self, filename: str, **kwargs) -> pd.DataFrame:
-        """CSV 파일 로드 (인코딩 폴백 지원)"""
+        """CSV 파일 로드 (앞부분으로 인코딩을 판별해 한 번만 디코딩)"""
         try:
             file_path = self.data_dir / filename
-            # UTF-8로 먼저 시도
-            try:
-                df = pd.read_csv(file_path, encoding="utf-8-sig", **kwargs)
-            except UnicodeDecodeError:
-                # CP949로 폴백
-                df = pd.read_csv(file_path, encoding="cp949", **kwargs)
-            logger.info(f"CSV 파일 로드 완료: {filename}, shape: {df.shape}")
+            encoding = sniff_encoding(file_path)
+            df = pd.read_csv(file_path, encoding=encoding, **kwargs)
+            logger.info(f"CSV 파일 로드 완료: {filename} ({encoding}), shape: {df.shape}")
             return df
         except Exception as e:
             logger.error(f"CSV 파일 로드 실패: {filename}, error: {e}")
@@ -81,7 +88,7 @@ def load_auto_repair_data(data_dir: Path) -> pd.DataFrame:
     json_file = "auto_repair_standard.json"
     
     if (data_dir / csv_file).exists():
-        return loader.load_csv(csv_file)
+        return cached_frame(data_dir / csv_file, lambda: loader.load_csv(csv_file), name="raw")
     elif (data_dir / json_file).exists():
         data = loader.load_json(json_file)
         return pd.DataFrame(data)
@@ -99,20 +106,21 @@ def load_car_registration_data(data_dir: Path) -> pd.DataFrame:
         raise FileNotFoundError("자동차 등록 현황 데이터 파일을 찾을 수 없습니다.")
     
     # CSV 파일 우선 로드
+    # (파싱 결과는 원본 해시 기준으로 data/interim/frame_cache 에 캐시)
+    # CSV는 2줄 헤더 + 따옴표 없는 천 단위 쉼표 형식이라 전용 파서 사용 (long 포맷 반환)
     csv_files = [f for f in registration_files if f.suffix == '.csv']
     if csv_files:
-        return loader.load_csv(csv_files[0].name)
+        return cached_frame(csv_files[0], lambda: parse_registration_csv(csv_files[0]), name="region_monthly")
     
     # Excel 파일 로드
     excel_files = [f for f in registration_files if f.suffix in ['.xlsx', '.xls']]
     if excel_files:
-        return loader.load_excel(excel_files[0].name)
+        return cached_frame(excel_files[0], lambda: loader.load_excel(excel_files[0].name), name="raw")
     
     raise FileNotFoundError("지원하는 형식의 자동차 등록 현황 데이터 파일을 찾을 수 없습니다.")
 
 if __name__ == "__main__":
     # 테스트 실행
-    ROOT = Path(__file__).resolve().parents[3]  # project_1st/
     DATA_DIR = ROOT / "data" / "ohj"
     
     try:
@@ -5,111 +5,199 @@ DOCHICAR 프로젝트 - 정비소 데이터 삽입 스크립트
 """
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import sys
 
 # 0) 경로/환경 설정 - 현재 폴더 구조에 맞게 수정
 ROOT = Path(__file__).resolve().parents[3]        # project_1st/
 DATA_DIR = ROOT / "data" / "ohj"                  # data/ohj/
 CSV_PATH = DATA_DIR / "auto_repair_standard.csv"
 
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.db.manifest import IngestManifest, report_skipped  # noqa: E402
+from back.db.staging import swap_load  # noqa: E402
+from back.utils.csv_stream import read_csv_chunks, sniff_encoding  # noqa: E402
+from back.utils.geocode import build_centroids, centroid_sums, fill_approx_coordinates  # noqa: E402
+from back.utils.hashing import drop_hash_duplicates, hash_columns  # noqa: E402
+from back.db.ohj.clean_service_centers import (  # noqa: E402
+    add_dong_column,
+    add_region_columns,
+    add_row_keys,
+    normalize_opening_hours,
+)
+from back.db.ohj.service_center_schema import (  # noqa: E402
+    backfill_opening_minutes,
+    backfill_regions,
+    ensure_service_center_schema,
+)
+
+MANIFEST_LOADER = "ohj.service_center"
+
 # .env 로드
 load_dotenv(ROOT / ".env")
 DB_URL = os.getenv("DB_URL")
 assert DB_URL, "환경변수 DB_URL이 없습니다 (.env 확인)."
 
-def main():
-    print("[START] 정비소 데이터 삽입 시작...")
-    
-    # 1) CSV 파일 존재 확인
-    if not CSV_PATH.exists():
-        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
-    
-    print(f"[INFO] CSV 파일 경로: {CSV_PATH}")
-    
-    # 2) CSV 로드 (인코딩 폴백)
-    try:
-        df = pd.read_csv(CSV_PATH, encoding="utf-8-sig")
-        print(f"[SUCCESS] CSV 로드 성공 (UTF-8): {df.shape}")
-    except UnicodeDecodeError:
-        df = pd.read_csv(CSV_PATH, encoding="cp949")
-        print(f"[SUCCESS] CSV 로드 성공 (CP949): {df.shape}")
-    
-    # 3) 컬럼 이름 -> DB 스키마 컬럼으로 매핑
-    rename_map = {
-        "자동차정비업체명": "name_ko",
-        "자동차정비업체종류": "type_code",
-        "소재지도로명주소": "addr_road",
-        "소재지지번주소": "addr_jibun",
-        "위도": "lat",
-        "경도": "lon",
-        "사업등록일자": "biz_reg_date",
-        "면적": "area_text",
-        "영업상태": "status_code",
-        "폐업일자": "closed_date",
-        "휴업시작일자": "pause_from",
-        "휴업종료일자": "pause_to",
-        "운영시작시각": "open_time",
-        "운영종료시각": "close_time",
-        "전화번호": "phone",
-        "관리기관명": "mgmt_office_name",
-        "관리기관전화번호": "mgmt_office_tel",
-        "데이터기준일자": "data_ref_date",
-        "제공기관코드": "provider_code",
-        "제공기관명": "provider_name",
-    }
-    df = df.rename(columns=rename_map)
-    print(f"[INFO] 컬럼 매핑 완료: {len(rename_map)}개 컬럼")
-    
-    # 4) 타입 보정/정리
+# CSV 컬럼 → DB 스키마 컬럼
+RENAME_MAP = {
+    "자동차정비업체명": "name_ko",
+    "자동차정비업체종류": "type_code",
+    "소재지도로명주소": "addr_road",
+    "소재지지번주소": "addr_jibun",
+    "위도": "lat",
+    "경도": "lon",
+    "사업등록일자": "biz_reg_date",
+    "면적": "area_text",
+    "영업상태": "status_code",
+    "폐업일자": "closed_date",
+    "휴업시작일자": "pause_from",
+    "휴업종료일자": "pause_to",
+    "운영시작시각": "open_time",
+    "운영종료시각": "close_time",
+    "전화번호": "phone",
+    "관리기관명": "mgmt_office_name",
+    "관리기관전화번호": "mgmt_office_tel",
+    "데이터기준일자": "data_ref_date",
+    "제공기관코드": "provider_code",
+    "제공기관명": "provider_name",
+}
+CODE_COLUMNS = ["type_code", "status_code", "provider_code"]
+DATE_COLUMNS = ["biz_reg_date", "closed_date", "pause_from", "pause_to", "data_ref_date"]
+DERIVED_COLUMNS = ["coord_approx", "open_min", "close_min", "sido", "sigungu", "region_code", "natural_key", "row_hash"]
+CHUNK_SIZE = 20000
+
+
+def row_hash_columns(df: pd.DataFrame) -> list[str]:
+    """행 해시 대상: 원본 컬럼 + 근사 좌표 여부 (채운 좌표가 바뀌어도 변경으로 판단)"""
+    return [c for c in RENAME_MAP.values() if c in df.columns] + ["coord_approx"]
+
+
+def clean_chunk(df: pd.DataFrame, stats: dict, seen_keys: set | None = None) -> pd.DataFrame:
+    """CSV 청크 하나 정제 (모든 컬럼을 문자열로 읽은 상태에서 타입 변환)
+
+    seen_keys: 앞 청크에서 나온 자연키 - 청크를 넘나드는 중복도 제거
+    """
+    stats["read"] += len(df)
+    df = df.rename(columns=RENAME_MAP)
+
+    # 타입 보정/정리 (청크마다 타입 추론이 달라지지 않도록 명시적으로 변환)
     for c in ["lat", "lon"]:
         if c in df.columns:
             df[c] = pd.to_numeric(df[c], errors="coerce")
-    
-    for c in ["biz_reg_date", "closed_date", "pause_from", "pause_to", "data_ref_date"]:
+    for c in CODE_COLUMNS:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
+    for c in DATE_COLUMNS:
         if c in df.columns:
             df[c] = pd.to_datetime(df[c], errors="coerce").dt.date
-    
-    # 5) 좌표 유효 범위(대한민국) 필터
-    if {"lat","lon"}.issubset(df.columns):
-        before_count = len(df)
-        df = df[df["lat"].between(33, 39, inclusive="both") & df["lon"].between(124, 132, inclusive="both")]
-        after_count = len(df)
-        print(f"[INFO] 좌표 필터링: {before_count} → {after_count} ({before_count - after_count}개 제거)")
-    
-    # 6) 핵심 결측/중복 제거
+
+    # 운영시각 → 자정 기준 분 (자정 넘김 영업은 종료 +1440)
+    df = normalize_opening_hours(df)
+
+    # 좌표 유효 범위(대한민국) 밖이면 결측 처리 (행은 유지, 나중에 주소 기반 근사 좌표로 채움)
+    if {"lat", "lon"}.issubset(df.columns):
+        valid = df["lat"].between(33, 39, inclusive="both") & df["lon"].between(124, 132, inclusive="both")
+        df.loc[~valid, ["lat", "lon"]] = None
+        stats["coord_missing"] += int((~valid).sum())
+
+    # 핵심 결측 제거 + 자연키(업체명 + 정규화 주소)/행 해시
     before_count = len(df)
-    df = df.dropna(subset=["name_ko"])
-    dup_key = df[["name_ko","addr_road","addr_jibun"]].astype(str).agg("|".join, axis=1)
-    df = df.loc[~dup_key.duplicated()].copy()
-    after_count = len(df)
-    print(f"[INFO] 데이터 정제: {before_count} → {after_count} ({before_count - after_count}개 제거)")
+    df = df.dropna(subset=["name_ko"]).copy()
+    stats["name_removed"] += before_count - len(df)
+
+    # 주소 → 시도/시군구/지역코드 (행정구역 테이블 조회)
+    df = add_region_columns(df)
+    df["coord_approx"] = 0
+    data_columns = [c for c in RENAME_MAP.values() if c in df.columns]
+    df = add_row_keys(df, row_hash_columns(df))
+    df, removed = drop_hash_duplicates(df, "natural_key", seen=seen_keys)
+    stats["dup_removed"] += removed
+    return df[data_columns + DERIVED_COLUMNS]
+
+
+def iter_clean_chunks(path: Path, stats: dict, chunksize: int = CHUNK_SIZE):
+    """CSV를 청크 단위로 읽어 정제된 청크 생성 (인코딩은 앞부분으로 한 번만 판별)
+
+    좌표 없는 행은 모아 두었다가, 모든 청크의 좌표로 읍면동/시군구 중심 좌표를 만든 뒤
+    근사 좌표(coord_approx = 채운 단계)를 채워 마지막 청크로 내보냄 (CSV 는 한 번만 읽음)
+    """
+    encoding = sniff_encoding(path)
+    print(f"[INFO] CSV 인코딩: {encoding}, {chunksize:,}행 단위 스트리밍")
+    seen_keys = set()
+    sums, pending = [], []
+    for chunk in read_csv_chunks(path, chunksize=chunksize, dtype=str, usecols=lambda c: c in RENAME_MAP):
+        df = add_dong_column(clean_chunk(chunk, stats, seen_keys))
+        missing = df["lat"].isna() | df["lon"].isna()
+        sums.append(centroid_sums(df[~missing]))
+        pending.append(df[missing])
+        yield df.loc[~missing].drop(columns=["dong"])
+
+    rest = pd.concat(pending) if pending else pd.DataFrame()
+    if not rest.empty:
+        rest = fill_approx_coordinates(rest, build_centroids(sums))
+        # 채운 좌표가 행 해시에 반영되도록 다시 계산 (중심 좌표가 옮겨지면 변경으로 적재)
+        rest["row_hash"] = hash_columns(rest, row_hash_columns(rest))
+        stats["coord_approx"] += int((rest["coord_approx"] > 0).sum())
+        yield rest.drop(columns=["dong"])
+
+
+def main(force: bool = False, chunksize: int = CHUNK_SIZE, engine=None):
+    print("[START] 정비소 데이터 삽입 시작...")
     
-    # 7) DB 연결 및 적재
-    print("[INFO] 데이터베이스 연결 중...")
-    engine = create_engine(DB_URL)
+    # 1) CSV 파일 존재 확인
+    if not CSV_PATH.exists():
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
     
+    print(f"[INFO] CSV 파일 경로: {CSV_PATH}")
+
+    engine = engine or create_engine(DB_URL)
+
+    # 1-1) 기존 DB에 없는 컬럼/인덱스 보강 (전문 검색 인덱스, 영업시간 분 컬럼 등)
     with engine.begin() as conn:
-        # 기존 데이터 확인
-        existing_count = conn.execute(text("SELECT COUNT(*) FROM service_center")).scalar()
-        print(f"[INFO] 기존 데이터: {existing_count}건")
-        
-        # 데이터 삽입
-        print("[INFO] 데이터 삽입 중...")
-        df.to_sql("service_center", con=conn, if_exists="append", index=False, chunksize=2000, method="multi")
-        
-        # 최종 확인
-        total = conn.execute(text("SELECT COUNT(*) FROM service_center")).scalar()
-        inserted = total - existing_count
-        print(f"[SUCCESS] 삽입 완료!")
-        print(f"   - 새로 삽입: {inserted}건")
-        print(f"   - 전체 데이터: {total}건")
+        added = ensure_service_center_schema(conn)
+        if added:
+            print(f"[INFO] 스키마 보강: {', '.join(added)}")
+        if "open_min" in added:
+            filled = backfill_opening_minutes(conn)
+            print(f"[INFO] 기존 데이터 영업시간(분) 채움: {filled}건")
+        if "sido" in added:
+            filled = backfill_regions(conn)
+            print(f"[INFO] 기존 데이터 시도/시군구 채움: {filled}건")
+
+    # 1-2) 적재 이력 확인: 내용이 같은 CSV는 다시 적재하지 않음 (중복 append 방지)
+    manifest = IngestManifest(MANIFEST_LOADER, engine)
+    if not force and manifest.is_unchanged(CSV_PATH):
+        report_skipped([CSV_PATH])
+        return 0
+    
+    # 2) CSV 청크 읽기 → 정제 → 스테이징 테이블 적재 → 자연키 비교 → 테이블 교체
+    #    (파일 전체를 메모리에 올리지 않고, 재실행해도 중복 없음)
+    stats = {"read": 0, "coord_missing": 0, "coord_approx": 0, "name_removed": 0, "dup_removed": 0}
+    print("[INFO] 데이터베이스 적재 중...")
+    counts = swap_load(engine, "service_center", iter_clean_chunks(CSV_PATH, stats, chunksize))
+    loaded = counts["inserted"] + counts["updated"] + counts["unchanged"]
+
+    print(f"[INFO] CSV {stats['read']:,}행 읽음")
+    print(f"   - 좌표 없음/범위 밖: {stats['coord_missing']}건 (주소 기반 근사 좌표 {stats['coord_approx']}건)")
+    print(f"   - 업체명 결측 제거: {stats['name_removed']}건")
+    print(f"   - 자연키 중복 제거: {stats['dup_removed'] + counts['duplicates']}건")
+    print(f"[SUCCESS] 적재 완료! (전체 {loaded:,}건)")
+    print(f"   - 신규: {counts['inserted']}건")
+    print(f"   - 변경: {counts['updated']}건")
+    print(f"   - 변경 없음: {counts['unchanged']}건")
+    print(f"   - 삭제(원본에서 사라짐): {counts['deleted']}건")
+
+    manifest.record(CSV_PATH, row_count=loaded)
+    return loaded
 
 if __name__ == "__main__":
     try:
-        main()
+        main(force="--force" in sys.argv[1:])
     except Exception as e:
         print(f"[ERROR] 오류 발생: {e}")
         raise
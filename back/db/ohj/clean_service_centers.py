@@ -8,10 +8,83 @@ import numpy as np
 from typing import Dict, Any
 import logging
 
+from back.utils.geocode import build_centroids, centroid_sums, fill_approx_coordinates
+from back.utils.hashing import drop_hash_duplicates, hash_columns, hash_normalized
+from back.utils.regions import parse_dong, parse_regions
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MINUTES_PER_DAY = 24 * 60
+
+# "09:00", "9:00", "0900", "09:00:00", "9시 30분" 등 → (시, 분)
+_TIME_RE = r'^\s*(\d{1,2})\s*(?:[:시]\s*)?(\d{2})?'
+
+
+def time_to_minutes(values: pd.Series) -> pd.Series:
+    """운영시각 원문 → 자정 기준 분(0~1440). 해석할 수 없으면 결측"""
+    parts = values.astype("string").str.extract(_TIME_RE)
+    hours = pd.to_numeric(parts[0], errors="coerce")
+    minutes = pd.to_numeric(parts[1], errors="coerce").fillna(0)
+    total = hours * 60 + minutes
+    valid = (hours <= 24) & (minutes < 60) & (total <= MINUTES_PER_DAY)
+    return total.where(valid).astype("Int16")
+
+
+def normalize_opening_hours(df: pd.DataFrame, open_col: str = "open_time", close_col: str = "close_time") -> pd.DataFrame:
+    """open_min / close_min (자정 기준 분) 컬럼 추가
+
+    - 자정을 넘겨 영업하면 (종료 <= 시작) 종료에 1440 을 더해 close_min > open_min 을 항상 유지
+      예) 22:00 ~ 06:00 → 1320 ~ 1800, 00:00 ~ 00:00 → 0 ~ 1440 (24시간)
+    - 시각 T(분) 에 영업 중 = (open_min <= T < close_min) 또는 (close_min > T + 1440)
+      → 두 조건 모두 컬럼 그대로 비교하는 범위 조건이라 인덱스 사용 가능
+    """
+    open_min = time_to_minutes(df[open_col]) if open_col in df.columns else pd.Series(pd.NA, index=df.index, dtype="Int16")
+    close_min = time_to_minutes(df[close_col]) if close_col in df.columns else pd.Series(pd.NA, index=df.index, dtype="Int16")
+
+    open_min = open_min.mask((open_min >= MINUTES_PER_DAY).fillna(False), 0)  # 24:00 시작 = 00:00
+    overnight = close_min <= open_min
+    close_min = close_min.where(~overnight.fillna(False), close_min + MINUTES_PER_DAY)
+
+    # 한쪽만 있는 시각은 비교할 수 없으므로 둘 다 결측 처리
+    known = open_min.notna() & close_min.notna()
+    df["open_min"] = open_min.where(known).astype("Int16")
+    df["close_min"] = close_min.where(known).astype("Int16")
+    return df
+
+
+def add_region_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """sido / sigungu / region_code 컬럼 추가 (도로명주소, 없으면 지번주소 기준)"""
+    regions = parse_regions(df["addr_road"].fillna(df["addr_jibun"]))
+    df[["sido", "sigungu", "region_code"]] = regions
+    return df
+
+
+def add_dong_column(df: pd.DataFrame) -> pd.DataFrame:
+    """dong(읍면동) 컬럼 추가 - 지번주소 우선 (도로명주소는 괄호 안 참고항목에만 동 이름이 있음)"""
+    df["dong"] = parse_dong(df["addr_jibun"]).fillna(parse_dong(df["addr_road"]))
+    return df
+
+
+def service_center_key(names: pd.Series, addresses: pd.Series) -> pd.Series:
+    """정비소 자연키: 업체명 + 주소를 정규화(공백/구두점 제거, 소문자)한 64비트 해시
+
+    적재 스크립트와 ServiceCenterCleaner 가 같은 키로 중복을 판단하도록 공용으로 사용
+    """
+    return hash_normalized(pd.DataFrame({"name": names, "addr": addresses}), ["name", "addr"])
+
+
+def add_row_keys(df: pd.DataFrame, data_columns) -> pd.DataFrame:
+    """natural_key (업체명 + 정규화 주소) / row_hash (data_columns 내용) 64비트 해시 컬럼 추가
+
+    주소는 도로명주소, 없으면 지번주소 기준
+    """
+    df["natural_key"] = service_center_key(df["name_ko"], df["addr_road"].fillna(df["addr_jibun"]))
+    df["row_hash"] = hash_columns(df, data_columns)
+    return df
+
+
 class ServiceCenterCleaner:
     """정비소 데이터 정제 클래스"""
     
@@ -117,22 +190,46 @@ class ServiceCenterCleaner:
         return df
     
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """중복 제거"""
-        # 업체명과 주소 기준으로 중복 제거
+        """중복 제거 (적재 스크립트와 같은 자연키 해시 기준)"""
+        # 업체명과 정규화 주소 기준으로 중복 제거
         if '업체명' in df.columns and '주소' in df.columns:
-            df = df.drop_duplicates(subset=['업체명', '주소'], keep='first')
+            df['자연키'] = service_center_key(df['업체명'], df['주소'])
+            df, removed = drop_hash_duplicates(df, '자연키')
+            df = df.drop(columns=['자연키'])  # 중복 판단용 임시 컬럼
+            logger.info(f"중복 제거: {removed}건")
         
         return df
     
     def add_region_info(self, df: pd.DataFrame) -> pd.DataFrame:
-        """지역 정보 추가"""
+        """지역 정보 추가 (행정구역 테이블 기반 주소 파서)"""
         if '주소' in df.columns:
-            # 주소에서 시/도 추출
-            df['시도'] = df['주소'].str.extract(r'([가-힣]+(?:시|도))')
-            df['구군'] = df['주소'].str.extract(r'([가-힣]+(?:구|군|시))')
+            regions = parse_regions(df['주소'])
+            df['시도'] = regions['sido']
+            df['구군'] = regions['sigungu']
+            df['지역코드'] = regions['region_code']
         
         return df
 
+    def fill_missing_coordinates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """좌표 없는 정비소에 같은 읍면동/시군구 정비소들의 평균 좌표(없으면 시도 대표 좌표) 채움"""
+        if not {'위도', '경도', '시도', '구군', '주소'}.issubset(df.columns):
+            return df
+
+        located = pd.DataFrame({
+            'sido': df['시도'],
+            'sigungu': df['구군'],
+            'dong': parse_dong(df['주소']),
+            'lat': df['위도'],
+            'lon': df['경도'],
+        }, index=df.index)
+        located = fill_approx_coordinates(located, build_centroids([centroid_sums(located)]))
+        df['위도'] = located['lat']
+        df['경도'] = located['lon']
+        df['좌표근사'] = located['coord_approx']
+        logger.info(f"근사 좌표 채움: {int((located['coord_approx'] > 0).sum())}건")
+
+        return df
+
 def clean_auto_repair_data(df: pd.DataFrame) -> pd.DataFrame:
     """자동차 정비소 데이터 정제 함수"""
     cleaner = ServiceCenterCleaner()
@@ -142,5 +239,8 @@ def clean_auto_repair_data(df: pd.DataFrame) -> pd.DataFrame:
     
     # 지역 정보 추가
     df_cleaned = cleaner.add_region_info(df_cleaned)
+
+    # 좌표 결측 → 지역 중심 좌표(근사)
+    df_cleaned = cleaner.fill_missing_coordinates(df_cleaned)
     
     return df_cleaned
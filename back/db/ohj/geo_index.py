@@ -0,0 +1,156 @@
+"""
+정비소 좌표 공간 인덱스 (격자 버킷)
+- 위경도를 cell_deg 크기의 격자 칸으로 나눠 칸별로 점을 묶어 둠 (데이터 버전당 한 번 생성)
+- 반경 검색: 원을 덮는 칸들만 후보로 모아 하버사인 거리를 NumPy 로 한 번에 계산
+- 최근접 N개: 한 칸 크기 반경에서 시작해 두 배씩 넓혀가며 N개가 확정될 때까지 탐색
+전국 데이터도 전체 행을 훑지 않고 수 ms 안에 결과 반환
+
+사용 예)
+    index = GridIndex(df["id"], df["lat"], df["lon"])
+    ids, dist_km = index.within(37.5665, 126.9780, radius_km=3)
+    ids, dist_km = index.nearest(37.5665, 126.9780, n=10)
+    clusters = cluster_points(df["lat"], df["lon"], zoom=8)   # 지도 마커용 격자 클러스터
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = 111.32
+
+
+def haversine_km(lat, lon, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """기준점 (lat, lon) 에서 배열 좌표들까지 거리(km)"""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class GridIndex:
+    """고정 크기 격자 버킷 공간 인덱스"""
+
+    def __init__(self, ids, lats, lons, cell_deg: float = 0.05):
+        ids = np.asarray(ids)
+        lats = np.asarray(lats, dtype="float64")
+        lons = np.asarray(lons, dtype="float64")
+        valid = ~(np.isnan(lats) | np.isnan(lons))
+
+        self.cell_deg = cell_deg
+        self.ids = ids[valid]
+        self.lats = lats[valid]
+        self.lons = lons[valid]
+
+        # 칸 번호 (행, 열) → 칸 키로 정렬해 칸별 연속 구간으로 저장
+        rows = np.floor(self.lats / cell_deg).astype(np.int64)
+        cols = np.floor(self.lons / cell_deg).astype(np.int64)
+        order = np.lexsort((cols, rows))
+        self.ids, self.lats, self.lons = self.ids[order], self.lats[order], self.lons[order]
+        rows, cols = rows[order], cols[order]
+
+        keys = np.stack([rows, cols], axis=1)
+        uniq, starts, counts = np.unique(keys, axis=0, return_index=True, return_counts=True)
+        self._cells = {
+            (int(r), int(c)): (int(s), int(s + n)) for (r, c), s, n in zip(uniq, starts, counts)
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _cell_of(self, lat, lon) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def _candidates(self, row_range, col_range) -> np.ndarray:
+        slices = [
+            np.arange(*self._cells[(r, c)])
+            for r in range(row_range[0], row_range[1] + 1)
+            for c in range(col_range[0], col_range[1] + 1)
+            if (r, c) in self._cells
+        ]
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(slices)
+
+    def _span(self, lat, radius_km) -> tuple[int, int]:
+        """반경을 덮는 (행, 열) 칸 수"""
+        dlat = radius_km / KM_PER_DEG_LAT
+        dlon = radius_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        return math.ceil(dlat / self.cell_deg), math.ceil(dlon / self.cell_deg)
+
+    def within(self, lat: float, lon: float, radius_km: float, limit: int | None = None):
+        """반경 radius_km 안의 점 (ids, 거리 km) - 가까운 순"""
+        r0, c0 = self._cell_of(lat, lon)
+        dr, dc = self._span(lat, radius_km)
+        idx = self._candidates((r0 - dr, r0 + dr), (c0 - dc, c0 + dc))
+        if idx.size == 0:
+            return self.ids[:0], np.empty(0)
+
+        dist = haversine_km(lat, lon, self.lats[idx], self.lons[idx])
+        mask = dist <= radius_km
+        idx, dist = idx[mask], dist[mask]
+        order = np.argsort(dist, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return self.ids[idx[order]], dist[order]
+
+    def nearest(self, lat: float, lon: float, n: int = 10, max_radius_km: float = 500.0):
+        """가장 가까운 n개 (ids, 거리 km)"""
+        if len(self) == 0:
+            return self.ids[:0], np.empty(0)
+
+        # 한 칸 크기(가장 짧은 변) 만큼씩 반경을 넓혀가며 탐색
+        step_km = self.cell_deg * KM_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6)
+        radius = step_km
+        while True:
+            ids, dist = self.within(lat, lon, radius, limit=n)
+            # n개를 찾았거나 (반경 안에 있으니 확정) 더 넓힐 수 없으면 종료
+            if len(ids) >= n or radius >= max_radius_km or len(ids) == len(self):
+                return ids, dist
+            radius = min(radius * 2, max_radius_km)
+
+
+def cell_deg_for_zoom(zoom: int, cells_per_tile: int = 8) -> float:
+    """지도 줌 레벨 → 클러스터 격자 크기(도). 타일 한 변(360/2^zoom 도)을 cells_per_tile 칸으로 나눔"""
+    return 360.0 / (2 ** zoom) / cells_per_tile
+
+
+def cluster_points(lats, lons, zoom: int, max_clusters: int = 500) -> pd.DataFrame:
+    """좌표를 줌 레벨에 맞는 격자로 묶어 클러스터(칸별 중심/개수/범위) 반환
+
+    칸 수가 max_clusters 를 넘으면 격자를 두 배씩 키워 브라우저로 보내는 마커 수를 제한
+    """
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+    lats, lons = lats[valid], lons[valid]
+    columns = ["latitude", "longitude", "count", "lat_min", "lat_max", "lon_min", "lon_max"]
+    if lats.size == 0:
+        return pd.DataFrame(columns=columns)
+
+    cell = cell_deg_for_zoom(zoom)
+    while True:
+        # (행, 열) 칸 번호를 int64 하나로 묶어 1차원 정렬/그룹화
+        rows = np.floor(lats / cell).astype(np.int64)
+        cols = np.floor(lons / cell).astype(np.int64)
+        keys = (rows << 32) | (cols & 0xFFFFFFFF)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        if len(starts) <= max_clusters:
+            break
+        cell *= 2
+
+    lats, lons = lats[order], lons[order]
+    counts = np.diff(np.r_[starts, len(lats)])
+    clusters = pd.DataFrame({
+        "latitude": np.add.reduceat(lats, starts) / counts,
+        "longitude": np.add.reduceat(lons, starts) / counts,
+        "count": counts,
+        "lat_min": np.minimum.reduceat(lats, starts),
+        "lat_max": np.maximum.reduceat(lats, starts),
+        "lon_min": np.minimum.reduceat(lons, starts),
+        "lon_max": np.maximum.reduceat(lons, starts),
+    })
+    return clusters.sort_values("count", ascending=False, ignore_index=True)
@@ -0,0 +1,255 @@
+"""
+registration_timeseries.py
+DOCHICAR 프로젝트 - 시도/시군구별 자동차 등록대수 시계열 로더
+원본: data/ohj/자동차등록현황보고_자동차등록대수현황 시도별 (YYYYMM ~ YYYYMM).csv
+
+원본 CSV의 특징
+- cp949 인코딩, 2줄 헤더 (1행: 차종 승용/승합/화물/특수/총계, 2행: 용도 관용/자가용/영업용/계)
+- 숫자의 천 단위 쉼표가 따옴표 없이 들어 있어 한 숫자가 여러 컬럼으로 쪼개짐
+  예) "159,218,484,13,640,232,283" → 159 / 218,484 / 13,640 / 232,283
+  → 각 차종의 '계' = 관용+자가용+영업용, '총계' = 차종 합 이라는 제약으로 원래 숫자를 복원
+
+결과는 (reg_ym, sido, sigungu, vehicle_class, use_type, reg_count) long 포맷
+(합계 행/열은 검증에만 쓰고 저장하지 않음 - 필요하면 SUM 으로 계산)
+"""
+
+from pathlib import Path
+import csv
+import logging
+import re
+import sys
+import time
+
+import pandas as pd
+from sqlalchemy import text
+
+ROOT = Path(__file__).resolve().parents[3]  # project_1st/
+DATA_DIR = ROOT / "data" / "ohj"
+FILE_PATTERN = "*자동차등록대수현황*.csv"
+
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.db.conn import get_engine  # noqa: E402
+from back.db.manifest import IngestManifest, report_skipped  # noqa: E402
+from back.utils.csv_stream import sniff_encoding  # noqa: E402
+from back.utils.frame_cache import cached_frame  # noqa: E402
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ID_COLUMNS = 3  # 월, 시도명, 시군구
+TOTAL_CLASS = "총계"
+TOTAL_USE = "계"
+TABLE = "vehicle_reg_region_monthly"
+MANIFEST_LOADER = "ohj.vehicle_reg_region_monthly"
+
+TABLE_DDL = f"""
+CREATE TABLE IF NOT EXISTS {TABLE} (
+  reg_ym         DATE        NOT NULL COMMENT '기준월(1일)',
+  sido           VARCHAR(20) NOT NULL COMMENT '시도명',
+  sigungu        VARCHAR(30) NOT NULL COMMENT '시군구',
+  vehicle_class  VARCHAR(10) NOT NULL COMMENT '차종(승용/승합/화물/특수)',
+  use_type       VARCHAR(10) NOT NULL COMMENT '용도(관용/자가용/영업용)',
+  reg_count      INT         NOT NULL COMMENT '등록대수',
+  PRIMARY KEY (reg_ym, sido, sigungu, vehicle_class, use_type),
+  KEY idx_vrrm_sido_ym (sido, reg_ym),
+  KEY idx_vrrm_class_ym (vehicle_class, reg_ym)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+COLUMNS = ["reg_ym", "sido", "sigungu", "vehicle_class", "use_type", "reg_count"]
+
+_LEAD_RE = re.compile(r"^(0|[1-9]\d{0,2})$")  # 쉼표로 쪼개진 숫자의 첫 조각
+_GROUP_RE = re.compile(r"^\d{3}$")  # 이어지는 3자리 조각
+_PLAIN_RE = re.compile(r"^\d+$")
+
+
+class AmbiguousRowError(ValueError):
+    """쪼개진 숫자를 합계 제약으로 복원할 수 없는 행"""
+
+
+def build_header(row1: list[str], row2: list[str]) -> list[tuple[str, str]]:
+    """2줄 헤더 → 값 컬럼별 (차종, 용도)"""
+    header = []
+    current = None
+    for cls, use in zip(row1[ID_COLUMNS:], row2[ID_COLUMNS:]):
+        current = cls.strip() or current  # 병합 셀 대비
+        header.append((current, use.strip()))
+    return header
+
+
+def _constraints(header: list[tuple[str, str]]) -> dict[int, list[int]]:
+    """검증 제약: {합계 컬럼 위치: 더해야 할 컬럼 위치 목록}
+
+    각 제약은 해당 합계 컬럼까지 값이 정해지면 바로 확인할 수 있어 백트래킹 가지치기에 사용
+    """
+    constraints = {}
+    for i, (cls, use) in enumerate(header):
+        if cls == TOTAL_CLASS:
+            parts = [j for j, (c, u) in enumerate(header) if c != TOTAL_CLASS and u == use]
+        elif use == TOTAL_USE:
+            parts = [j for j, (c, u) in enumerate(header) if c == cls and u != TOTAL_USE]
+        else:
+            continue
+        if parts and max(parts) < i:
+            constraints[i] = parts
+    return constraints
+
+
+def split_numbers(tokens: list[str], n_values: int, constraints: dict[int, list[int]]) -> list[int]:
+    """쉼표로 쪼개진 숫자 조각들을 n_values 개의 숫자로 복원 (합계 제약을 만족하는 해)"""
+    tokens = [t.strip() for t in tokens]
+    solutions = []
+    values = []
+
+    def candidates(i):
+        tok = tokens[i]
+        if tok in ("-", ""):
+            yield 0, i + 1
+            return
+        if _PLAIN_RE.match(tok):
+            yield int(tok), i + 1  # 쉼표 없는 숫자
+        if not _LEAD_RE.match(tok):
+            return
+        digits = tok
+        j = i + 1
+        while j < len(tokens) and _GROUP_RE.match(tokens[j]):
+            digits += tokens[j]
+            j += 1
+            yield int(digits), j
+
+    def search(i):
+        if len(solutions) > 1:
+            return
+        k = len(values)
+        if k == n_values:
+            if i == len(tokens):
+                solutions.append(list(values))
+            return
+        # 남은 조각 수가 남은 값 수보다 적으면 불가능
+        if len(tokens) - i < n_values - k:
+            return
+        for value, nxt in candidates(i):
+            parts = constraints.get(k)
+            if parts is not None and sum(values[p] for p in parts) != value:
+                continue
+            values.append(value)
+            search(nxt)
+            values.pop()
+
+    search(0)
+    if not solutions:
+        raise AmbiguousRowError(f"숫자 복원 실패: {','.join(tokens)}")
+    if len(solutions) > 1:
+        logger.warning(f"복원 결과가 여러 개라 첫 번째를 사용합니다: {','.join(tokens)}")
+    return solutions[0]
+
+
+def iter_rows(path):
+    """CSV를 한 줄씩 읽어 long 레코드 (reg_ym, sido, sigungu, vehicle_class, use_type, reg_count) 생성"""
+    encoding = sniff_encoding(path)
+    with open(path, "r", encoding=encoding, newline="") as f:
+        reader = csv.reader(f)
+        row1, row2 = next(reader), next(reader)
+        header = build_header(row1, row2)
+        constraints = _constraints(header)
+        keep = [
+            (i, cls, use)
+            for i, (cls, use) in enumerate(header)
+            if cls != TOTAL_CLASS and use != TOTAL_USE
+        ]
+
+        for line_no, row in enumerate(reader, start=3):
+            if len(row) <= ID_COLUMNS or not row[0].strip():
+                continue
+            ym, sido, sigungu = (c.strip() for c in row[:ID_COLUMNS])
+            if sigungu == TOTAL_USE:  # 시도 소계 행
+                continue
+
+            # 따옴표로 묶인 숫자("159,218")는 그대로 하나의 값
+            tokens = []
+            for cell in row[ID_COLUMNS:]:
+                if "," in cell:
+                    cell = cell.replace(",", "")
+                tokens.append(cell)
+
+            try:
+                values = split_numbers(tokens, len(header), constraints)
+            except AmbiguousRowError as e:
+                logger.warning(f"{Path(path).name}:{line_no} 건너뜀 - {e}")
+                continue
+
+            reg_ym = pd.Timestamp(ym + "-01") if len(ym) == 7 else pd.Timestamp(ym)
+            for i, cls, use in keep:
+                yield (reg_ym, sido, sigungu, cls, use, values[i])
+
+
+def parse_registration_csv(path) -> pd.DataFrame:
+    """시도/시군구별 등록대수 CSV → 타입이 지정된 long DataFrame"""
+    df = pd.DataFrame.from_records(iter_rows(path), columns=COLUMNS)
+    df["reg_ym"] = pd.to_datetime(df["reg_ym"])
+    for c in ("sido", "sigungu", "vehicle_class", "use_type"):
+        df[c] = df[c].astype("category")
+    df["reg_count"] = df["reg_count"].astype("int64")
+    return df
+
+
+def discover_files(data_dir: Path = DATA_DIR) -> list[Path]:
+    return sorted(data_dir.glob(FILE_PATTERN))
+
+
+def load_registration_timeseries(df: pd.DataFrame, engine=None) -> int:
+    """스테이징 테이블 경유 upsert (같은 월을 다시 적재해도 중복 없음)"""
+    engine = engine or get_engine()
+    stage = f"{TABLE}_stage"
+    out = df.copy()
+    out["reg_ym"] = out["reg_ym"].dt.date
+    for c in ("sido", "sigungu", "vehicle_class", "use_type"):
+        out[c] = out[c].astype(str)
+
+    with engine.begin() as conn:
+        conn.execute(text(TABLE_DDL))
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+        conn.execute(text(f"CREATE TABLE {stage} LIKE {TABLE}"))
+        out.to_sql(stage, con=conn, if_exists="append", index=False, chunksize=5000, method="multi")
+        conn.execute(text(f"""
+            INSERT INTO {TABLE} ({", ".join(COLUMNS)})
+            SELECT {", ".join(COLUMNS)} FROM {stage}
+            ON DUPLICATE KEY UPDATE reg_count = VALUES(reg_count)
+        """))
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+    return len(out)
+
+
+def main(force: bool = False, engine=None):
+    print("[START] 시군구별 등록대수 시계열 적재...")
+    files = discover_files()
+    if not files:
+        raise FileNotFoundError(f"등록대수 CSV를 찾을 수 없습니다: {DATA_DIR / FILE_PATTERN}")
+
+    engine = engine or get_engine()
+    manifest = IngestManifest(MANIFEST_LOADER, engine)
+    if not force:
+        files, skipped = manifest.partition(files)
+        report_skipped(skipped)
+
+    total = 0
+    for path in files:
+        start = time.perf_counter()
+        df = cached_frame(path, lambda: parse_registration_csv(path), name="region_monthly")
+        rows = load_registration_timeseries(df, engine)
+        manifest.record(path, row_count=rows)
+        total += rows
+        months = df["reg_ym"].nunique()
+        print(f"[SUCCESS] {path.name}: {months}개월, {rows:,}행, {time.perf_counter() - start:.2f}s")
+    return total
+
+
+if __name__ == "__main__":
+    try:
+        main(force="--force" in sys.argv[1:])
+    except Exception as e:
+        print(f"[ERROR] 오류 발생: {e}")
+        raise
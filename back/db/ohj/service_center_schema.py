@@ -0,0 +1,106 @@
+"""
+service_center 테이블 보강 스키마
+- 01_service_center_table.sql 로 이미 만들어진 DB에도 같은 컬럼/인덱스가 생기도록
+  03_insert_service_centers_data.py 적재 시 ensure_service_center_schema() 호출
+- 화면(04_Service_Centers.py)은 인덱스 이름으로 존재 여부를 확인해 검색 방식을 고름
+"""
+
+import pandas as pd
+from sqlalchemy import text
+
+from back.db.ohj.clean_service_centers import add_region_columns, normalize_opening_hours
+from back.db.schema import ensure_column, ensure_index, has_index
+
+TABLE = "service_center"
+
+# 이름/주소 n-gram 전문 검색 인덱스 (MySQL ngram 파서, 기본 ngram_token_size=2)
+FULLTEXT_INDEX = "ft_name_addr"
+FULLTEXT_COLUMNS = ("name_ko", "addr_road", "addr_jibun")
+
+# (컬럼명, 정의) - 테이블에 없으면 추가
+EXTRA_COLUMNS = [
+    ("coord_approx", "TINYINT NOT NULL DEFAULT 0 COMMENT '좌표 근사 단계(0 원본, 1 읍면동 평균, 2 시군구 평균, 3 시도 대표 좌표)' AFTER lon"),
+    ("open_min", "SMALLINT NULL COMMENT '운영시작(자정 기준 분)' AFTER close_time"),
+    ("close_min", "SMALLINT NULL COMMENT '운영종료(자정 기준 분, 익일 종료는 +1440)' AFTER open_min"),
+    ("sido", "VARCHAR(10) NULL COMMENT '시도(짧은 이름)' AFTER provider_name"),
+    ("sigungu", "VARCHAR(30) NULL COMMENT '시군구' AFTER sido"),
+    ("natural_key", "BIGINT NULL COMMENT '자연키 해시(업체명+정규화 주소)' AFTER region_code"),
+    ("row_hash", "BIGINT NULL COMMENT '행 내용 해시(변경 감지)' AFTER natural_key"),
+]
+
+# (인덱스명, 정의) - 테이블에 없으면 생성
+EXTRA_INDEXES = [
+    (FULLTEXT_INDEX, f"FULLTEXT INDEX {FULLTEXT_INDEX} ({', '.join(FULLTEXT_COLUMNS)}) WITH PARSER ngram"),
+    ("idx_open_close", "INDEX idx_open_close (open_min, close_min)"),
+    ("idx_close_min", "INDEX idx_close_min (close_min)"),
+    ("idx_name_id", "INDEX idx_name_id (name_ko, id)"),
+    ("uk_natural_key", "UNIQUE INDEX uk_natural_key (natural_key)"),
+    ("idx_region", "INDEX idx_region (sido, sigungu)"),
+    ("idx_region_code", "INDEX idx_region_code (region_code)"),
+]
+
+
+def ensure_service_center_schema(conn) -> list[str]:
+    """부족한 컬럼/인덱스 추가. 새로 만든 항목 이름 목록 반환"""
+    added = []
+    for column, definition in EXTRA_COLUMNS:
+        if ensure_column(conn, TABLE, column, definition):
+            added.append(column)
+    for index_name, definition in EXTRA_INDEXES:
+        if ensure_index(conn, TABLE, index_name, definition):
+            added.append(index_name)
+    return added
+
+
+def backfill_opening_minutes(conn) -> int:
+    """open_min/close_min 이 비어 있는 기존 행을 open_time/close_time 원문으로 채움. 갱신 행 수 반환"""
+    df = pd.read_sql(text(f"""
+        SELECT id, open_time, close_time FROM {TABLE}
+        WHERE open_min IS NULL AND open_time IS NOT NULL AND close_time IS NOT NULL
+    """), conn)
+    df = normalize_opening_hours(df).dropna(subset=["open_min"])
+    if df.empty:
+        return 0
+    conn.execute(
+        text(f"UPDATE {TABLE} SET open_min = :open_min, close_min = :close_min WHERE id = :id"),
+        [
+            {"id": int(i), "open_min": int(o), "close_min": int(c)}
+            for i, o, c in zip(df["id"], df["open_min"], df["close_min"])
+        ],
+    )
+    return len(df)
+
+
+def backfill_regions(conn) -> int:
+    """sido 가 비어 있는 기존 행을 주소로 채움. 갱신 행 수 반환"""
+    df = pd.read_sql(text(f"""
+        SELECT id, addr_road, addr_jibun FROM {TABLE}
+        WHERE sido IS NULL AND (addr_road IS NOT NULL OR addr_jibun IS NOT NULL)
+    """), conn)
+    df = add_region_columns(df).dropna(subset=["sido"])
+    if df.empty:
+        return 0
+    conn.execute(
+        text(f"UPDATE {TABLE} SET sido = :sido, sigungu = :sigungu, region_code = :region_code WHERE id = :id"),
+        [
+            {"id": int(i), "sido": s, "sigungu": None if pd.isna(g) else g, "region_code": c}
+            for i, s, g, c in zip(df["id"], df["sido"], df["sigungu"], df["region_code"])
+        ],
+    )
+    return len(df)
+
+
+def open_at_condition(param: str = "t_min") -> str:
+    """시각 :param(자정 기준 분)에 영업 중인 조건 (인덱스 범위 검색 가능한 형태)
+
+    - 당일 영업: open_min <= T < close_min
+    - 전날 밤 시작해 자정을 넘긴 영업: close_min > T + 1440
+    """
+    return f"""
+        ((open_min <= :{param} AND close_min > :{param})
+         OR close_min > :{param} + {24 * 60})
+    """
+
+
+def has_fulltext_index(conn) -> bool:
+    return has_index(conn, TABLE, FULLTEXT_INDEX)
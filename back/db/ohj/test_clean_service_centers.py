@@ -0,0 +1,79 @@
+"""clean_service_centers.py 테스트: 운영시간 정규화 (open_min / close_min), 자연키 중복 제거"""
+
+import pandas as pd
+import pytest
+
+from back.db.ohj.clean_service_centers import (
+    MINUTES_PER_DAY,
+    ServiceCenterCleaner,
+    normalize_opening_hours,
+    time_to_minutes,
+)
+
+
+def _normalize(open_times, close_times) -> pd.DataFrame:
+    df = pd.DataFrame({"open_time": open_times, "close_time": close_times}, dtype="string")
+    return normalize_opening_hours(df)
+
+
+def _is_open(row, t: int) -> bool:
+    """service_center_schema.open_at_condition 과 같은 조건"""
+    return (row.open_min <= t < row.close_min) or row.close_min > t + MINUTES_PER_DAY
+
+
+@pytest.mark.parametrize("raw, minutes", [
+    ("09:00", 540),
+    ("9:30", 570),
+    ("0930", 570),
+    ("18:00:00", 1080),
+    ("9시 30분", 570),
+    ("24:00", 1440),
+])
+def test_time_to_minutes(raw, minutes):
+    assert time_to_minutes(pd.Series([raw]))[0] == minutes
+
+
+@pytest.mark.parametrize("raw", ["", "연중무휴", "25:00", "12:75", None])
+def test_time_to_minutes_invalid(raw):
+    assert pd.isna(time_to_minutes(pd.Series([raw], dtype="string"))[0])
+
+
+def test_same_day_hours():
+    row = _normalize(["09:00"], ["18:00"]).iloc[0]
+    assert (row.open_min, row.close_min) == (540, 1080)
+
+
+def test_overnight_hours_wrap_past_midnight():
+    row = _normalize(["22:00"], ["06:00"]).iloc[0]
+    assert (row.open_min, row.close_min) == (1320, 1800)
+    assert _is_open(row, 23 * 60)  # 당일 밤
+    assert _is_open(row, 3 * 60)  # 다음날 새벽
+    assert not _is_open(row, 12 * 60)
+
+
+def test_all_day_hours():
+    for open_time, close_time in [("00:00", "00:00"), ("00:00", "24:00"), ("24:00", "24:00")]:
+        row = _normalize([open_time], [close_time]).iloc[0]
+        assert (row.open_min, row.close_min) == (0, MINUTES_PER_DAY)
+        assert all(_is_open(row, t) for t in (0, 720, 1439))
+
+
+def test_one_sided_hours_are_missing():
+    df = _normalize(["09:00", None], [None, "18:00"])
+    assert df["open_min"].isna().all() and df["close_min"].isna().all()
+    assert str(df["open_min"].dtype) == "Int16"
+
+
+def test_missing_columns():
+    df = normalize_opening_hours(pd.DataFrame({"name": ["a"]}))
+    assert df["open_min"].isna().all() and df["close_min"].isna().all()
+
+
+def test_cleaner_removes_duplicates_without_helper_column():
+    df = pd.DataFrame({
+        "업체명": ["도치 정비", "도치정비", "다른 정비"],
+        "주소": ["서울특별시 강남구 역삼동 1", "서울특별시  강남구 역삼동 1", "서울특별시 강남구 역삼동 1"],
+    })
+    out = ServiceCenterCleaner()._remove_duplicates(df)
+    assert out["업체명"].tolist() == ["도치 정비", "다른 정비"]
+    assert list(out.columns) == ["업체명", "주소"]
@@ -0,0 +1,102 @@
+"""geo_index.py 테스트: 격자 인덱스 검색 결과가 전체 거리 계산(브루트포스)과 같은지, 지도 클러스터 집계 확인"""
+
+import numpy as np
+import pytest
+
+from back.db.ohj.geo_index import GridIndex, cell_deg_for_zoom, cluster_points, haversine_km
+
+SEOUL = (37.5665, 126.9780)
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(0)
+    n = 2000
+    lats = rng.uniform(33.0, 38.6, n)
+    lons = rng.uniform(124.6, 131.0, n)
+    lats[:3] = np.nan  # 좌표 없는 행은 인덱스에서 제외
+    return np.arange(n), lats, lons
+
+
+def _brute(points, lat, lon):
+    ids, lats, lons = points
+    valid = ~np.isnan(lats)
+    dist = haversine_km(lat, lon, lats[valid], lons[valid])
+    order = np.argsort(dist, kind="stable")
+    return ids[valid][order], dist[order]
+
+
+def test_haversine_known_distance():
+    # 서울시청 ↔ 부산시청 약 325km
+    dist = haversine_km(*SEOUL, np.array([35.1796]), np.array([129.0756]))
+    assert dist[0] == pytest.approx(325, abs=5)
+
+
+def test_skips_missing_coordinates(points):
+    assert len(GridIndex(*points)) == len(points[0]) - 3
+
+
+@pytest.mark.parametrize("radius_km", [0.5, 5, 30, 120])
+def test_within_matches_brute_force(points, radius_km):
+    index = GridIndex(*points)
+    ids, dist = index.within(*SEOUL, radius_km=radius_km)
+    brute_ids, brute_dist = _brute(points, *SEOUL)
+    mask = brute_dist <= radius_km
+    assert ids.tolist() == brute_ids[mask].tolist()
+    assert np.all(np.diff(dist) >= 0)
+
+
+@pytest.mark.parametrize("n", [1, 10, 50])
+def test_nearest_matches_brute_force(points, n):
+    index = GridIndex(*points, cell_deg=0.02)
+    ids, dist = index.nearest(35.0, 128.0, n=n)
+    brute_ids, brute_dist = _brute(points, 35.0, 128.0)
+    assert ids.tolist() == brute_ids[:n].tolist()
+    np.testing.assert_allclose(dist, brute_dist[:n])
+
+
+def test_nearest_returns_all_when_fewer_points():
+    index = GridIndex([1, 2], [37.0, 37.1], [127.0, 127.1])
+    ids, _ = index.nearest(37.0, 127.0, n=10)
+    assert ids.tolist() == [1, 2]
+
+
+def test_empty_index():
+    index = GridIndex([], [], [])
+    ids, dist = index.within(*SEOUL, radius_km=10)
+    assert len(ids) == 0 and len(dist) == 0
+    assert len(index.nearest(*SEOUL)[0]) == 0
+
+
+def test_cluster_points_preserves_counts(points):
+    _, lats, lons = points
+    clusters = cluster_points(lats, lons, zoom=10)
+    assert clusters["count"].sum() == np.count_nonzero(~np.isnan(lats))
+    assert clusters["count"].is_monotonic_decreasing
+    # 클러스터 중심은 칸 안 점들의 범위 안에 있음
+    assert (clusters["latitude"] >= clusters["lat_min"]).all()
+    assert (clusters["latitude"] <= clusters["lat_max"]).all()
+    assert (clusters["longitude"] >= clusters["lon_min"]).all()
+    assert (clusters["longitude"] <= clusters["lon_max"]).all()
+
+
+def test_cluster_points_limits_marker_count(points):
+    _, lats, lons = points
+    assert len(cluster_points(lats, lons, zoom=14)) > 100
+    assert len(cluster_points(lats, lons, zoom=14, max_clusters=100)) <= 100
+
+
+def test_cluster_points_groups_same_cell():
+    clusters = cluster_points([37.50001, 37.50002, 35.1], [127.00001, 127.00002, 129.0], zoom=8)
+    assert clusters["count"].tolist() == [2, 1]
+    assert clusters.loc[0, "latitude"] == pytest.approx(37.500015)
+
+
+def test_cell_deg_for_zoom():
+    assert cell_deg_for_zoom(0, cells_per_tile=1) == 360.0
+    assert cell_deg_for_zoom(3) == cell_deg_for_zoom(2) / 2
+
+
+def test_cluster_points_empty():
+    clusters = cluster_points([np.nan], [np.nan], zoom=8)
+    assert clusters.empty and "count" in clusters.columns
@@ -0,0 +1,69 @@
+"""registration_timeseries.py 테스트: 쉼표로 쪼개진 숫자 복원 (split_numbers) 과 CSV 파싱"""
+
+import pytest
+
+from back.db.ohj.registration_timeseries import (
+    AmbiguousRowError,
+    _constraints,
+    build_header,
+    parse_registration_csv,
+    split_numbers,
+)
+
+ROW1 = ["월", "시도명", "시군구", "승용", "", "", "승합", "", "", "총계", "", ""]
+ROW2 = ["", "", "", "관용", "자가용", "계", "관용", "자가용", "계", "관용", "자가용", "계"]
+# 승용 1,200 / 218,484 / 219,684, 승합 5 / 13,640 / 13,645, 총계 1,205 / 232,124 / 233,329
+VALUES = [1200, 218484, 219684, 5, 13640, 13645, 1205, 232124, 233329]
+TOKENS = "1,200,218,484,219,684,5,13,640,13,645,1,205,232,124,233,329".split(",")
+
+
+@pytest.fixture
+def header():
+    return build_header(ROW1, ROW2)
+
+
+def test_build_header_fills_merged_cells(header):
+    assert header[:3] == [("승용", "관용"), ("승용", "자가용"), ("승용", "계")]
+    assert header[-1] == ("총계", "계")
+
+
+def test_constraints(header):
+    constraints = _constraints(header)
+    assert constraints[2] == [0, 1]  # 승용 계 = 관용 + 자가용
+    assert constraints[6] == [0, 3]  # 총계 관용 = 승용 관용 + 승합 관용
+    assert 0 not in constraints
+
+
+def test_split_numbers_restores_thousands(header):
+    assert split_numbers(TOKENS, len(header), _constraints(header)) == VALUES
+
+
+def test_split_numbers_plain_and_dash(header):
+    tokens = ["-", "7", "7", "3", "", "3", "3", "7", "10"]
+    assert split_numbers(tokens, len(header), _constraints(header)) == [0, 7, 7, 3, 0, 3, 3, 7, 10]
+
+
+def test_split_numbers_rejects_inconsistent_row(header):
+    tokens = TOKENS[:-1] + ["330"]  # 총계 계가 맞지 않음
+    with pytest.raises(AmbiguousRowError):
+        split_numbers(tokens, len(header), _constraints(header))
+
+
+def test_parse_registration_csv(tmp_path, header):
+    lines = [
+        ",".join(ROW1),
+        ",".join(ROW2),
+        "2024-01,서울,강남구," + ",".join(TOKENS),
+        "2024-01,서울,계," + ",".join(TOKENS),  # 시도 소계 행은 건너뜀
+        '2024-02,서울,강남구,"1,200",218484,"219,684",5,"13,640","13,645","1,205","232,124","233,329"',
+    ]
+    path = tmp_path / "자동차등록대수현황.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="cp949")
+
+    df = parse_registration_csv(path)
+    # 합계 행/열은 저장하지 않음: 2개월 x (승용, 승합) x (관용, 자가용)
+    assert len(df) == 8
+    jan = df[df["reg_ym"] == "2024-01-01"].set_index(["vehicle_class", "use_type"])["reg_count"]
+    assert jan[("승용", "자가용")] == 218484
+    assert jan[("승합", "자가용")] == 13640
+    assert df.groupby("reg_ym")["reg_count"].sum().tolist() == [233329, 233329]
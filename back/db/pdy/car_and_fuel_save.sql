@@ -1,6 +1,7 @@
 use dochicar;
 
-CREATE TABLE car (
+-- 모델명 기준 upsert (danawa_db_save.py). 기존 DB는 적재 시 중복 정리 후 유니크 키 자동 추가
+CREATE TABLE IF NOT EXISTS car (
 	car_id INT auto_increment primary key,
 	comp_name VARCHAR(30),
     model_name VARCHAR(100),
@@ -12,11 +13,23 @@ CREATE TABLE car (
     resrc_amount varchar(30),
     efficiency_type varchar(20),
     efficiency_amount varchar(30),
-    wait_period varchar(100)
+    wait_period varchar(100),
+    UNIQUE KEY uk_car_model (model_name)
     );
 
-CREATE TABLE fuel(
+CREATE TABLE IF NOT EXISTS fuel(
 	fuel_id INT auto_increment primary key,
 	model_name varchar(100),
-    fuel_type varchar(30)
+    fuel_type varchar(30),
+    UNIQUE KEY uk_fuel_model_type (model_name, fuel_type)
 );
+
+-- 가격/대기기간 변경 이력 (값이 바뀐 적재에서만 한 줄 추가)
+CREATE TABLE IF NOT EXISTS car_price_history (
+  id           BIGINT AUTO_INCREMENT PRIMARY KEY,
+  model_name   VARCHAR(100) NOT NULL COMMENT '모델명 (car.model_name)',
+  model_price  INT          NULL     COMMENT '가격(만원)',
+  wait_period  VARCHAR(100) NULL     COMMENT '대기기간',
+  observed_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '변경이 확인된 적재 시각',
+  KEY idx_cph_model_time (model_name, observed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
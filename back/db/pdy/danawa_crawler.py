@@ -0,0 +1,393 @@
+"""
+다나와 자동차 목록 페이지 동시 수집기
+- 여러 목록 페이지를 asyncio 로 동시에 가져옴
+  · 동시 요청 수 제한(concurrency), 초당 요청 수 제한(rate), 실패/429/5xx 재시도(지수 백오프)
+- 전송 계층(Transport)은 교체 가능: httpx 비동기 클라이언트(기본), 없으면 표준 라이브러리 urllib
+- 저장된 페이지를 로컬 HTTP 서버로 띄우는 fixture 서버 포함 → 네트워크 없이 테스트/벤치마크
+- 응답은 디스크 캐시(back/utils/http_cache.py)에 ETag/Last-Modified 와 함께 저장하고 다음 수집 때 조건부 요청
+  → 304 면 본문을 다시 받지 않고, 내용이 바뀐 페이지 파일만 다시 씀
+- 수집한 페이지는 data/pdy/danawa_cars_html_{N}page.html 로 저장 (danawa_crawling.py 가 파싱,
+  파싱 결과는 파일 내용 해시로 캐시되어 바뀌지 않은 페이지는 다시 파싱하지 않음)
+
+실행 예)
+    python back/db/pdy/danawa_crawler.py --pages 1-10 --concurrency 4 --rate 2
+    python back/db/pdy/danawa_crawler.py --fixture data/pdy --pages 1-3          # 저장된 페이지로 오프라인 수집
+    python back/db/pdy/danawa_crawler.py --fixture data/pdy --bench --delay 0.2  # 동시 요청 수별 처리량 비교
+    python back/db/pdy/danawa_crawler.py --pages 1-10 --no-cache                 # 캐시 없이 전부 다시 수집
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Protocol
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlparse
+from urllib.request import Request, urlopen
+import argparse
+import asyncio
+import hashlib
+import logging
+import random
+import sys
+import threading
+import time
+
+try:
+    import httpx  # 선택적 의존성: 비동기 HTTP 클라이언트
+except ImportError:
+    httpx = None
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.utils.http_cache import HttpCache, content_hash  # noqa: E402
+
+DATA_DIR = ROOT / "data" / "pdy"
+PAGE_FILE = "danawa_cars_html_{page}page.html"
+
+# 목록 URL 템플릿 ({page} 자리에 페이지 번호) - --url 로 변경 가능
+LIST_URL = "https://auto.danawa.com/newcar/?Work=list&Page={page}"
+USER_AGENT = "Mozilla/5.0 (compatible; dochicar-crawler)"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# CachingTransport 가 304 에 저장된 본문을 돌려줄 때 응답 헤더에 붙이는 표시 (내려받은 양 집계에서 제외)
+FROM_CACHE_HEADER = "x-dochicar-from-cache"
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Transport(Protocol):
+    """url (+ 요청 헤더) → (상태 코드, 본문, 응답 헤더). 연결 오류는 예외"""
+    async def get(self, url: str, headers: dict | None = None) -> tuple[int, str, dict]: ...
+    async def close(self) -> None: ...
+
+
+class HttpxTransport:
+    """httpx.AsyncClient 기반 (연결 재사용, 이벤트 루프에서 직접 동작)"""
+
+    def __init__(self, timeout: float = 10.0, max_connections: int = 10):
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=max_connections),
+            follow_redirects=True,
+        )
+
+    async def get(self, url: str, headers: dict | None = None) -> tuple[int, str, dict]:
+        response = await self.client.get(url, headers=headers)
+        return response.status_code, response.text, dict(response.headers)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class UrllibTransport:
+    """표준 라이브러리 urllib 기반 (요청마다 스레드에서 실행) - httpx 가 없을 때 사용"""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+
+    def _get(self, url: str, headers: dict | None = None) -> tuple[int, str, dict]:
+        request = Request(url, headers={"User-Agent": USER_AGENT, **(headers or {})})
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                charset = response.headers.get_content_charset() or "utf-8"
+                return response.status, response.read().decode(charset, errors="replace"), dict(response.headers)
+        except HTTPError as e:  # 304 도 HTTPError 로 올라옴
+            return e.code, "", dict(e.headers or {})
+
+    async def get(self, url: str, headers: dict | None = None) -> tuple[int, str, dict]:
+        return await asyncio.to_thread(self._get, url, headers)
+
+    async def close(self) -> None:
+        pass
+
+
+def default_transport(concurrency: int = 4) -> Transport:
+    return HttpxTransport(max_connections=concurrency) if httpx is not None else UrllibTransport()
+
+
+class CachingTransport:
+    """다른 Transport 를 감싸 HttpCache 로 조건부 요청 (304 면 저장된 본문을 200 으로 돌려줌)"""
+
+    def __init__(self, inner: Transport, cache: HttpCache):
+        self.inner = inner
+        self.cache = cache
+        self.not_modified = 0
+
+    async def get(self, url: str, headers: dict | None = None) -> tuple[int, str, dict]:
+        request_headers = {**self.cache.conditional_headers(url), **(headers or {})}
+        status, body, response_headers = await self.inner.get(url, request_headers)
+        if status == 304 and self.cache.lookup(url):
+            self.not_modified += 1
+            self.cache.touch(url)
+            return 200, self.cache.body(url), {**response_headers, FROM_CACHE_HEADER: "1"}
+        if status == 200:
+            self.cache.store(url, body, response_headers)
+        return status, body, response_headers
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+
+class RateLimiter:
+    """초당 rate 회 이하로 요청 시작 간격을 벌림 (rate 가 None/0 이면 제한 없음)"""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class CrawlStats:
+    pages: int = 0
+    failed: int = 0
+    retries: int = 0
+    not_modified: int = 0
+    changed: int = 0
+    bytes: int = 0  # 실제로 내려받은 본문 크기 (304 로 재사용한 캐시 본문 제외)
+    seconds: float = 0.0
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+async def _fetch(url, transport, semaphore, limiter, stats, retries, backoff) -> str | None:
+    """url 한 건 수집 (재시도 포함). 끝내 실패하면 None"""
+    for attempt in range(retries + 1):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                status, body, headers = await transport.get(url)
+                error = None if status not in RETRY_STATUS else f"HTTP {status}"
+            except Exception as e:
+                status, body, headers, error = None, "", {}, f"{type(e).__name__}: {e}"
+
+        if error is None:
+            if status != 200:
+                logger.warning(f"{url}: HTTP {status} (재시도 안 함)")
+                return None
+            if FROM_CACHE_HEADER not in headers:
+                stats.bytes += len(body.encode("utf-8"))
+            return body
+        if attempt < retries:
+            stats.retries += 1
+            await asyncio.sleep(backoff * 2 ** attempt * (1 + random.random() / 2))
+        else:
+            logger.warning(f"{url}: {error} - {retries}회 재시도 후 실패")
+    return None
+
+
+async def crawl(
+    urls: list[str],
+    transport: Transport | None = None,
+    concurrency: int = 4,
+    rate: float | None = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> tuple[dict[str, str], CrawlStats]:
+    """urls 를 동시에 수집. ({url: html}, 통계) 반환 - 실패한 url 은 결과에서 빠짐"""
+    own_transport = transport is None
+    transport = transport or default_transport(concurrency)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(rate)
+    stats = CrawlStats()
+
+    start = time.perf_counter()
+    try:
+        bodies = await asyncio.gather(
+            *(_fetch(url, transport, semaphore, limiter, stats, retries, backoff) for url in urls)
+        )
+    finally:
+        if own_transport:
+            await transport.close()
+    stats.seconds = time.perf_counter() - start
+
+    pages = {url: body for url, body in zip(urls, bodies) if body is not None}
+    stats.pages = len(pages)
+    stats.failed = len(urls) - len(pages)
+    return pages, stats
+
+
+def page_urls(pages: list[int], url_template: str = LIST_URL) -> dict[int, str]:
+    return {page: url_template.format(page=page) for page in pages}
+
+
+def _file_hash(path: Path) -> str | None:
+    return content_hash(path.read_text(encoding="utf-8")) if path.exists() else None
+
+
+def crawl_pages(
+    pages: list[int],
+    url_template: str = LIST_URL,
+    out_dir: Path = DATA_DIR,
+    cache: HttpCache | None = None,
+    concurrency: int = 4,
+    **options,
+) -> tuple[list[Path], CrawlStats]:
+    """목록 페이지들을 수집해 out_dir 에 저장. (수집한 파일 목록, 통계)
+
+    cache 를 넘기면 조건부 요청으로 바뀌지 않은 페이지는 본문을 다시 받지 않음
+    파일은 내용이 달라진 페이지만 다시 씀 (stats.changed)
+    """
+    urls = page_urls(pages, url_template)
+    transport = default_transport(concurrency)
+    if cache is not None:
+        transport = CachingTransport(transport, cache)
+
+    async def run():
+        try:
+            return await crawl(list(urls.values()), transport=transport, concurrency=concurrency, **options)
+        finally:
+            await transport.close()
+
+    bodies, stats = asyncio.run(run())
+    if cache is not None:
+        stats.not_modified = transport.not_modified
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    saved = []
+    for page, url in urls.items():
+        if url not in bodies:
+            continue
+        path = out_dir / PAGE_FILE.format(page=page)
+        if _file_hash(path) != content_hash(bodies[url]):
+            path.write_text(bodies[url], encoding="utf-8")
+            stats.changed += 1
+        saved.append(path)
+    return saved, stats
+
+
+# ---------------------------------------------------------------- fixture 서버
+
+@contextmanager
+def serve_fixtures(directory: Path = DATA_DIR, delay: float = 0.0, fail_every: int = 0, port: int = 0):
+    """저장된 목록 페이지를 /list?page=N 으로 제공하는 로컬 HTTP 서버. URL 템플릿을 돌려줌
+
+    delay: 응답 지연(초, 실제 서버 지연 흉내), fail_every: N 번째 요청마다 503 (재시도 확인용)
+    port: 0 이면 빈 포트 자동 선택 (HTTP 캐시는 URL 기준이므로 재검증을 확인하려면 고정 포트 사용)
+    """
+    directory = Path(directory)
+    counter = {"requests": 0}
+    lock = threading.Lock()
+
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                counter["requests"] += 1
+                n = counter["requests"]
+            if delay:
+                time.sleep(delay)
+            if fail_every and n % fail_every == 0:
+                self.send_error(503)
+                return
+            page = parse_qs(urlparse(self.path).query).get("page", ["1"])[0]
+            path = directory / PAGE_FILE.format(page=page)
+            if not path.exists():
+                self.send_error(404)
+                return
+            body = path.read_bytes()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(path.stat().st_mtime, usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/list?page={{page}}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _parse_page_range(text: str) -> list[int]:
+    """'1-5,8' → [1, 2, 3, 4, 5, 8]"""
+    pages = []
+    for part in text.split(","):
+        lo, _, hi = part.partition("-")
+        pages.extend(range(int(lo), int(hi or lo) + 1))
+    return pages
+
+
+def _report(stats: CrawlStats, label: str = "") -> None:
+    print(
+        f"[INFO] {label}수집 {stats.pages}페이지 (실패 {stats.failed}, 재시도 {stats.retries}, "
+        f"304 {stats.not_modified}, 변경 {stats.changed}), "
+        f"{stats.bytes / 1024:,.0f}KB, {stats.seconds:.2f}s, {stats.pages_per_sec:.1f}페이지/s"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="다나와 자동차 목록 페이지 동시 수집")
+    parser.add_argument("--pages", default="1", help="수집할 페이지 (예: 1-10 또는 1,3,5)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--rate", type=float, default=2.0, help="초당 최대 요청 수 (0 = 제한 없음)")
+    parser.add_argument("--retries", type=int, default=3, help="실패 시 재시도 횟수")
+    parser.add_argument("--url", default=LIST_URL, help="목록 URL 템플릿 ({page} 자리에 페이지 번호)")
+    parser.add_argument("--out", type=Path, default=DATA_DIR, help="수집한 페이지 저장 폴더")
+    parser.add_argument("--fixture", type=Path, help="저장된 페이지 폴더를 로컬 서버로 띄워 오프라인 수집")
+    parser.add_argument("--delay", type=float, default=0.0, help="fixture 서버 응답 지연(초)")
+    parser.add_argument("--port", type=int, default=8765, help="fixture 서버 포트 (고정해야 HTTP 캐시 재검증)")
+    parser.add_argument("--bench", action="store_true", help="동시 요청 수 1/2/4/8 처리량 비교 (저장 안 함)")
+    parser.add_argument("--no-cache", action="store_true", help="HTTP 캐시 없이 모든 페이지 다시 수집")
+    args = parser.parse_args(argv)
+
+    pages = _parse_page_range(args.pages)
+    options = dict(
+        concurrency=args.concurrency,
+        rate=args.rate or None,
+        retries=args.retries,
+        cache=None if args.no_cache else HttpCache(),
+    )
+
+    if args.fixture is None:
+        saved, stats = crawl_pages(pages, args.url, args.out, **options)
+        _report(stats)
+        print(f"[SUCCESS] {len(saved)}페이지 저장: {args.out}")
+        return saved
+
+    with serve_fixtures(args.fixture, delay=args.delay, port=args.port) as url_template:
+        if args.bench:
+            urls = list(page_urls(pages, url_template).values())
+            for concurrency in (1, 2, 4, 8):
+                _, stats = asyncio.run(crawl(urls, concurrency=concurrency, retries=args.retries))
+                _report(stats, label=f"concurrency={concurrency}: ")
+            return None
+        saved, stats = crawl_pages(pages, url_template, args.out, **options)
+    _report(stats, label="(fixture) ")
+    print(f"[SUCCESS] {len(saved)}페이지 저장: {args.out}")
+    return saved
+
+
+if __name__ == "__main__":
+    main()
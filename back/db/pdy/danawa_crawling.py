@@ -1,140 +1,195 @@
-# 정적 웹페이지 크롤링
+"""
+정적 웹페이지 크롤링: 다나와 자동차 목록 페이지(저장된 HTML) → car / fuel 엑셀
+- 상품 카드(모델 이미지 링크 a.image 와 상세 정보 div.detail_middle 을 함께 감싼 요소)를 한 번씩만 훑어
+  모델명/이미지/제조사/스펙/가격을 같은 카드에서 함께 추출
+  (페이지 전체의 a.image / div.detail_middle / <strong> 을 따로 모아 순서로 맞추면
+   카드 밖의 <strong> 하나에도 가격이 밀리므로)
+- 파서 백엔드는 lxml (없으면 html.parser)
+- 여러 페이지를 한 번에 처리하고 페이지별 처리 시간/카드 수 출력
+- 페이지별 파싱 결과는 파일 내용 해시로 캐시 (back/utils/frame_cache.py)
+  → 다시 수집해도 내용이 같은 페이지는 파싱하지 않음
+
+실행 예)
+    python back/db/pdy/danawa_crawling.py                          # data/pdy/danawa_cars_html_*page.html
+    python back/db/pdy/danawa_crawling.py page1.html page2.html
+"""
+
+from pathlib import Path
+import argparse
+import re
+import time
 
-import requests
 from bs4 import BeautifulSoup
-from datetime import datetime #현재 시간 가져올 수 있는 모듈
-from urllib.request import urlretrieve #url로 다운로드 할 수 있는 모듈
 import pandas as pd
+import sys
 
+try:
+    import lxml  # noqa: F401  선택적 의존성: 가장 빠른 BeautifulSoup 백엔드
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
 
-# 3. beautifulsoup 객체 생성
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
 
-with open("danawa_cars_html_1page.html", "r", encoding="utf-8") as f:
-    html1 = f.read()
+from back.utils.frame_cache import cached_frame  # noqa: E402
 
-# 2. 다나와 1페이지 BeautifulSoup 객체 생성
-danawa_bs1 = BeautifulSoup(html1, "html.parser")
+DATA_DIR = ROOT / "data" / "pdy"
+PAGE_PATTERN = "danawa_cars_html_*page.html"
+CAR_XLSX = DATA_DIR / "danawa_car_data1.xlsx"
+FUEL_XLSX = DATA_DIR / "DANAWA_car_fuel_data1.xlsx"
 
+CAR_COLUMNS = [
+    "comp_name", "model_name", "img_url", "launch_date", "model_type", "model_price",
+    "resrc_type", "resrc_amount", "efficiency_type", "efficiency_amount", "wait_period",
+]
 
-# ------------------------차 모델명, 차 이미지 url 저장
+_PRICE_RE = re.compile(r"^\d{1,3}(,\d{3})*$|^\d+$")
 
-car_name_image = danawa_bs1.select('a.image')
 
-name_image_info = []
+def _card_of(anchor):
+    """a.image 에서 위로 올라가며 div.detail_middle 을 함께 가진 가장 가까운 요소(상품 카드)
 
-for ni in car_name_image:
-    img = ni.find('img')
-    if img and img.has_attr('src') and img.has_attr('alt'):
-        name_image_info.append({
-            '이미지url': img['src'],
-            '모델명': img['alt']
-        })
+    처음 만난 요소에 detail_middle 이 여러 개면 카드 밖(배너 등)의 이미지 링크이므로 None
+    """
+    for parent in anchor.parents:
+        details = parent.select("div.detail_middle", limit=2)
+        if details:
+            return parent if len(details) == 1 else None
+    return None
 
-# for info in name_image_info:
-#     print(info)
 
+def _price_of(card):
+    """카드 안의 가격 <strong> (천 단위 쉼표 숫자만). 없으면 None"""
+    for strong in card.find_all("strong"):
+        value = strong.get_text(strip=True)
+        if _PRICE_RE.match(value):
+            return int(value.replace(",", ""))
+    return None
 
-# -------------- .detail_middle에서 뽑을 것들 저장
-car_detail = danawa_bs1.select('div.detail_middle')
 
-spec_info = []
-
-# 2. alt와 spec 스펙 리스트 추출
-for detail in car_detail:
-    # 자손 <img> 태그의 alt 속성 추출
-    img_tag = detail.find('img')
-    alt_value = img_tag['alt'] if img_tag and img_tag.has_attr('alt') else '없음'
-
-    # 자식 <div class="spec"> 내부 <span> 값 추출
-    spec_div = detail.find('div', class_='spec')
-    span_texts = [span.text.strip() for span in spec_div.find_all('span')] if spec_div else []
-
-    # 딕셔너리로 저장
-    spec_info.append({
-        '제조사명': alt_value,
-        'specs': span_texts
-    })
-
-# for spec in spec_info:
-#     print(spec)
-
-# ----------------------- <strong>에서 '가격' 뽑을 것
-car_price = danawa_bs1.select('strong')
-
-price_d= []
-
-for price in car_price:
-    price_d.append(price.text.strip())
-
-price_numbers = [int(price.replace(',', '')) for price in price_d]
-# print(price_numbers)
-
-danawa_car_table1 = []
-danawa_car_en_table1 = []
-
-for i in range(len(name_image_info)):
-    specs = spec_info[i]['specs']
-    launch = specs[0].replace('. 출시', '').strip()
-    
-    fuel = [fu.strip() for fu in specs[2].split(', ')]
-    
-    en_dict = {
-        'model_name': name_image_info[i]['모델명'].strip(),
-        'model_fuel': fuel
-    }
-
-    danawa_car_en_table1.append(en_dict)
-
-    car_dict = {
-        'comp_name':spec_info[i]['제조사명'].strip(),
-        'model_name': name_image_info[i]['모델명'].strip(),
-        'img_url': name_image_info[i]['이미지url'],   # 예: ('기아 쏘렌토', 'https://...'),
-        'launch_date':launch.replace('.','-'),
-        'model_type':specs[1].strip(),
-        #'연료':specs[2].strip(),
-        'model_price': price_numbers[i]
+def parse_specs(specs: list[str]) -> dict:
+    """스펙 문자열 목록 → 출시일/차종/연료/연비/배기량(배터리)/대기기간"""
+    info = {
+        "launch_date": specs[0].replace(". 출시", "").strip().replace(".", "-") if len(specs) > 0 else None,
+        "model_type": specs[1].strip() if len(specs) > 1 else None,
+        "fuels": [fu.strip() for fu in specs[2].split(", ")] if len(specs) > 2 else [],
     }
-
     for spec in specs:
-        if '복합연비' in spec:
-            key, value = spec.split(' ', 1)
-            car_dict['efficiency_type'] = '복합연비'
-            car_dict['efficiency_amount'] = value.strip()
-        elif '복합전비' in spec:
-            car_dict['efficiency_type'] = '복합전비'
-            key, value = spec.split(' ', 1)
-            car_dict['efficiency_amount'] = value.strip()
-           
-        if 'cc' in spec:
-            car_dict['resrc_type']='배기량'
-            car_dict['resrc_amount'] = spec
-        elif '용량' in spec:
-            car_dict['resrc_type']='배터리 용량'
-            car_dict['resrc_amount'] = spec.split('용량')[-1].strip()
-
-        if ':' in spec:
-            key, value = spec.split(':', 1)
-            car_dict['wait_period'] = value.strip()
-
-
-    danawa_car_table1.append(car_dict)
-
-
-df = pd.DataFrame(danawa_car_table1)
-
-# car 테이블 정보 Excel 파일로 저장
-df.to_excel('danawa_car_data1.xlsx', index=False, engine='openpyxl')
-
-rows = []
-for item in danawa_car_en_table1:
-    model = item['model_name']
-    for fuel in item['model_fuel']:
-        rows.append({'model_name': model, 'fuel_type': fuel})
-
-
-df = pd.DataFrame(rows)
-
-# fuel 테이블 정보 엑셀로 저장
-df.to_excel('DANAWA_car_fuel_data1.xlsx', index=False)
-
-        
+        if "복합연비" in spec:
+            info["efficiency_type"] = "복합연비"
+            info["efficiency_amount"] = spec.split(" ", 1)[-1].strip()
+        elif "복합전비" in spec:
+            info["efficiency_type"] = "복합전비"
+            info["efficiency_amount"] = spec.split(" ", 1)[-1].strip()
+
+        if "cc" in spec:
+            info["resrc_type"] = "배기량"
+            info["resrc_amount"] = spec
+        elif "용량" in spec:
+            info["resrc_type"] = "배터리 용량"
+            info["resrc_amount"] = spec.split("용량")[-1].strip()
+
+        if ":" in spec:
+            info["wait_period"] = spec.split(":", 1)[1].strip()
+    return info
+
+
+def parse_listing(html: str) -> list[dict]:
+    """목록 페이지 HTML → 카드별 레코드 (car 컬럼 + fuels 목록)"""
+    soup = BeautifulSoup(html, PARSER)
+    records = []
+    seen = set()
+    for anchor in soup.select("a.image"):
+        img = anchor.find("img")
+        if not (img and img.has_attr("src") and img.has_attr("alt")):
+            continue
+        card = _card_of(anchor)
+        if card is None or id(card) in seen:
+            continue
+        seen.add(id(card))
+
+        detail = card.select_one("div.detail_middle")
+        maker = detail.find("img")
+        spec_div = detail.find("div", class_="spec")
+        specs = [span.get_text(strip=True) for span in spec_div.find_all("span")] if spec_div else []
+
+        record = {
+            "comp_name": maker["alt"].strip() if maker and maker.has_attr("alt") else "없음",
+            "model_name": img["alt"].strip(),
+            "img_url": img["src"],
+            "model_price": _price_of(card),
+        }
+        record.update(parse_specs(specs))
+        records.append(record)
+    return records
+
+
+def parse_page(path: Path, use_cache: bool = True) -> tuple[pd.DataFrame, bool]:
+    """목록 페이지 파일 하나 → 카드 DataFrame. (결과, 실제로 파싱했는지)"""
+    parsed = []
+
+    def parse():
+        parsed.append(True)
+        return pd.DataFrame(parse_listing(Path(path).read_text(encoding="utf-8")), columns=CAR_COLUMNS + ["fuels"])
+
+    if not use_cache:
+        return parse(), True
+    return cached_frame(path, parse, name="danawa_listing"), bool(parsed)
+
+
+def parse_pages(paths: list[Path], use_cache: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """저장된 목록 페이지들 → (car, fuel) DataFrame. 페이지별 처리 시간/카드 수 출력"""
+    frames = []
+    reparsed = 0
+    start = time.perf_counter()
+    for path in paths:
+        page_start = time.perf_counter()
+        page, was_parsed = parse_page(path, use_cache)
+        frames.append(page)
+        reparsed += was_parsed
+        note = "" if was_parsed else " (캐시)"
+        print(f"   ✅ {Path(path).name}: {len(page)}대, {(time.perf_counter() - page_start) * 1000:.1f}ms{note}")
+
+    elapsed = time.perf_counter() - start
+    if paths:
+        print(
+            f"[INFO] 파싱 완료: {len(paths)}페이지 (새로 파싱 {reparsed}), {sum(map(len, frames))}대, "
+            f"{elapsed:.2f}s ({len(paths) / elapsed:.1f}페이지/s, parser={PARSER})"
+        )
+
+    car = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=CAR_COLUMNS + ["fuels"])
+    fuel = car[["model_name", "fuels"]].explode("fuels").dropna().rename(columns={"fuels": "fuel_type"})
+    return car[CAR_COLUMNS], fuel.reset_index(drop=True)
+
+
+def discover_pages(data_dir: Path = DATA_DIR) -> list[Path]:
+    """data/pdy 의 저장된 목록 페이지 (페이지 번호순)"""
+    def page_no(path: Path) -> int:
+        match = re.search(r"(\d+)page", path.name)
+        return int(match.group(1)) if match else 0
+    return sorted(data_dir.glob(PAGE_PATTERN), key=page_no)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="다나와 자동차 목록 HTML → car / fuel 엑셀")
+    parser.add_argument("pages", nargs="*", help="저장된 목록 페이지 HTML (생략 시 data/pdy 전체)")
+    parser.add_argument("--no-cache", action="store_true", help="파싱 결과 캐시를 쓰지 않고 모든 페이지 다시 파싱")
+    args = parser.parse_args(argv)
+
+    pages = [Path(p) for p in args.pages] if args.pages else discover_pages()
+    if not pages:
+        raise FileNotFoundError(f"목록 페이지를 찾을 수 없습니다: {DATA_DIR / PAGE_PATTERN}")
+
+    car, fuel = parse_pages(pages, use_cache=not args.no_cache)
+
+    # car / fuel 테이블 정보 Excel 파일로 저장
+    car.to_excel(CAR_XLSX, index=False, engine="openpyxl")
+    fuel.to_excel(FUEL_XLSX, index=False)
+    print(f"[SUCCESS] car {len(car)}건 → {CAR_XLSX.name}, fuel {len(fuel)}건 → {FUEL_XLSX.name}")
+    return car, fuel
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,239 @@
+"""
+다나와 차량/연료 엑셀 → car / fuel / car_price_history 적재
+- car: 모델명(model_name) 기준 upsert (스테이징 테이블 → INSERT ... ON DUPLICATE KEY UPDATE)
+  → 다시 적재해도 모델이 늘어나지 않고 car_id 유지
+- fuel: (모델명, 연료) 기준. 원본에 있는 모델은 연료 목록을 원본과 같게 맞춤 (추가/삭제)
+- car_price_history: 가격(model_price)/대기기간(wait_period)이 모델의 마지막 이력과 달라졌을 때만 한 줄 기록
+  → 모델별 가격 변동을 시간순으로 조회 가능
+- 기존 DB(append 로 중복 적재된 car/fuel)는 처음 실행 때 중복을 정리하고 유니크 키 추가 (가장 작은 id 유지)
+
+사용 예)
+    SELECT observed_at, model_price, wait_period
+    FROM car_price_history WHERE model_name = '기아 쏘렌토' ORDER BY observed_at;
+"""
+
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from dotenv import load_dotenv
 
 load_dotenv()
 import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from back.db.manifest import IngestManifest, report_skipped  # noqa: E402
+from back.db.schema import ensure_index, has_index  # noqa: E402
 
 DB_URL = os.getenv("DB_URL")
 
 if not DB_URL:
     raise ValueError("URL 불러오기에 실패했습니다.")
 
+CAR_XLSX = ROOT / "data" / "pdy" / "danawa_car_data1.xlsx"
+FUEL_XLSX = ROOT / "data" / "pdy" / "DANAWA_car_fuel_data1.xlsx"
+
+MANIFEST_LOADER = "pdy.car_fuel"
+
+CAR_COLUMNS = [
+    "comp_name", "model_name", "img_url", "launch_date", "model_type", "model_price",
+    "resrc_type", "resrc_amount", "efficiency_type", "efficiency_amount", "wait_period",
+]
+# 값이 바뀌면 car_price_history 에 기록하는 컬럼
+TRACKED_COLUMNS = ["model_price", "wait_period"]
+
+CAR_DDL = """
+CREATE TABLE IF NOT EXISTS car (
+  car_id INT AUTO_INCREMENT PRIMARY KEY,
+  comp_name VARCHAR(30),
+  model_name VARCHAR(100),
+  img_url VARCHAR(255),
+  launch_date VARCHAR(8),
+  model_type VARCHAR(30),
+  model_price INT,
+  resrc_type VARCHAR(20),
+  resrc_amount VARCHAR(30),
+  efficiency_type VARCHAR(20),
+  efficiency_amount VARCHAR(30),
+  wait_period VARCHAR(100),
+  UNIQUE KEY uk_car_model (model_name)
+)
+"""
+
+FUEL_DDL = """
+CREATE TABLE IF NOT EXISTS fuel (
+  fuel_id INT AUTO_INCREMENT PRIMARY KEY,
+  model_name VARCHAR(100),
+  fuel_type VARCHAR(30),
+  UNIQUE KEY uk_fuel_model_type (model_name, fuel_type)
+)
+"""
+
+HISTORY_DDL = """
+CREATE TABLE IF NOT EXISTS car_price_history (
+  id           BIGINT AUTO_INCREMENT PRIMARY KEY,
+  model_name   VARCHAR(100) NOT NULL COMMENT '모델명 (car.model_name)',
+  model_price  INT          NULL     COMMENT '가격(만원)',
+  wait_period  VARCHAR(100) NULL     COMMENT '대기기간',
+  observed_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '변경이 확인된 적재 시각',
+  KEY idx_cph_model_time (model_name, observed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+# 모델별 마지막 이력
+_LATEST_HISTORY = """
+    SELECT h.model_name, h.model_price, h.wait_period
+    FROM car_price_history h
+    JOIN (SELECT model_name, MAX(id) AS id FROM car_price_history GROUP BY model_name) m ON m.id = h.id
+"""
+
+
+def ensure_catalog_schema(conn) -> list[str]:
+    """car / fuel / car_price_history 생성, 기존 테이블은 중복 정리 후 유니크 키 추가. 추가한 키 이름 반환"""
+    for ddl in (CAR_DDL, FUEL_DDL, HISTORY_DDL):
+        conn.execute(text(ddl))
+
+    added = []
+    if not has_index(conn, "car", "uk_car_model"):
+        conn.execute(text("""
+            DELETE c FROM car c
+            JOIN car d ON d.model_name = c.model_name AND d.car_id < c.car_id
+        """))
+        ensure_index(conn, "car", "uk_car_model", "UNIQUE KEY uk_car_model (model_name)")
+        added.append("uk_car_model")
+    if not has_index(conn, "fuel", "uk_fuel_model_type"):
+        conn.execute(text("""
+            DELETE f FROM fuel f
+            JOIN fuel d ON d.model_name = f.model_name AND d.fuel_type <=> f.fuel_type AND d.fuel_id < f.fuel_id
+        """))
+        ensure_index(conn, "fuel", "uk_fuel_model_type", "UNIQUE KEY uk_fuel_model_type (model_name, fuel_type)")
+        added.append("uk_fuel_model_type")
+    return added
+
+
+def _prepare_cars(df: pd.DataFrame) -> pd.DataFrame:
+    """엑셀 → car 컬럼만, 모델명 결측 제거, 같은 모델은 마지막 행 유지"""
+    out = df.reindex(columns=CAR_COLUMNS)
+    out["model_name"] = out["model_name"].astype("string").str.strip()
+    out = out.dropna(subset=["model_name"]).drop_duplicates(subset=["model_name"], keep="last")
+    out["model_price"] = pd.to_numeric(out["model_price"], errors="coerce").astype("Int64")
+    return out
+
+
+def load_cars(df: pd.DataFrame, engine) -> dict:
+    """car upsert + 가격/대기기간 변경 이력 기록. {'inserted', 'updated', 'unchanged', 'price_changes'} 반환"""
+    cars = _prepare_cars(df)
+    stage = "car_stage"
+    col_sql = ", ".join(CAR_COLUMNS)
+    value_columns = [c for c in CAR_COLUMNS if c != "model_name"]
+    update_sql = ", ".join(f"{c} = VALUES({c})" for c in value_columns)
+    diff_sql = " OR ".join(f"NOT (c.{c} <=> s.{c})" for c in value_columns)
+    changed_sql = " OR ".join(f"NOT (h.{c} <=> s.{c})" for c in TRACKED_COLUMNS)
+    tracked_sql = ", ".join(TRACKED_COLUMNS)
+
+    with engine.begin() as conn:
+        ensure_catalog_schema(conn)
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+        conn.execute(text(f"CREATE TABLE {stage} LIKE car"))
+        cars.to_sql(stage, con=conn, if_exists="append", index=False, chunksize=2000, method="multi")
+
+        # 마지막 이력과 가격/대기기간이 다르거나 이력이 없는 모델만 기록
+        price_changes = conn.execute(text(f"""
+            INSERT INTO car_price_history (model_name, {tracked_sql})
+            SELECT s.model_name, {", ".join(f"s.{c}" for c in TRACKED_COLUMNS)}
+            FROM {stage} s
+            LEFT JOIN ({_LATEST_HISTORY}) h ON h.model_name = s.model_name
+            WHERE h.model_name IS NULL OR {changed_sql}
+        """)).rowcount
+
+        # upsert 전에 신규/실제로 값이 바뀐 모델 수 집계 (나머지는 변경 없음)
+        inserted, updated = conn.execute(text(f"""
+            SELECT COALESCE(SUM(c.car_id IS NULL), 0), COALESCE(SUM(c.car_id IS NOT NULL AND ({diff_sql})), 0)
+            FROM {stage} s
+            LEFT JOIN car c ON c.model_name = s.model_name
+        """)).one()
+        inserted, updated = int(inserted), int(updated)
+
+        conn.execute(text(f"""
+            INSERT INTO car ({col_sql})
+            SELECT {col_sql} FROM {stage}
+            ON DUPLICATE KEY UPDATE {update_sql}
+        """))
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": len(cars) - inserted - updated,
+        "price_changes": int(price_changes),
+    }
+
+
+def load_fuels(df: pd.DataFrame, engine) -> dict:
+    """fuel 동기화: 원본에 있는 모델의 연료 목록을 원본과 같게 맞춤. {'inserted', 'deleted'} 반환"""
+    fuels = df.reindex(columns=["model_name", "fuel_type"]).astype("string")
+    fuels = fuels.apply(lambda s: s.str.strip()).dropna().drop_duplicates()
+    stage = "fuel_stage"
+
+    with engine.begin() as conn:
+        ensure_catalog_schema(conn)
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+        conn.execute(text(f"CREATE TABLE {stage} LIKE fuel"))
+        fuels.to_sql(stage, con=conn, if_exists="append", index=False, chunksize=2000, method="multi")
+
+        # 원본에 있는 모델인데 원본에서 빠진 연료 삭제
+        deleted = conn.execute(text(f"""
+            DELETE f FROM fuel f
+            JOIN (SELECT DISTINCT model_name FROM {stage}) m ON m.model_name = f.model_name
+            LEFT JOIN {stage} s ON s.model_name = f.model_name AND s.fuel_type = f.fuel_type
+            WHERE s.fuel_id IS NULL
+        """)).rowcount
+        # 없는 (모델, 연료)만 추가. INSERT IGNORE 는 길이 초과/NULL 같은 오류까지 경고로 삼켜 쓰지 않음
+        inserted = conn.execute(text(f"""
+            INSERT INTO fuel (model_name, fuel_type)
+            SELECT s.model_name, s.fuel_type FROM {stage} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM fuel f WHERE f.model_name = s.model_name AND f.fuel_type = s.fuel_type
+            )
+        """)).rowcount
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+
+    return {"inserted": int(inserted), "deleted": int(deleted)}
+
+
+LOADERS = {"car": load_cars, "fuel": load_fuels}
+
+
+def main(force: bool = False, engine=None):
+    # MySQL 연결
+    engine = engine or create_engine(DB_URL)
+
+    # 적재 이력 확인: 내용이 바뀐 엑셀만 다시 적재
+    manifest = IngestManifest(MANIFEST_LOADER, engine)
+    sources = [(CAR_XLSX, "car"), (FUEL_XLSX, "fuel")]
+    if not force:
+        changed, skipped = manifest.partition([path for path, _ in sources])
+        report_skipped(skipped)
+        sources = [(path, table) for path, table in sources if path in changed]
 
-# 엑셀 로드
-df_car = pd.read_excel("data/pdy/danawa_car_data1.xlsx")
-df_fuel = pd.read_excel("data/pdy/DANAWA_car_fuel_data1.xlsx")
+    loaded = {}
+    for path, table in sources:
+        # 엑셀 로드
+        df = pd.read_excel(path)
 
+        # car / fuel 키 기준 upsert
+        counts = LOADERS[table](df, engine)
+        manifest.record(path, row_count=len(df))
+        loaded[table] = len(df)
+        detail = ", ".join(f"{k} {v}" for k, v in counts.items())
+        print(f"[SUCCESS] {table} 적재: {len(df)}건 ({path.name}) - {detail}")
 
-# MySQL 연결
-engine = create_engine(DB_URL)
+    return loaded
 
-# car 테이블 INSERT 실행
-df_car.to_sql(name="car", con=engine, if_exists="append", index=False)
 
-# fuel 테이블 INSERT 실행
-df_fuel.to_sql(name="fuel", con=engine, if_exists="append", index=False)
+if __name__ == "__main__":
+    main(force="--force" in sys.argv[1:])
@@ -0,0 +1,50 @@
+"""danawa_crawler.py 테스트: 로컬 fixture 서버로 수집/재시도/조건부 재검증 확인"""
+
+import pytest
+
+from back.db.pdy.danawa_crawler import PAGE_FILE, _parse_page_range, crawl_pages, serve_fixtures
+from back.utils.http_cache import HttpCache
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    directory = tmp_path / "fixtures"
+    directory.mkdir()
+    for page in (1, 2, 3):
+        (directory / PAGE_FILE.format(page=page)).write_text(f"<html>{page}페이지 " + "차" * 500 + "</html>", encoding="utf-8")
+    return directory
+
+
+def test_crawl_saves_pages_and_skips_missing(fixtures, tmp_path):
+    out_dir = tmp_path / "out"
+    with serve_fixtures(fixtures) as url:
+        saved, stats = crawl_pages([1, 2, 3, 4], url, out_dir=out_dir, retries=0)
+    assert [p.name for p in saved] == [PAGE_FILE.format(page=n) for n in (1, 2, 3)]
+    assert (stats.pages, stats.failed, stats.changed) == (3, 1, 3)
+    assert (out_dir / PAGE_FILE.format(page=2)).read_text(encoding="utf-8").startswith("<html>2페이지")
+
+
+def test_retries_failed_requests(fixtures, tmp_path):
+    with serve_fixtures(fixtures, fail_every=2) as url:
+        saved, stats = crawl_pages([1, 2, 3], url, out_dir=tmp_path / "out", concurrency=1, retries=3, backoff=0.01)
+    assert len(saved) == 3
+    assert stats.retries > 0 and stats.failed == 0
+
+
+def test_revalidation_counts_only_downloaded_bytes(fixtures, tmp_path):
+    cache = HttpCache(tmp_path / "cache")
+    out_dir = tmp_path / "out"
+    with serve_fixtures(fixtures) as url:
+        _, first = crawl_pages([1, 2, 3], url, out_dir=out_dir, cache=cache)
+        (fixtures / PAGE_FILE.format(page=2)).write_text("<html>바뀐 2페이지</html>", encoding="utf-8")
+        saved, second = crawl_pages([1, 2, 3], url, out_dir=out_dir, cache=cache)
+
+    assert first.not_modified == 0 and first.bytes > 0
+    # 1, 3 페이지는 304 → 캐시 본문 재사용 (내려받은 양에서 제외), 바뀐 2페이지만 다시 받음
+    assert second.pages == 3 and second.not_modified == 2 and second.changed == 1
+    assert second.bytes == len("<html>바뀐 2페이지</html>".encode("utf-8"))
+    assert saved[0].read_text(encoding="utf-8").startswith("<html>1페이지")
+
+
+def test_parse_page_range():
+    assert _parse_page_range("1-3,8") == [1, 2, 3, 8]
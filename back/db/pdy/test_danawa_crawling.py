@@ -0,0 +1,77 @@
+"""danawa_crawling.py 테스트: 목록 페이지 카드 파싱 (parse_listing / parse_specs)"""
+
+import pytest
+
+from back.db.pdy.danawa_crawling import parse_listing, parse_specs
+
+
+def _card(model, maker, price, specs, src="//img.danawa.com/a.png"):
+    spans = "".join(f"<span>{s}</span>" for s in specs)
+    price_html = f"<strong>{price}</strong>" if price is not None else ""
+    return f"""
+    <li class="modelItem">
+      <a class="image" href="#"><img src="{src}" alt="{model}"></a>
+      <div class="detail_middle">
+        <img src="//img.danawa.com/logo.png" alt="{maker}">
+        <div class="spec">{spans}</div>
+      </div>
+      <div class="price"><strong>가격</strong> {price_html}<span>만원</span></div>
+    </li>"""
+
+
+SONATA_SPECS = ["2023. 03. 출시", "중형", "가솔린, 하이브리드, LPG", "복합연비 12.5km/ℓ", "1,999cc", "대기기간: 약 2개월"]
+EV_SPECS = ["2024. 01. 출시", "SUV", "전기", "복합전비 5.1km/kWh", "배터리 용량 77.4kWh"]
+
+
+@pytest.fixture
+def listing():
+    cards = _card("현대 쏘나타", "현대", "3,001", SONATA_SPECS) + _card("기아 EV9", "기아", "7,337", EV_SPECS)
+    # 카드 밖 <strong> (배너 문구) 와 카드 밖 이미지 링크
+    return f"""
+    <html><body>
+      <div class="banner"><strong>9,999</strong><a class="image"><img src="b.png" alt="배너"></a></div>
+      <ul class="modelList">{cards}</ul>
+    </body></html>"""
+
+
+def test_parse_listing_fields(listing):
+    records = parse_listing(listing)
+    assert [r["model_name"] for r in records] == ["현대 쏘나타", "기아 EV9"]
+
+    sonata = records[0]
+    assert sonata["comp_name"] == "현대"
+    assert sonata["img_url"] == "//img.danawa.com/a.png"
+    assert sonata["model_price"] == 3001
+    assert sonata["model_type"] == "중형"
+    assert sonata["fuels"] == ["가솔린", "하이브리드", "LPG"]
+    assert sonata["resrc_type"] == "배기량"
+    assert sonata["efficiency_amount"] == "12.5km/ℓ"
+    assert sonata["wait_period"] == "약 2개월"
+
+
+def test_stray_strong_does_not_shift_prices(listing):
+    # 카드 밖 <strong> 이 있어도 가격은 각자 카드에서
+    assert [r["model_price"] for r in parse_listing(listing)] == [3001, 7337]
+
+
+def test_card_without_price():
+    records = parse_listing(f"<ul>{_card('르노 QM6', '르노', None, SONATA_SPECS)}</ul>")
+    assert records[0]["model_price"] is None
+
+
+def test_skips_image_without_alt():
+    html = _card("", "현대", "1,000", SONATA_SPECS).replace(' alt=""', "")
+    assert parse_listing(f"<ul>{html}</ul>") == []
+
+
+def test_parse_specs_electric():
+    info = parse_specs(EV_SPECS)
+    assert info["fuels"] == ["전기"]
+    assert info["efficiency_type"] == "복합전비"
+    assert info["resrc_type"] == "배터리 용량"
+    assert info["resrc_amount"] == "77.4kWh"
+    assert "wait_period" not in info
+
+
+def test_parse_specs_empty():
+    assert parse_specs([]) == {"launch_date": None, "model_type": None, "fuels": []}
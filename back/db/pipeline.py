@@ -0,0 +1,164 @@
+"""
+프로세스 내 적재 파이프라인 (의존관계 DAG 실행기)
+- 적재 작업 하나하나를 Step(이름, 실행 함수, 선행 단계)으로 선언
+- 선행 단계가 모두 성공한 단계부터 스레드 풀에서 동시에 실행 (서로 무관한 적재는 병렬)
+- 선행 단계가 실패하면 그 뒤 단계는 건너뜀, 무관한 단계는 계속 진행
+- 하위 프로세스를 띄우지 않으므로 pandas/SQLAlchemy import 와 Engine(커넥션 풀)을 단계들이 공유
+- 단계 함수의 반환값(행 수 int / {테이블: 행 수} dict / DataFrame)을 행 수로 모아 단계별 소요시간과 함께 보고
+
+사용 예)
+    steps = [
+        Step("schema", create_tables),
+        Step("service_center", load_service_centers, after=("schema",)),
+        Step("registrations", load_registrations),
+    ]
+    results = run_pipeline(steps, workers=4)
+    print_report(results)
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+import logging
+import re
+import time
+
+import pandas as pd
+from sqlalchemy import text
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OK, FAILED, SKIPPED = "성공", "실패", "건너뜀"
+
+
+@dataclass
+class Step:
+    """파이프라인 단계: func() 를 after 의 단계들이 모두 성공한 뒤 실행"""
+    name: str
+    func: Callable[[], Any]
+    after: tuple[str, ...] = ()
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str
+    seconds: float = 0.0
+    rows: int | None = None
+    error: str | None = None
+    detail: dict = field(default_factory=dict)
+
+
+def _count_rows(value) -> tuple[int | None, dict]:
+    """단계 반환값 → (총 행 수, 세부 행 수)"""
+    if isinstance(value, bool) or value is None:
+        return None, {}
+    if isinstance(value, int):
+        return value, {}
+    if isinstance(value, pd.DataFrame):
+        return len(value), {}
+    if isinstance(value, dict):
+        detail = {k: v for k, v in value.items() if isinstance(v, int) and not isinstance(v, bool)}
+        return sum(detail.values()), detail
+    return None, {}
+
+
+def _check_steps(steps: list[Step]) -> None:
+    """이름 중복 / 없는 선행 단계 / 순환 의존 확인"""
+    names = [s.name for s in steps]
+    duplicated = {n for n in names if names.count(n) > 1}
+    if duplicated:
+        raise ValueError(f"단계 이름 중복: {sorted(duplicated)}")
+    for s in steps:
+        unknown = set(s.after) - set(names)
+        if unknown:
+            raise ValueError(f"{s.name}: 알 수 없는 선행 단계 {sorted(unknown)}")
+
+    # 위상 정렬로 순환 확인
+    remaining = {s.name: set(s.after) for s in steps}
+    while remaining:
+        ready = [n for n, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"순환 의존: {sorted(remaining)}")
+        for n in ready:
+            del remaining[n]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _run_step(step: Step) -> StepResult:
+    start = time.perf_counter()
+    try:
+        value = step.func()
+    except Exception as e:
+        logger.exception(f"[{step.name}] 실패")
+        return StepResult(step.name, FAILED, time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+    rows, detail = _count_rows(value)
+    return StepResult(step.name, OK, time.perf_counter() - start, rows=rows, detail=detail)
+
+
+def run_pipeline(steps: list[Step], workers: int = 4) -> list[StepResult]:
+    """steps 를 의존관계 순서로 실행 (독립 단계는 최대 workers 개 동시 실행). 선언 순서대로 결과 반환"""
+    _check_steps(steps)
+    pending = {s.name: s for s in steps}
+    results: dict[str, StepResult] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="step") as pool:
+        running = {}
+        while pending or running:
+            # 선행 단계가 실패/건너뜀이면 건너뜀, 모두 성공이면 시작
+            for name, step in list(pending.items()):
+                blocked = [d for d in step.after if d in results and results[d].status != OK]
+                if blocked:
+                    results[name] = StepResult(name, SKIPPED, error=f"선행 단계 실패: {', '.join(blocked)}")
+                    del pending[name]
+                elif all(d in results for d in step.after):
+                    logger.info(f"[{name}] 시작")
+                    running[pool.submit(_run_step, step)] = name
+                    del pending[name]
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                result = fut.result()
+                results[running.pop(fut)] = result
+                logger.info(f"[{result.name}] {result.status} ({result.seconds:.2f}s)")
+
+    return [results[s.name] for s in steps]
+
+
+def print_report(results: list[StepResult], elapsed: float | None = None) -> None:
+    """단계별 상태/소요시간/행 수 표"""
+    width = max([len(r.name) for r in results] + [4])
+    print(f"\n{'단계':<{width}}  {'상태':<4}  {'시간(s)':>8}  {'행 수':>10}")
+    print("-" * (width + 30))
+    for r in results:
+        rows = f"{r.rows:,}" if r.rows is not None else "-"
+        print(f"{r.name:<{width}}  {r.status:<4}  {r.seconds:>8.2f}  {rows:>10}")
+        for key, value in r.detail.items():
+            print(f"{'':<{width}}    · {key}: {value:,}")
+        if r.error:
+            print(f"{'':<{width}}    ! {r.error}")
+    if elapsed is not None:
+        serial = sum(r.seconds for r in results)
+        print("-" * (width + 30))
+        print(f"전체 {elapsed:.2f}s (단계 합계 {serial:.2f}s)")
+
+
+def create_tables_from_sql(engine, sql_file: Path) -> int:
+    """SQL 파일의 CREATE TABLE 문만 실행 (없을 때만 생성). 실행한 문장 수 반환
+
+    DB/사용자 생성·권한 부여 같은 관리자 문장은 root 권한이 필요하므로 건너뜀
+    (처음 한 번은 mysql 클라이언트로 파일 전체를 직접 실행)
+    """
+    sql = re.sub(r"--[^\n]*|#[^\n]*", "", Path(sql_file).read_text(encoding="utf-8"))
+    statements = [s.strip() for s in sql.split(";")]
+    tables = [s for s in statements if re.match(r"(?i)create\s+table\b", s)]
+    with engine.begin() as conn:
+        for ddl in tables:
+            conn.execute(text(re.sub(r"(?i)^create\s+table\s+(?!if\s+not\s+exists)", "CREATE TABLE IF NOT EXISTS ", ddl)))
+    return len(tables)
@@ -0,0 +1,320 @@
+"""
+mysql.connector 공용 커넥션 풀
+- db_config.get_conn(), 추천/비교 페이지처럼 SQLAlchemy 없이 mysql.connector를 직접 쓰는 코드용
+- 접속 정보(kwargs)별로 풀 1개를 프로세스 전역에서 공유 (스레드 안전)
+- pool_size 만큼 유휴 커넥션 유지, max_overflow 만큼 일시적으로 초과 허용
+- recycle 초가 지난 커넥션은 폐기 후 재연결, pre_ping 으로 꺼낼 때 상태 확인
+- close() 없이 버려진 커넥션은 가비지 컬렉션 때 회수해 자리(slot)를 돌려줌 (상태를 알 수 없으므로 닫음)
+
+사용 예)
+    pool = get_pool("kmj", host="127.0.0.1", user="dochicar", password="...", database="dochicar")
+    with pool.borrow() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+
+벤치마크 (프로젝트 루트에서)
+    python -m back.db.pool
+"""
+
+from contextlib import contextmanager
+from queue import Empty, LifoQueue, SimpleQueue
+import logging
+import os
+import threading
+import time
+import weakref
+
+import mysql.connector
+
+from back.db.instrument import instrument_cursor
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 기본 설정 (환경변수로 조정 가능)
+DEFAULT_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", 5))
+DEFAULT_MAX_OVERFLOW = int(os.getenv("MYSQL_POOL_MAX_OVERFLOW", 10))
+DEFAULT_RECYCLE = int(os.getenv("MYSQL_POOL_RECYCLE", 3600))
+DEFAULT_TIMEOUT = float(os.getenv("MYSQL_POOL_TIMEOUT", 30))
+
+
+class PoolTimeoutError(RuntimeError):
+    """풀에서 timeout 안에 커넥션을 얻지 못한 경우"""
+
+
+class PooledConnection:
+    """풀에서 빌린 커넥션 래퍼. close() 하면 실제로 끊지 않고 풀에 반납"""
+
+    def __init__(self, pool: "ConnectionPool", raw, created_at: float):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        # close() 없이 버려지면 풀이 자리를 회수하도록 등록 (self 를 참조하지 않는 콜백)
+        self._finalizer = weakref.finalize(self, pool._leaked.put, raw)
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise RuntimeError("이미 풀에 반납된 커넥션입니다.")
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        """쿼리 계측(back.db.instrument)이 붙은 커서 반환"""
+        if self._raw is None:
+            raise RuntimeError("이미 풀에 반납된 커넥션입니다.")
+        return instrument_cursor(self._raw.cursor(*args, **kwargs))
+
+    def close(self):
+        if self._raw is None:
+            return
+        raw, self._raw = self._raw, None
+        self._finalizer.detach()
+        self._pool._release(raw, self._created_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """크기/초과/재활용/헬스체크를 지원하는 mysql.connector 커넥션 풀"""
+
+    def __init__(
+        self,
+        connect_kwargs: dict,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        recycle: int = DEFAULT_RECYCLE,
+        pre_ping: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.connect_kwargs = dict(connect_kwargs)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.timeout = timeout
+
+        self._idle = LifoQueue()  # (raw, created_at) - 최근 반납된 커넥션부터 재사용
+        # 반납 없이 버려진 커넥션 (finalizer 는 GC 중 어느 스레드에서나 불리므로 락 없이 넣을 수 있는 큐)
+        self._leaked = SimpleQueue()
+        self._slots = threading.BoundedSemaphore(pool_size + max_overflow)
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._stats = {"connects": 0, "reuses": 0, "recycled": 0, "invalidated": 0, "leaked": 0}
+
+    # ----- 내부 -----
+    def _new_raw(self):
+        raw = mysql.connector.connect(**self.connect_kwargs)
+        with self._lock:
+            self._stats["connects"] += 1
+        return raw, time.monotonic()
+
+    def _discard(self, raw, reason: str):
+        with self._lock:
+            self._stats[reason] += 1
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _is_usable(self, raw, created_at: float) -> bool:
+        if self.recycle >= 0 and time.monotonic() - created_at > self.recycle:
+            self._discard(raw, "recycled")
+            return False
+        if self.pre_ping:
+            try:
+                raw.ping(reconnect=False, attempts=1)
+            except Exception:
+                self._discard(raw, "invalidated")
+                return False
+        return True
+
+    def _reclaim_leaked(self):
+        """close() 없이 버려진 커넥션을 닫고 자리 반환"""
+        while True:
+            try:
+                raw = self._leaked.get_nowait()
+            except Empty:
+                return
+            logger.warning("반납되지 않은 커넥션 회수 (close() 또는 with 문을 사용하세요)")
+            self._discard(raw, "leaked")
+            with self._lock:
+                self._checked_out -= 1
+            self._slots.release()
+
+    def _release(self, raw, created_at: float):
+        try:
+            # 다음 사용자를 위해 트랜잭션 상태 초기화
+            if raw.in_transaction:
+                raw.rollback()
+            keep = self._idle.qsize() < self.pool_size
+        except Exception:
+            keep = False
+            self._discard(raw, "invalidated")
+            raw = None
+
+        if raw is not None:
+            if keep:
+                self._idle.put((raw, created_at))
+            else:
+                # overflow 커넥션은 반납 시 닫음
+                try:
+                    raw.close()
+                except Exception:
+                    pass
+
+        with self._lock:
+            self._checked_out -= 1
+        self._slots.release()
+
+    # ----- 공개 API -----
+    def connect(self) -> PooledConnection:
+        """커넥션 하나를 빌린다. 사용 후 반드시 close() (또는 with 문)"""
+        self._reclaim_leaked()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError(
+                f"커넥션 풀 대기 시간 초과 ({self.timeout}s, size={self.pool_size}, overflow={self.max_overflow})"
+            )
+        try:
+            while True:
+                try:
+                    raw, created_at = self._idle.get_nowait()
+                except Empty:
+                    raw, created_at = self._new_raw()
+                    break
+                if self._is_usable(raw, created_at):
+                    with self._lock:
+                        self._stats["reuses"] += 1
+                    break
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._checked_out += 1
+        return PooledConnection(self, raw, created_at)
+
+    @contextmanager
+    def borrow(self):
+        """with 문으로 커넥션을 빌리고 자동 반납"""
+        conn = self.connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def status(self) -> dict:
+        self._reclaim_leaked()
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "idle": self._idle.qsize(),
+                "checked_out": self._checked_out,
+                **self._stats,
+            }
+
+    def dispose(self):
+        """유휴 커넥션을 모두 닫는다 (빌려간 커넥션은 반납 시 정상 처리)"""
+        while True:
+            try:
+                raw, _ = self._idle.get_nowait()
+            except Empty:
+                break
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+# 접속 정보별 풀 레지스트리
+_POOLS: dict[tuple, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool_key(name: str, connect_kwargs: dict) -> tuple:
+    return (name, tuple(sorted((k, str(v)) for k, v in connect_kwargs.items())))
+
+
+def get_pool(name: str = "default", pool_options: dict | None = None, **connect_kwargs) -> ConnectionPool:
+    """같은 이름/접속 정보에 대해 하나의 풀을 공유해서 반환"""
+    key = _pool_key(name, connect_kwargs)
+    pool = _POOLS.get(key)
+    if pool is not None:
+        return pool
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(connect_kwargs, **(pool_options or {}))
+            _POOLS[key] = pool
+            logger.info(f"mysql 커넥션 풀 생성: {name} (size={pool.pool_size}, overflow={pool.max_overflow})")
+        return pool
+
+
+def get_pool_stats() -> list[dict]:
+    """레지스트리에 있는 풀별 상태"""
+    with _POOLS_LOCK:
+        items = list(_POOLS.items())
+    return [{"name": key[0], **pool.status()} for key, pool in items]
+
+
+def dispose_all() -> int:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.dispose()
+    return len(pools)
+
+
+def _benchmark(connect_kwargs: dict, n: int = 50):
+    """커넥션 생성(핸드셰이크) 비용: 매번 connect vs 풀에서 빌리기"""
+
+    def _query(conn):
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+        cur.fetchall()
+        cur.close()
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        conn = mysql.connector.connect(**connect_kwargs)
+        _query(conn)
+        conn.close()
+    direct = (time.perf_counter() - t0) / n * 1000
+
+    pool = ConnectionPool(connect_kwargs, pool_size=1, max_overflow=0)
+    with pool.borrow() as conn:  # 워밍업
+        _query(conn)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        with pool.borrow() as conn:
+            _query(conn)
+    pooled = (time.perf_counter() - t0) / n * 1000
+    pool.dispose()
+
+    print(f"📊 커넥션 벤치마크 ({n}회)")
+    print(f"   매번 connect : {direct:8.2f} ms/회")
+    print(f"   풀에서 빌리기: {pooled:8.2f} ms/회")
+    if pooled > 0:
+        print(f"   → {direct / pooled:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    # 벤치마크 실행 (프로젝트 루트에서): python -m back.db.pool
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _benchmark(
+        {
+            "host": os.getenv("HOST", "127.0.0.1"),
+            "user": os.getenv("USER"),
+            "password": os.getenv("PASSWORD"),
+            "database": os.getenv("DATABASE"),
+            "port": int(os.getenv("PORT", 3306)),
+        }
+    )
@@ -0,0 +1,58 @@
+"""
+기존 테이블 스키마 보강 (멱등)
+- CREATE TABLE IF NOT EXISTS 는 이미 만들어진 테이블에 새 컬럼/인덱스를 추가하지 못하므로
+  information_schema 로 존재 여부를 확인한 뒤 없을 때만 ALTER TABLE 실행
+- 적재 스크립트에서 매번 호출해도 안전
+
+사용 예)
+    with engine.begin() as conn:
+        ensure_column(conn, "service_center", "open_min", "SMALLINT NULL")
+        ensure_index(conn, "service_center", "ft_name_addr",
+                     "FULLTEXT INDEX ft_name_addr (name_ko, addr_road) WITH PARSER ngram")
+"""
+
+import logging
+
+from sqlalchemy import text
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def has_column(conn, table: str, column: str) -> bool:
+    return bool(conn.execute(
+        text("""
+            SELECT COUNT(*) FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = :table AND column_name = :column
+        """),
+        {"table": table, "column": column},
+    ).scalar())
+
+
+def has_index(conn, table: str, index_name: str) -> bool:
+    return bool(conn.execute(
+        text("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :index_name
+        """),
+        {"table": table, "index_name": index_name},
+    ).scalar())
+
+
+def ensure_column(conn, table: str, column: str, definition: str) -> bool:
+    """컬럼이 없으면 추가. 추가했으면 True"""
+    if has_column(conn, table, column):
+        return False
+    logger.info(f"{table}.{column} 컬럼 추가")
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+    return True
+
+
+def ensure_index(conn, table: str, index_name: str, definition: str) -> bool:
+    """인덱스가 없으면 생성 (definition: 'INDEX idx (...)' / 'FULLTEXT INDEX ...'). 생성했으면 True"""
+    if has_index(conn, table, index_name):
+        return False
+    logger.info(f"{table}.{index_name} 인덱스 생성")
+    conn.execute(text(f"ALTER TABLE {table} ADD {definition}"))
+    return True
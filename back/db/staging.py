@@ -0,0 +1,145 @@
+"""
+스테이징 테이블 경유 멱등 적재 + 원자적 테이블 교체
+- 원본 전체 스냅샷을 {table}_stage 에 적재한 뒤 자연키(key_column)로 기존 테이블과 비교
+  · 기존에 없던 키 → 신규, 행 해시(hash_column)가 달라진 키 → 변경, 같은 키/해시 → 변경 없음
+  · 원본에서 사라진 키 → 삭제
+- {table}_new 를 집합 연산(INSERT ... SELECT) 으로 만들고 RENAME TABLE 한 번으로 교체
+  → 조회 중인 화면은 교체 직전/직후 테이블 중 하나만 보고, 재실행해도 행이 늘어나지 않음
+- 기존 행의 id / created_at 은 유지, 내용이 바뀐 행만 updated_at 갱신
+- 원본을 DataFrame 하나 또는 청크 이터레이터로 받아 청크 단위로 스테이징에 기록 (메모리 사용량 일정)
+  청크 사이의 자연키 중복은 스테이징 테이블 유니크 인덱스로 걸러 먼저 들어온 행 유지
+  (INSERT ... ON DUPLICATE KEY UPDATE 로 키 중복만 건너뜀 - 잘림/NOT NULL 등 다른 오류는 그대로 발생)
+
+사용 예)
+    counts = swap_load(engine, "service_center", df)
+    # {'inserted': 12, 'updated': 3, 'unchanged': 40210, 'deleted': 1, 'duplicates': 0}
+    counts = swap_load(engine, "service_center", iter_chunks(CSV_PATH))
+"""
+
+from typing import Iterable
+import logging
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import Engine
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _drop(conn, *tables):
+    for t in tables:
+        conn.execute(text(f"DROP TABLE IF EXISTS {t}"))
+
+
+def _insert_skip_duplicates(key_column: str):
+    """to_sql method: key_column 이 이미 있는 행만 건너뛰는 INSERT
+
+    INSERT IGNORE 는 키 중복 외에 잘림/잘못된 날짜/NOT NULL 위반까지 경고로 바꿔 적재하므로
+    ON DUPLICATE KEY UPDATE key = key (아무것도 바꾸지 않는 갱신)로 키 중복만 허용
+    """
+    def method(table, conn, keys, data_iter):
+        rows = [dict(zip(keys, row)) for row in data_iter]
+        if not rows:
+            return
+        stmt = mysql_insert(table.table)
+        conn.execute(stmt.on_duplicate_key_update({key_column: table.table.c[key_column]}), rows)
+    return method
+
+
+def swap_load(
+    engine: Engine,
+    table: str,
+    frames: pd.DataFrame | Iterable[pd.DataFrame],
+    key_column: str = "natural_key",
+    hash_column: str = "row_hash",
+    chunksize: int = 2000,
+) -> dict:
+    """frames(원본 전체 - DataFrame 또는 청크 이터레이터)로 table 을 멱등 갱신
+
+    컬럼명은 table 컬럼과 같아야 함 (id, created_at, updated_at 은 이 함수가 채움)
+    신규/변경/변경없음/삭제/중복(같은 자연키로 건너뛴 원본 행) 건수 반환
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+
+    stage, new, old = f"{table}_stage", f"{table}_new", f"{table}_old"
+    columns = None
+    source_rows = 0
+
+    # DDL(CREATE/RENAME)은 MySQL 에서 암묵적으로 커밋되므로 단계별로 실행하고 실패 시 임시 테이블 정리
+    with engine.connect() as conn:
+        try:
+            _drop(conn, stage, new, old)
+            conn.execute(text(f"CREATE TABLE {stage} LIKE {table}"))
+
+            # 청크 단위 스테이징 적재 (청크 간 자연키 중복은 유니크 인덱스로 건너뜀)
+            insert_method = _insert_skip_duplicates(key_column)
+            for chunk in frames:
+                if columns is None:
+                    columns = [c for c in chunk.columns if c not in ("id", "created_at", "updated_at")]
+                chunk.drop_duplicates(subset=[key_column])[columns].to_sql(
+                    stage, con=conn, if_exists="append", index=False, chunksize=chunksize, method=insert_method
+                )
+                source_rows += len(chunk)
+                conn.commit()
+            if columns is None:
+                raise ValueError(f"{table}: 적재할 데이터가 없습니다.")
+            # 중복 = 원본 행 수 - 스테이징에 들어간 행 수 (affected rows 는 드라이버 플래그에 따라 달라 쓰지 않음)
+            duplicates = source_rows - conn.execute(text(f"SELECT COUNT(*) FROM {stage}")).scalar()
+
+            col_sql = ", ".join(columns)
+            src_sql = ", ".join(f"s.{c}" for c in columns)
+            join_sql = f"LEFT JOIN {table} l ON l.{key_column} = s.{key_column}"
+
+            counts = dict(conn.execute(text(f"""
+                SELECT
+                    COALESCE(SUM(l.id IS NULL), 0) AS inserted,
+                    COALESCE(SUM(l.id IS NOT NULL AND NOT (l.{hash_column} <=> s.{hash_column})), 0) AS updated,
+                    COALESCE(SUM(l.id IS NOT NULL AND l.{hash_column} <=> s.{hash_column}), 0) AS unchanged
+                FROM {stage} s {join_sql}
+            """)).mappings().one())
+            counts["deleted"] = conn.execute(text(f"""
+                SELECT COUNT(*) FROM {table} l
+                LEFT JOIN {stage} s ON s.{key_column} = l.{key_column}
+                WHERE s.{key_column} IS NULL
+            """)).scalar()
+            counts = {k: int(v) for k, v in counts.items()}
+            counts["duplicates"] = duplicates
+
+            if counts["inserted"] == counts["updated"] == counts["deleted"] == 0:
+                logger.info(f"{table}: 변경 없음 - 테이블 교체 생략")
+                _drop(conn, stage)
+                conn.commit()
+                return counts
+
+            # 새 테이블: 기존 키는 id/created_at 유지, 새 키는 기존 최대 id 다음부터 번호 부여
+            conn.execute(text(f"CREATE TABLE {new} LIKE {table}"))
+            next_id = conn.execute(text(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")).scalar()
+            conn.execute(text(f"ALTER TABLE {new} AUTO_INCREMENT = {int(next_id)}"))
+            conn.execute(text(f"""
+                INSERT INTO {new} (id, {col_sql}, created_at, updated_at)
+                SELECT l.id, {src_sql}, l.created_at,
+                       IF(l.{hash_column} <=> s.{hash_column}, l.updated_at, NOW())
+                FROM {stage} s JOIN {table} l ON l.{key_column} = s.{key_column}
+            """))
+            conn.execute(text(f"""
+                INSERT INTO {new} ({col_sql})
+                SELECT {src_sql}
+                FROM {stage} s {join_sql}
+                WHERE l.id IS NULL
+                ORDER BY s.id
+            """))
+            conn.commit()
+
+            # 원자적 교체 (두 RENAME 이 한 문장으로 수행됨)
+            conn.execute(text(f"RENAME TABLE {table} TO {old}, {new} TO {table}"))
+            _drop(conn, old, stage)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            _drop(conn, stage, new)
+            raise
+    return counts
@@ -0,0 +1,86 @@
+"""instrument.py 테스트: mysql.connector 커서 래퍼가 SELECT/DML 행 수를 한 번씩만 세는지 확인"""
+
+import pytest
+
+from back.db import instrument
+from back.db.instrument import InstrumentedCursor
+
+
+class FakeCursor:
+    """SELECT 면 결과셋(description)을, 그 외에는 영향 행 수(rowcount)를 흉내내는 커서"""
+
+    def __init__(self, rows, affected=3):
+        self._rows = rows
+        self._affected = affected
+        self.description = None
+        self.rowcount = -1
+        self._pos = 0
+
+    def execute(self, statement, params=None):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.description = [("col",)]
+            self.rowcount = len(self._rows)  # 버퍼 커서처럼 실행 시점에 행 수를 알려줌
+            self._pos = 0
+        else:
+            self.description = None
+            self.rowcount = self._affected
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        self._pos += 1
+        return self._rows[self._pos - 1]
+
+    def fetchmany(self, size=1):
+        rows = self._rows[self._pos : self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._pos :]
+        self._pos = len(self._rows)
+        return rows
+
+    def __iter__(self):
+        while (row := self.fetchone()) is not None:
+            yield row
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    stats = instrument.QueryStats(slow_ms=float("inf"))
+    monkeypatch.setattr(instrument, "_STATS", stats)
+    return stats
+
+
+def _rows(stats, statement):
+    return {e["statement"]: e["rows"] for e in stats.snapshot()}[statement]
+
+
+def test_select_rows_counted_once_on_fetchall(stats):
+    cur = InstrumentedCursor(FakeCursor([(1,), (2,), (3,), (4,)]))
+    cur.execute("SELECT col FROM t")
+    cur.fetchall()
+    assert _rows(stats, "SELECT col FROM t") == 4
+
+
+@pytest.mark.parametrize(
+    "consume",
+    [
+        lambda cur: [cur.fetchone() for _ in range(5)],
+        lambda cur: cur.fetchmany(3) + cur.fetchmany(3),
+        lambda cur: list(cur),
+    ],
+    ids=["fetchone", "fetchmany", "iter"],
+)
+def test_select_rows_counted_for_incremental_fetch(stats, consume):
+    cur = InstrumentedCursor(FakeCursor([(1,), (2,), (3,), (4,)]))
+    cur.execute("SELECT col FROM t")
+    consume(cur)
+    assert _rows(stats, "SELECT col FROM t") == 4
+
+
+def test_dml_uses_rowcount(stats):
+    cur = InstrumentedCursor(FakeCursor([], affected=7))
+    cur.execute("UPDATE t SET col = 1")
+    assert _rows(stats, "UPDATE t SET col = 1") == 7
@@ -0,0 +1,38 @@
+"""
+CSV 스트리밍 읽기
+- 파일 앞부분만 읽어 인코딩(utf-8 / utf-8-sig / cp949)을 한 번에 판별
+  (전체를 utf-8 로 읽다 실패하면 cp949 로 다시 읽는 이중 디코딩 방지)
+- chunksize 단위로 나눠 읽어 파일 크기와 관계없이 메모리 사용량 일정
+
+사용 예)
+    for chunk in read_csv_chunks(CSV_PATH, chunksize=20000, dtype=str):
+        ... 정제 후 적재 ...
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+
+def sniff_encoding(path, block_size: int = 64 * 1024) -> str:
+    """앞부분만 읽어 utf-8(-sig) / cp949 판별"""
+    with open(path, "rb") as f:
+        block = f.read(block_size)
+    if block.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    try:
+        block.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # 블록 끝에서 멀티바이트 문자가 잘린 경우는 utf-8 로 인정
+        if e.start >= len(block) - 3:
+            return "utf-8"
+        return "cp949"
+
+
+def read_csv_chunks(path, chunksize: int = 20000, **kwargs) -> Iterator[pd.DataFrame]:
+    """인코딩을 판별해 chunksize 행씩 나눠 읽기"""
+    path = Path(path)
+    with pd.read_csv(path, encoding=sniff_encoding(path), chunksize=chunksize, **kwargs) as reader:
+        yield from reader
@@ -0,0 +1,99 @@
+"""
+원본 파일 파싱 결과 캐시 (Arrow IPC / Parquet)
+- 엑셀/CSV 원본을 한 번 파싱한 DataFrame을 원본 내용 해시로 키를 잡아 data/interim/frame_cache/ 에 저장
+- 기본 형식은 Arrow IPC(Feather v2, 비압축): 메모리 맵으로 열어 복사 없이(zero-copy) 읽음
+- fmt="parquet" 로 압축된 Parquet 저장도 가능 (용량 우선)
+- 원본이 바뀌면 해시가 달라져 자동으로 다시 파싱하고, 같은 원본의 이전 캐시는 삭제
+- pyarrow 가 없으면 캐시 없이 매번 파싱 (선택적 의존성)
+
+사용 예)
+    df = cached_frame(xlsx_path, lambda: parse_workbook(xlsx_path), name="vehicle_reg")
+"""
+
+from pathlib import Path
+import logging
+
+import pandas as pd
+
+from back.utils.paths import INTERIM_DATA_DIR, file_sha256
+
+try:
+    import pyarrow as pa  # 선택적 의존성
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except Exception:
+    pa = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = INTERIM_DATA_DIR / "frame_cache"
+FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+# 파싱 로직이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+
+def _cache_path(source: Path, name: str, content_hash: str, fmt: str) -> Path:
+    return CACHE_DIR / f"{source.stem}.{name}.v{CACHE_VERSION}.{content_hash[:16]}{FORMATS[fmt]}"
+
+
+def _write(df: pd.DataFrame, path: Path, fmt: str):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if fmt == "arrow":
+        feather.write_feather(table, tmp, compression="uncompressed")
+    else:
+        pq.write_table(table, tmp)
+    tmp.replace(path)  # 쓰는 도중 읽히지 않도록 원자적으로 교체
+
+
+def _read(path: Path, fmt: str) -> pd.DataFrame:
+    if fmt == "arrow":
+        table = feather.read_table(path, memory_map=True)
+    else:
+        table = pq.read_table(path, memory_map=True)
+    return table.to_pandas()
+
+
+def cached_frame(source, parse_fn, name: str = "default", fmt: str = "arrow", refresh: bool = False) -> pd.DataFrame:
+    """source 파일의 파싱 결과(parse_fn())를 캐시에서 읽거나, 없으면 파싱 후 저장"""
+    if fmt not in FORMATS:
+        raise ValueError(f"알 수 없는 캐시 형식: {fmt} (가능: {list(FORMATS)})")
+    if pa is None:
+        return parse_fn()
+
+    source = Path(source)
+    path = _cache_path(source, name, file_sha256(source), fmt)
+
+    if path.exists() and not refresh:
+        try:
+            return _read(path, fmt)
+        except Exception as e:
+            logger.warning(f"캐시 읽기 실패, 다시 파싱합니다 {path.name}: {e}")
+
+    df = parse_fn()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 같은 원본/이름의 이전 버전 캐시 정리
+        for old in CACHE_DIR.glob(f"{source.stem}.{name}.v*"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        _write(df, path, fmt)
+    except Exception as e:
+        # 혼합 타입 컬럼 등 Arrow로 변환할 수 없는 경우 캐시 없이 진행
+        logger.warning(f"캐시 저장 실패 {source.name}: {e}")
+    return df
+
+
+def clear_cache(name: str | None = None) -> int:
+    """캐시 파일 삭제 (name 지정 시 해당 이름만). 삭제한 파일 수 반환"""
+    if not CACHE_DIR.exists():
+        return 0
+    pattern = f"*.{name}.v*" if name else "*"
+    removed = 0
+    for path in CACHE_DIR.glob(pattern):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
@@ -0,0 +1,126 @@
+"""
+오프라인 근사 지오코딩 (외부 API 없음)
+- 좌표가 없거나 범위 밖인 행에 주소로 찾은 지역의 중심 좌표를 채움
+- 중심 좌표는 외부 데이터가 아니라 같은 데이터셋에서 좌표가 있는 행들의 평균
+  · 1순위: 같은 (시도, 시군구, 읍면동) 행들의 평균 좌표
+  · 2순위: 같은 (시도, 시군구) 행들의 평균 좌표
+  · 3순위: 시도 대표 좌표 (SIDO_CENTROIDS, 고정 테이블)
+- coord_approx 에 실제로 쓴 단계를 기록 (COORD_EXACT/DONG/SIGUNGU/SIDO = 0/1/2/3)
+  → 화면에서 근사 정도를 표시하고, 시도 단위 추정(COORD_SIDO)은 지도/주변 검색에서 제외
+- 중심 좌표 테이블은 (합계, 건수) 로 모아 청크 단위로 누적 가능 → 전체를 메모리에 올리지 않음
+- 조회는 "시도|시군구|읍면동" 문자열 키로 한 번에 map (행 단위 반복 없음)
+
+사용 예)
+    sums = [centroid_sums(chunk) for chunk in located_chunks]
+    centroids = build_centroids(sums)
+    df = fill_approx_coordinates(df, centroids)
+"""
+
+from typing import Iterable
+
+import pandas as pd
+
+# 시도 대표 좌표 (위도, 경도) - 시군구를 못 찾은 주소용
+SIDO_CENTROIDS = {
+    "서울": (37.5665, 126.9780),
+    "부산": (35.1796, 129.0756),
+    "대구": (35.8714, 128.6014),
+    "인천": (37.4563, 126.7052),
+    "광주": (35.1595, 126.8526),
+    "대전": (36.3504, 127.3845),
+    "울산": (35.5384, 129.3114),
+    "세종": (36.4800, 127.2890),
+    "경기": (37.4138, 127.5183),
+    "충북": (36.8000, 127.7000),
+    "충남": (36.5184, 126.8000),
+    "전남": (34.8679, 126.9910),
+    "경북": (36.4919, 128.8889),
+    "경남": (35.4606, 128.2132),
+    "제주": (33.4890, 126.4983),
+    "강원": (37.8228, 128.1555),
+    "전북": (35.7175, 127.1530),
+}
+
+# coord_approx 값: 좌표를 어느 단계에서 얻었는지
+COORD_EXACT = 0    # 원본 좌표
+COORD_DONG = 1     # 같은 읍면동 평균
+COORD_SIGUNGU = 2  # 같은 시군구 평균
+COORD_SIDO = 3     # 시도 대표 좌표
+
+# 중심 좌표 단계 (상세한 것부터) - (지역 컬럼, coord_approx 값)
+CENTROID_LEVELS = [(("sido", "sigungu", "dong"), COORD_DONG), (("sido", "sigungu"), COORD_SIGUNGU)]
+
+
+def _region_key(df: pd.DataFrame, columns) -> pd.Series:
+    """지역 컬럼을 '|' 로 이은 조회 키 (하나라도 결측이면 결측)"""
+    key = df[columns[0]].astype("string")
+    for c in columns[1:]:
+        key = key + "|" + df[c].astype("string")
+    return key
+
+
+def centroid_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """좌표 있는 행(sido/sigungu/dong/lat/lon)의 지역 키별 (lat_sum, lon_sum, n)"""
+    df = df.dropna(subset=["lat", "lon"])
+    parts = []
+    for columns, _ in CENTROID_LEVELS:
+        key = _region_key(df, columns)
+        coords = df[["lat", "lon"]].astype("float64")
+        grouped = coords.groupby(key.to_numpy(), dropna=True).agg(
+            lat_sum=("lat", "sum"), lon_sum=("lon", "sum"), n=("lat", "size")
+        )
+        parts.append(grouped)
+    return pd.concat(parts)
+
+
+def build_centroids(sums: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """centroid_sums 결과(청크별)를 합쳐 지역 키별 평균 좌표 (lat, lon, n)
+
+    좌표가 있는 행들만으로 만든 표라 해당 지역에 좌표 있는 행이 하나도 없으면 키가 없음
+    (fill_approx_coordinates 가 다음 단계/시도 대표 좌표로 넘어감)
+    """
+    sums = [s for s in sums if not s.empty]
+    if not sums:
+        return pd.DataFrame(columns=["lat", "lon", "n"], dtype="float64")
+    total = pd.concat(sums).groupby(level=0).sum()
+    return pd.DataFrame({
+        "lat": total["lat_sum"] / total["n"],
+        "lon": total["lon_sum"] / total["n"],
+        "n": total["n"],
+    })
+
+
+def fill_approx_coordinates(df: pd.DataFrame, centroids: pd.DataFrame) -> pd.DataFrame:
+    """lat/lon 이 빈 행을 지역 중심 좌표(build_centroids)로 채우고 coord_approx(단계) 컬럼 추가
+
+    df 에는 sido / sigungu / dong / lat / lon 컬럼이 있어야 함 (dong 은 결측 가능)
+    어느 단계로도 못 채운 행은 좌표 결측, coord_approx = COORD_EXACT 로 남음
+    """
+    lat = pd.to_numeric(df["lat"], errors="coerce").astype("float64")
+    lon = pd.to_numeric(df["lon"], errors="coerce").astype("float64")
+    missing = lat.isna() | lon.isna()
+    lat, lon = lat.where(~missing), lon.where(~missing)  # 한쪽만 있는 좌표는 버림
+    level = pd.Series(COORD_EXACT, index=df.index, dtype="int8")
+
+    # (후보 위도, 후보 경도, coord_approx 값) - 상세한 단계부터
+    steps = []
+    for columns, code in CENTROID_LEVELS:
+        key = _region_key(df, columns)
+        steps.append((key.map(centroids["lat"]), key.map(centroids["lon"]), code))
+    sido = df["sido"].astype("string")
+    steps.append((
+        sido.map({k: v[0] for k, v in SIDO_CENTROIDS.items()}),
+        sido.map({k: v[1] for k, v in SIDO_CENTROIDS.items()}),
+        COORD_SIDO,
+    ))
+
+    for step_lat, step_lon, code in steps:
+        todo = missing & lat.isna()
+        lat = lat.where(~todo, step_lat.astype("float64"))
+        lon = lon.where(~todo, step_lon.astype("float64"))
+        level = level.mask(todo & lat.notna(), code)
+
+    df["lat"] = lat
+    df["lon"] = lon
+    df["coord_approx"] = level
+    return df
@@ -0,0 +1,57 @@
+"""
+행 단위 64비트 해시
+- 여러 컬럼 값을 pandas 벡터화 해시(hash_pandas_object)로 묶어 BIGINT 하나로 표현
+- 자연키(natural key) 비교, 행 내용 변경 감지(row hash), 중복 제거에 사용
+- 중복 제거는 정규화한 키 컬럼의 해시 하나로 비교 (행마다 문자열을 이어 붙이지 않음)
+  seen(이미 본 키 집합)을 넘기면 청크/증분 적재에서도 앞서 나온 키를 계속 걸러냄
+
+사용 예)
+    df["natural_key"] = hash_normalized(df, ["name_ko", "addr"])
+    df["row_hash"] = hash_columns(df, DATA_COLUMNS)
+    df, removed = drop_hash_duplicates(df, "natural_key", seen=seen_keys)
+"""
+
+import pandas as pd
+
+# 해시 고정 키 (pandas 기본값과 동일, 값이 바뀌면 저장된 해시와 달라지므로 변경 금지)
+HASH_KEY = "0123456789123456"
+
+
+def normalize_text(values: pd.Series) -> pd.Series:
+    """비교용 문자열 정규화: 공백/구두점 제거, 소문자, 결측은 빈 문자열"""
+    return (
+        values.astype("string")
+        .fillna("")
+        .str.lower()
+        .str.replace(r"[\s,.()\[\]·]", "", regex=True)
+    )
+
+
+def hash_columns(df: pd.DataFrame, columns) -> pd.Series:
+    """columns 값 조합의 64비트 해시 (MySQL BIGINT 에 맞게 부호 있는 int64)
+
+    타입에 따라 해시가 달라지지 않도록 문자열로 바꾼 뒤 계산 (결측은 빈 문자열)
+    """
+    frame = df[list(columns)].astype("string").fillna("")
+    hashed = pd.util.hash_pandas_object(frame, index=False, hash_key=HASH_KEY)
+    return pd.Series(hashed.to_numpy().view("int64"), index=df.index)
+
+
+def hash_normalized(df: pd.DataFrame, columns) -> pd.Series:
+    """columns 를 normalize_text 로 정규화한 뒤 64비트 해시 (표기 차이를 무시하는 자연키)"""
+    normalized = pd.DataFrame({c: normalize_text(df[c]) for c in columns}, index=df.index)
+    return hash_columns(normalized, columns)
+
+
+def drop_hash_duplicates(df: pd.DataFrame, key: str, seen: set | None = None) -> tuple[pd.DataFrame, int]:
+    """key(해시 컬럼) 기준 중복 제거 - 처음 나온 행 유지. (결과, 제거 건수)
+
+    seen 을 넘기면 그 집합에 있는 키도 제거하고, 남은 키를 집합에 추가 (청크/증분 적재용)
+    """
+    dup = df[key].duplicated()
+    if seen is not None:
+        dup |= df[key].isin(seen)
+    out = df.loc[~dup]
+    if seen is not None:
+        seen.update(out[key].tolist())
+    return out, int(dup.sum())
@@ -0,0 +1,105 @@
+"""
+HTTP 응답 디스크 캐시 (조건부 재검증)
+- URL 별로 본문과 검증자(ETag / Last-Modified), 본문 해시를 data/interim/http_cache/ 에 저장
+- 다음 요청 때 If-None-Match / If-Modified-Since 를 붙여 보내고, 304 Not Modified 면 저장된 본문 사용
+  → 바뀌지 않은 페이지는 본문을 다시 내려받지 않음
+- 본문 해시(sha256)를 함께 저장해 200 으로 다시 받아도 내용이 같은지 판별 (changed=False)
+
+사용 예)
+    cache = HttpCache()
+    headers = cache.conditional_headers(url)
+    ... 요청 ...
+    if status == 304:
+        body = cache.body(url)
+    else:
+        changed = cache.store(url, body, response_headers)
+"""
+
+from pathlib import Path
+import hashlib
+import json
+import time
+
+from back.utils.paths import INTERIM_DATA_DIR
+
+CACHE_DIR = INTERIM_DATA_DIR / "http_cache"
+
+
+def content_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """URL → (본문, ETag, Last-Modified, 본문 해시) 디스크 캐시"""
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.directory = Path(directory)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.html"
+
+    def lookup(self, url: str) -> dict | None:
+        """저장된 메타데이터 (없거나 본문 파일이 없으면 None)"""
+        meta_path, body_path = self._paths(url)
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def body(self, url: str) -> str:
+        return self._paths(url)[1].read_text(encoding="utf-8")
+
+    def conditional_headers(self, url: str) -> dict:
+        """저장된 검증자로 만든 조건부 요청 헤더 (캐시 없으면 빈 dict)"""
+        meta = self.lookup(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url: str, body: str, headers: dict | None = None) -> bool:
+        """200 응답 저장. 이전 본문과 내용이 달라졌으면 True"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        digest = content_hash(body)
+        previous = self.lookup(url)
+        changed = previous is None or previous.get("content_hash") != digest
+
+        meta_path, body_path = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if changed:
+            tmp = body_path.with_suffix(".tmp")
+            tmp.write_text(body, encoding="utf-8")
+            tmp.replace(body_path)  # 쓰는 도중 읽히지 않도록 원자적으로 교체
+        meta = {
+            "url": url,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content_hash": digest,
+            "fetched_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        return changed
+
+    def touch(self, url: str) -> None:
+        """304 로 재검증된 항목의 확인 시각 갱신"""
+        meta = self.lookup(url)
+        if meta:
+            meta["fetched_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._paths(url)[0].write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+    def clear(self) -> int:
+        """캐시 파일 삭제. 삭제한 파일 수 반환"""
+        if not self.directory.exists():
+            return 0
+        removed = 0
+        for path in self.directory.glob("*"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
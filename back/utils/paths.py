@@ -3,6 +3,7 @@
 """
 
 from pathlib import Path
+import hashlib
 import os
 
 # 프로젝트 루트 경로
@@ -99,6 +100,14 @@ def get_page_path(filename: str) -> Path:
     """페이지 파일의 전체 경로를 반환"""
     return PAGES_DIR / filename
 
+def file_sha256(path, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 SHA-256 (청크 단위로 읽어 메모리 일정)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 # 자주 사용되는 경로들을 미리 정의
 AUTO_REPAIR_CSV = get_data_path("auto_repair_standard.csv", "team", "ohj")
 ENV_FILE = PROJECT_ROOT / ".env"
@@ -0,0 +1,141 @@
+"""
+행정구역(시도/시군구) 테이블과 주소 → 지역 파서
+- 시도: 표준 2자리 행정구역코드, 짧은 이름(등록대수 통계와 같은 '서울', '경기' 표기), 별칭
+- 시군구: 시도별 이름 목록 (일반구가 있는 시는 '수원시 장안구' 처럼 시+구 복합 이름)
+  → 자동차 등록대수 시계열(vehicle_reg_region_monthly)의 sido/sigungu 와 같은 값이라 그대로 조인 가능
+- parse_regions(): 주소 Series 를 한 번에(벡터화) 시도/시군구/지역코드로 변환
+  · 앞 단어를 시도 별칭 사전으로 조회, 다음 1~2 단어를 (시도, 시군구) 집합으로 조회
+  · 시도가 빠진 주소는 전국에서 유일한 시군구 이름으로 시도를 역추적
+
+사용 예)
+    regions = parse_regions(df["addr_road"].fillna(df["addr_jibun"]))
+    df[["sido", "sigungu", "region_code"]] = regions
+"""
+
+import pandas as pd
+
+# (코드, 짧은 이름, 별칭들)
+SIDO = [
+    ("11", "서울", ["서울특별시", "서울시"]),
+    ("26", "부산", ["부산광역시", "부산시"]),
+    ("27", "대구", ["대구광역시", "대구시"]),
+    ("28", "인천", ["인천광역시", "인천시"]),
+    ("29", "광주", ["광주광역시"]),
+    ("30", "대전", ["대전광역시", "대전시"]),
+    ("31", "울산", ["울산광역시", "울산시"]),
+    ("36", "세종", ["세종특별자치시", "세종시"]),
+    ("41", "경기", ["경기도"]),
+    ("43", "충북", ["충청북도"]),
+    ("44", "충남", ["충청남도"]),
+    ("46", "전남", ["전라남도"]),
+    ("47", "경북", ["경상북도"]),
+    ("48", "경남", ["경상남도"]),
+    ("50", "제주", ["제주특별자치도", "제주도"]),
+    ("51", "강원", ["강원특별자치도", "강원도"]),
+    ("52", "전북", ["전북특별자치도", "전라북도"]),
+]
+
+# 시도별 시군구 (공백이 있는 이름은 '_' 로 표기)
+_SIGUNGU = {
+    "서울": "강남구 강동구 강북구 강서구 관악구 광진구 구로구 금천구 노원구 도봉구 동대문구 동작구 마포구 서대문구 "
+            "서초구 성동구 성북구 송파구 양천구 영등포구 용산구 은평구 종로구 중구 중랑구",
+    "부산": "강서구 금정구 기장군 남구 동구 동래구 부산진구 북구 사상구 사하구 서구 수영구 연제구 영도구 중구 해운대구",
+    "대구": "군위군 남구 달서구 달성군 동구 북구 서구 수성구 중구",
+    "인천": "강화군 계양구 남동구 동구 미추홀구 부평구 서구 연수구 옹진군 중구",
+    "광주": "광산구 남구 동구 북구 서구",
+    "대전": "대덕구 동구 서구 유성구 중구",
+    "울산": "남구 동구 북구 울주군 중구",
+    "세종": "세종특별자치시",
+    "경기": "가평군 고양시_덕양구 고양시_일산동구 고양시_일산서구 과천시 광명시 광주시 구리시 군포시 김포시 남양주시 "
+            "동두천시 부천시 부천시_소사구 부천시_오정구 부천시_원미구 성남시_분당구 성남시_수정구 성남시_중원구 "
+            "수원시_권선구 수원시_영통구 수원시_장안구 수원시_팔달구 시흥시 안산시_단원구 안산시_상록구 안성시 "
+            "안양시_동안구 안양시_만안구 양주시 양평군 여주시 연천군 오산시 용인시_기흥구 용인시_수지구 용인시_처인구 "
+            "의왕시 의정부시 이천시 파주시 평택시 포천시 하남시 화성시",
+    "충북": "괴산군 단양군 보은군 영동군 옥천군 음성군 제천시 증평군 진천군 청원군 청주시_상당구 청주시_서원구 "
+            "청주시_청원구 청주시_흥덕구 충주시",
+    "충남": "계룡시 공주시 금산군 논산시 당진시 보령시 부여군 서산시 서천군 아산시 예산군 천안시_동남구 천안시_서북구 "
+            "청양군 태안군 홍성군",
+    "전남": "강진군 고흥군 곡성군 광양시 구례군 나주시 담양군 목포시 무안군 보성군 순천시 신안군 여수시 영광군 영암군 "
+            "완도군 장성군 장흥군 진도군 함평군 해남군 화순군",
+    "경북": "경산시 경주시 고령군 구미시 군위군 김천시 문경시 봉화군 상주시 성주군 안동시 영덕군 영양군 영주시 영천시 "
+            "예천군 울릉군 울진군 의성군 청도군 청송군 칠곡군 포항시_남구 포항시_북구",
+    "경남": "거제시 거창군 고성군 김해시 남해군 밀양시 사천시 산청군 양산시 의령군 진주시 창녕군 창원시_마산합포구 "
+            "창원시_마산회원구 창원시_성산구 창원시_의창구 창원시_진해구 통영시 하동군 함안군 함양군 합천군",
+    "제주": "서귀포시 제주시",
+    "강원": "강릉시 고성군 동해시 삼척시 속초시 양구군 양양군 영월군 원주시 인제군 정선군 철원군 춘천시 태백시 평창군 "
+            "홍천군 화천군 횡성군",
+    "전북": "고창군 군산시 김제시 남원시 무주군 부안군 순창군 완주군 익산시 임실군 장수군 전주시_덕진구 전주시_완산구 "
+            "정읍시 진안군",
+}
+
+# 개편 전 이름 → 현재 이름
+SIGUNGU_ALIASES = {
+    ("인천", "남구"): "미추홀구",
+    ("경기", "여주군"): "여주시",
+    ("충남", "당진군"): "당진시",
+}
+
+SIDO_CODES = {name: code for code, name, _ in SIDO}
+SIDO_NAMES = [name for _, name, _ in SIDO]
+SIGUNGU = {sido: [n.replace("_", " ") for n in names.split()] for sido, names in _SIGUNGU.items()}
+
+# 주소 첫 단어 → 시도 짧은 이름
+_SIDO_LOOKUP = {alias: name for _, name, aliases in SIDO for alias in [name, *aliases]}
+
+# "시도|시군구" 조회 키
+_SIGUNGU_KEYS = {f"{sido}|{name}": name for sido, names in SIGUNGU.items() for name in names}
+_SIGUNGU_KEYS.update({f"{sido}|{old}": new for (sido, old), new in SIGUNGU_ALIASES.items()})
+
+# 일반구가 있는 시의 "시도|시" (구 없이 시까지만 적힌 주소용)
+_CITY_KEYS = {f"{sido}|{name.split()[0]}" for sido, names in SIGUNGU.items() for name in names if " " in name}
+
+# 전국에서 한 시도에만 있는 시군구 이름 → 시도 (시도 없이 시작하는 주소용)
+_name_counts = pd.Series([name for names in SIGUNGU.values() for name in names]).value_counts()
+_SIDO_BY_SIGUNGU = {
+    name: sido for sido, names in SIGUNGU.items() for name in names if _name_counts[name] == 1
+}
+
+
+def sigungu_options(sido: str) -> list[str]:
+    """시도의 시군구 이름 목록 (화면 필터용)"""
+    return SIGUNGU.get(sido, [])
+
+
+def parse_regions(addresses: pd.Series) -> pd.DataFrame:
+    """주소 → (sido, sigungu, region_code). 찾지 못한 값은 결측"""
+    # 문자열 연산 결과와 dict 조회 결과를 섞어 쓰므로 object 로 통일 (결측은 NaN)
+    addr = addresses.astype(object).where(addresses.notna()).str.strip().str.replace(r"\s+", " ", regex=True)
+    tokens = addr.str.split(" ", n=3, expand=True).reindex(columns=range(4)).astype(object)
+    t0, t1, t2 = tokens[0], tokens[1], tokens[2]
+
+    sido = t0.map(_SIDO_LOOKUP).astype(object)
+
+    # 시도가 없으면 첫 단어부터가 시군구 (전국 유일한 이름일 때만 시도 역추적)
+    no_sido = sido.isna()
+    first = t0.where(no_sido, t1)
+    second = t1.where(no_sido, t2)
+    compound = first + " " + second
+    sido = sido.fillna(compound.map(_SIDO_BY_SIGUNGU)).fillna(first.map(_SIDO_BY_SIGUNGU)).astype(object)
+
+    # 복합 이름('수원시 장안구') 우선, 없으면 한 단어
+    sigungu = (sido + "|" + compound).map(_SIGUNGU_KEYS).astype(object)
+    sigungu = sigungu.fillna((sido + "|" + first).map(_SIGUNGU_KEYS)).astype(object)
+    # 일반구가 있는 시인데 구 없이 시만 적힌 주소는 시 이름까지만
+    sigungu = sigungu.fillna(first.where((sido + "|" + first).isin(_CITY_KEYS)))
+    # 세종은 시군구 단계가 없음
+    sigungu = sigungu.mask(sido == "세종", "세종특별자치시")
+
+    return pd.DataFrame({
+        "sido": sido.astype("string"),
+        "sigungu": sigungu.astype("string"),
+        "region_code": sido.map(SIDO_CODES).astype("string"),
+    }, index=addresses.index)
+
+
+# 읍면동 단어: '역삼동', '오포읍', '남면', '태평로1가' (도로명주소는 괄호 안 참고항목)
+_DONG_RE = r"(?:^|[\s(,])([가-힣0-9.]+(?:동|읍|면|가))(?=[\s,)]|$)"
+
+
+def parse_dong(addresses: pd.Series) -> pd.Series:
+    """주소 → 읍면동 이름 (주소에서 처음 나오는 읍/면/동/가 단어). 없으면 결측"""
+    return addresses.astype("string").str.extract(_DONG_RE, expand=False)
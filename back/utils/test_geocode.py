@@ -0,0 +1,47 @@
+"""back/utils/geocode.py 테스트: 데이터셋 자체의 평균 좌표로 채우고, 실제로 쓴 단계를 coord_approx 에 기록하는지"""
+
+import pandas as pd
+import pytest
+
+from back.utils.geocode import (
+    COORD_DONG,
+    COORD_EXACT,
+    COORD_SIDO,
+    COORD_SIGUNGU,
+    SIDO_CENTROIDS,
+    build_centroids,
+    centroid_sums,
+    fill_approx_coordinates,
+)
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "sido":    ["서울", "서울", "서울", "서울", "서울", "부산", None],
+        "sigungu": ["강남구", "강남구", "강남구", "강남구", "중구", "해운대구", None],
+        "dong":    ["역삼동", "역삼동", "역삼동", "삼성동", "명동", "우동", None],
+        "lat":     [37.50, 37.52, None, None, None, None, None],
+        "lon":     [127.02, 127.04, None, None, None, None, None],
+    })
+
+
+def test_fill_levels(df):
+    centroids = build_centroids([centroid_sums(df)])
+    out = fill_approx_coordinates(df, centroids)
+
+    assert out["coord_approx"].tolist() == [
+        COORD_EXACT, COORD_EXACT, COORD_DONG, COORD_SIGUNGU, COORD_SIDO, COORD_SIDO, COORD_EXACT,
+    ]
+    # 읍면동/시군구 단계는 좌표 있는 행들의 평균 (외부 좌표 아님)
+    assert out.loc[2, ["lat", "lon"]].tolist() == pytest.approx([37.51, 127.03])
+    assert out.loc[3, ["lat", "lon"]].tolist() == pytest.approx([37.51, 127.03])
+    assert tuple(out.loc[5, ["lat", "lon"]]) == pytest.approx(SIDO_CENTROIDS["부산"])
+    # 지역을 모르면 좌표 결측 그대로
+    assert out.loc[6, ["lat", "lon"]].isna().all()
+
+
+def test_centroids_accumulate_across_chunks(df):
+    whole = build_centroids([centroid_sums(df)])
+    chunked = build_centroids([centroid_sums(df.iloc[:1]), centroid_sums(df.iloc[1:])])
+    pd.testing.assert_frame_equal(whole.sort_index(), chunked.sort_index())
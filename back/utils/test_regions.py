@@ -0,0 +1,71 @@
+"""back/utils/regions.py 테스트: 주소 → 시도/시군구/지역코드, 읍면동"""
+
+import pandas as pd
+import pytest
+
+from back.utils.regions import SIDO_CODES, parse_dong, parse_regions, sigungu_options
+
+
+@pytest.mark.parametrize("address, sido, sigungu", [
+    ("서울특별시 강남구 테헤란로 152", "서울", "강남구"),
+    ("서울 중구 세종대로 110", "서울", "중구"),
+    ("경기도 수원시 장안구 정자로 1", "경기", "수원시 장안구"),
+    ("경기도 수원시 정자동 111", "경기", "수원시"),  # 구 없이 시까지만
+    ("경기도 화성시 봉담읍 동화리 1", "경기", "화성시"),
+    ("인천광역시 남구 주안동 1", "인천", "미추홀구"),  # 개편 전 이름
+    ("세종특별자치시 한누리대로 2130", "세종", "세종특별자치시"),
+    ("강원도 춘천시 중앙로 1", "강원", "춘천시"),
+    ("전라북도 전주시 완산구 효자동 1", "전북", "전주시 완산구"),
+    ("  부산광역시   해운대구  우동 1 ", "부산", "해운대구"),  # 공백 정리
+    ("해운대구 우동 1", "부산", "해운대구"),  # 시도 없이 시작 (전국 유일한 이름)
+])
+def test_parse_regions(address, sido, sigungu):
+    row = parse_regions(pd.Series([address])).iloc[0]
+    assert row["sido"] == sido
+    assert row["sigungu"] == sigungu
+    assert row["region_code"] == SIDO_CODES[sido]
+
+
+def test_ambiguous_or_unknown_addresses_are_missing():
+    df = parse_regions(pd.Series(["중구 세종대로 110", "어딘가 123", None, ""]))
+    assert df["sido"].isna().all()
+    assert df["sigungu"].isna().all()
+    assert df["region_code"].isna().all()
+
+
+def test_unknown_sigungu_keeps_sido():
+    row = parse_regions(pd.Series(["서울특별시 없는구 1"])).iloc[0]
+    assert row["sido"] == "서울" and pd.isna(row["sigungu"])
+
+
+def test_keeps_index_and_string_dtype():
+    addresses = pd.Series(["서울특별시 강남구", "부산광역시 중구"], index=[10, 20], dtype="str")
+    df = parse_regions(addresses)
+    assert df.index.tolist() == [10, 20]
+    assert all(str(dtype) == "string" for dtype in df.dtypes)
+
+
+def test_sigungu_options():
+    assert "강남구" in sigungu_options("서울")
+    assert sigungu_options(None) == []
+
+
+@pytest.mark.parametrize("address, dong", [
+    ("서울특별시 강남구 역삼동 123-4", "역삼동"),
+    ("경기도 광주시 오포읍 신현리 1", "오포읍"),
+    ("충청남도 천안시 동남구 북면 1", "북면"),
+    ("서울특별시 중구 태평로1가 31", "태평로1가"),
+    ("서울특별시 강남구 테헤란로 152 (역삼동)", "역삼동"),  # 도로명주소 참고항목
+    ("서울특별시 종로구 세종로 1 (세종로, 정부청사)", None),
+    ("부산광역시 해운대구 좌동 1", "좌동"),
+    ("서울특별시 강남구 테헤란로 152", None),
+    (None, None),
+])
+def test_parse_dong(address, dong):
+    result = parse_dong(pd.Series([address], dtype="object"))[0]
+    assert (pd.isna(result) if dong is None else result == dong)
+
+
+def test_parse_dong_does_not_match_inside_words():
+    # '동구' 의 '동', '가정로' 의 '가' 처럼 단어 중간은 읍면동이 아님
+    assert pd.isna(parse_dong(pd.Series(["대전광역시 동구 가정로 1"]))[0])
@@ -0,0 +1,56 @@
+"""back/utils/xlsx_stream.py 테스트: openpyxl iter_rows(values_only=True) 와 같은 결과인지 확인"""
+
+from openpyxl import Workbook, load_workbook
+import pytest
+
+from back.utils.xlsx_stream import iter_sheet_rows
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "요약"
+    wb.create_sheet("04.성별_연령별")
+    ws = wb["04.성별_연령별"]
+    ws["A1"] = "제목"
+    # 2행은 비워 둠
+    ws.append([])
+    ws["A3"], ws["B3"], ws["D3"] = "서울", 1234, 1.5
+    ws["A4"], ws["C4"], ws["E4"] = "부산", True, None
+    path = tmp_path / "통계.xlsx"
+    wb.save(path)
+    return path
+
+
+def _openpyxl_rows(path, sheet, **kwargs):
+    ws = load_workbook(path, read_only=True)[sheet]
+    rows = []
+    for row in ws.iter_rows(values_only=True, **kwargs):
+        row = list(row)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(tuple(row))
+    return rows
+
+
+def test_matches_openpyxl(workbook):
+    assert list(iter_sheet_rows(workbook, "04.성별_연령별")) == _openpyxl_rows(workbook, "04.성별_연령별")
+
+
+def test_values_and_empty_rows(workbook):
+    rows = list(iter_sheet_rows(workbook, "04.성별_연령별"))
+    assert rows[0] == ("제목",)
+    assert rows[1] == ()  # 빈 행도 자리를 지켜 행 번호가 엑셀과 같음
+    assert rows[2] == ("서울", 1234, None, 1.5)
+    assert rows[3] == ("부산", None, True)
+
+
+def test_row_range(workbook):
+    rows = list(iter_sheet_rows(workbook, "04.성별_연령별", min_row=3, max_row=4))
+    assert [r[0] for r in rows] == ["서울", "부산"]
+
+
+def test_unknown_sheet(workbook):
+    with pytest.raises(KeyError):
+        list(iter_sheet_rows(workbook, "없는시트"))
@@ -0,0 +1,132 @@
+"""
+xlsx 시트 스트리밍 리더
+- openpyxl 없이 xlsx(zip) 안의 시트 XML을 iterparse 로 직접 읽어 행 단위로 값 tuple 생성
+- 대상 시트와 sharedStrings 만 읽고 styles.xml 등은 건드리지 않으므로 큰 서식 파일에서 특히 빠름
+- 셀 서식은 해석하지 않음: 날짜 서식 셀은 엑셀 일련번호(숫자)로 반환됨
+
+사용 예)
+    for row in iter_sheet_rows("통계.xlsx", "04.성별_연령별", min_row=3):
+        print(row)
+"""
+
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+import posixpath
+import re
+import zipfile
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+
+
+def _column_index(letters: str) -> int:
+    """'A' → 0, 'T' → 19, 'AA' → 26"""
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx - 1
+
+
+def _text_of(elem) -> str:
+    """<si>/<is> 안의 모든 <t> 텍스트 연결 (서식 run 포함)"""
+    return "".join(t.text or "" for t in elem.iter(f"{NS_MAIN}t"))
+
+
+def _sheet_path(zf: zipfile.ZipFile, sheet_name: str) -> str:
+    """시트 이름 → zip 내부 XML 경로"""
+    rels = {}
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{NS_PKG_REL}Relationship":
+                rels[elem.get("Id")] = elem.get("Target")
+
+    with zf.open("xl/workbook.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{NS_MAIN}sheet" and elem.get("name") == sheet_name:
+                target = rels[elem.get(f"{NS_REL}id")]
+                if target.startswith("/"):
+                    return target.lstrip("/")
+                return posixpath.normpath(posixpath.join("xl", target))
+    raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings = []
+    with zf.open("xl/sharedStrings.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{NS_MAIN}si":
+                strings.append(_text_of(elem))
+                elem.clear()
+    return strings
+
+
+def _cell_value(cell, shared: list[str]):
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{NS_MAIN}is")
+        return _text_of(inline) if inline is not None else None
+
+    v = cell.find(f"{NS_MAIN}v")
+    if v is None or v.text is None:
+        return None
+    text = v.text
+    if cell_type == "s":
+        return shared[int(text)]
+    if cell_type == "b":
+        return text == "1"
+    if cell_type in ("str", "e"):
+        return text
+    # 숫자
+    if "." in text or "E" in text or "e" in text:
+        number = float(text)
+        return int(number) if number.is_integer() else number
+    return int(text)
+
+
+def iter_sheet_rows(path, sheet_name: str, min_row: int = 1, max_row: int | None = None):
+    """시트의 각 행을 값 tuple로 생성 (openpyxl iter_rows(values_only=True)와 같은 모양)
+
+    비어 있는 행도 빈 tuple로 채워서 반환하므로 행 번호가 엑셀과 일치한다.
+    """
+    with zipfile.ZipFile(Path(path)) as zf:
+        shared = _shared_strings(zf)
+        with zf.open(_sheet_path(zf, sheet_name)) as f:
+            expected = 1
+            for _, elem in iterparse(f):
+                if elem.tag != f"{NS_MAIN}row":
+                    continue
+                row_idx = int(elem.get("r", expected))
+
+                if max_row is not None and row_idx > max_row:
+                    break
+
+                # 중간에 빠진 행 채우기
+                while expected < row_idx:
+                    if expected >= min_row:
+                        yield ()
+                    expected += 1
+                expected = row_idx + 1
+
+                if row_idx < min_row:
+                    elem.clear()
+                    continue
+
+                values = []
+                for pos, cell in enumerate(elem.iter(f"{NS_MAIN}c")):
+                    ref = cell.get("r")
+                    m = _CELL_REF_RE.match(ref) if ref else None
+                    col = _column_index(m.group(1)) if m else pos
+                    if col >= len(values):
+                        values.extend([None] * (col + 1 - len(values)))
+                    values[col] = _cell_value(cell, shared)
+
+                # 뒤쪽 빈 셀 정리
+                while values and values[-1] is None:
+                    values.pop()
+                yield tuple(values)
+                elem.clear()
@@ -0,0 +1,4 @@
+"""
+pytest 설정: 프로젝트 루트를 sys.path 에 두어 테스트에서 back.* 로 import
+(rootdir 의 conftest.py 는 pytest 가 자동으로 경로에 추가)
+"""
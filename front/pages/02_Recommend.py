@@ -5,6 +5,7 @@
 
 import streamlit as st
 import pandas as pd
+from mysql.connector import errorcode, errors as mysql_errors
 
 import sys
 import os
@@ -16,10 +17,22 @@ from back.db.kmj.db_config import get_conn
 st.set_page_config(page_title="맞춤 추천 - DOCHICHA.Inc", page_icon="💡")
 
 
-def main():
-    conn = get_conn()
-    cursor = conn.cursor()
-
+def _distinct_options(cursor, column, rollup_table):
+    """옵션 목록은 작은 롤업 테이블에서 조회 (롤업이 아직 없으면 vehicle_reg 원본 조회)"""
+    try:
+        cursor.execute(f"SELECT DISTINCT {column} FROM {rollup_table} ORDER BY {column}")
+        rows = cursor.fetchall()
+        if rows:
+            return [row[0] for row in rows]
+    except mysql_errors.ProgrammingError as e:
+        # 롤업 테이블이 아직 생성되지 않은 경우(1146)만 원본으로 대체, 그 외 오류는 그대로 표시
+        if e.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise
+    cursor.execute(f"SELECT DISTINCT {column} FROM vehicle_reg")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _render(cursor):
     # ===== 단위 자동 감지: 평균값이 100,000(=10만원) 이상이면 '원' 단위로 간주 =====
     cursor.execute("SELECT AVG(model_price) FROM car WHERE model_price IS NOT NULL")
     _avg = cursor.fetchone()[0] or 0
@@ -30,8 +43,7 @@ def main():
     # =======================================================================
 
     # --- 옵션 로드 ---
-    cursor.execute("SELECT DISTINCT age_group FROM vehicle_reg")
-    age_options = [row[0] for row in cursor.fetchall()]
+    age_options = _distinct_options(cursor, "age_group", "vehicle_reg_month_age")
 
     car_type_query = """
         SELECT DISTINCT
@@ -47,11 +59,9 @@ def main():
     cursor.execute(car_type_query)
     car_type_options = [row[0] for row in cursor.fetchall()]
 
-    cursor.execute("SELECT DISTINCT region FROM vehicle_reg")
-    region_options = [row[0] for row in cursor.fetchall()]
+    region_options = _distinct_options(cursor, "region", "vehicle_reg_month_region")
 
-    cursor.execute("SELECT DISTINCT gender FROM vehicle_reg")
-    gender_options = [row[0] for row in cursor.fetchall()]
+    gender_options = _distinct_options(cursor, "gender", "vehicle_reg_month_gender")
 
     cursor.execute("SELECT DISTINCT comp_name FROM car")
     brand_options = [row[0] for row in cursor.fetchall()]
@@ -226,8 +236,17 @@ def main():
         except Exception as e:
             st.error(f"추천 중 오류가 발생했습니다: {e}")
 
-    cursor.close()
-    conn.close()
+
+def main():
+    conn = get_conn()
+    try:
+        cursor = conn.cursor()
+        try:
+            _render(cursor)
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -2,7 +2,6 @@
 차량 비교 페이지
 최대 3개 차량 비교
 """
-import mysql.connector
 import streamlit as st
 import pandas as pd
 from sqlalchemy import text
@@ -13,16 +12,21 @@ import sys
 from dotenv import load_dotenv
 load_dotenv()
 import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from back.db.pool import get_pool
 # ------import
 
 
-#DB 커넥트 객체 생성
-conn = mysql.connector.connect(
-    host=os.getenv('DB_HOST'),
-    user=os.getenv('DB_USER'),
-    password=os.getenv('DB_PASSWORD'),
-    database=os.getenv('DB_NAME')
-)
+#DB 커넥션 풀 (rerun/세션 간 공유, 모듈 import 시점에는 연결하지 않음)
+def get_conn():
+    return get_pool(
+        "compare",
+        host=os.getenv('DB_HOST'),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        database=os.getenv('DB_NAME'),
+    ).connect()
 
 #STREAMLIT 페이지
 st.set_page_config(
@@ -73,17 +77,25 @@ def main():
         st.stop()
 
     placeholders = ','.join(['%s'] * len(sel))
-    query = f"""SELECT c.car_id, c.model_name, c.img_url, c.launch_date, model_type, model_price, resrc_amount, efficiency_amount, wait_period, GROUP_CONCAT(f.fuel_type SEPARATOR ', ') AS fuel_types
+    # 연료는 모델별로 먼저 묶어서 조인 (car 한 행당 한 행, 중복 연료 행이 있어도 한 번만 표시)
+    query = f"""SELECT c.car_id, c.model_name, c.img_url, c.launch_date, model_type, model_price, resrc_amount, efficiency_amount, wait_period, f.fuel_types
                 FROM car c
-                LEFT JOIN fuel f ON c.model_name = f.model_name
-                WHERE c.car_id IN ({placeholders})
-                GROUP BY c.car_id, c.model_name, c.img_url, launch_date, model_type, model_price, resrc_amount, efficiency_amount, wait_period;"""
-
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute(query, tuple(sel))
-
-    rows = cursor.fetchall()
-    cursor.close()
+                LEFT JOIN (
+                    SELECT model_name, GROUP_CONCAT(DISTINCT fuel_type ORDER BY fuel_type SEPARATOR ', ') AS fuel_types
+                    FROM fuel
+                    GROUP BY model_name
+                ) f ON c.model_name = f.model_name
+                WHERE c.car_id IN ({placeholders});"""
+
+    conn = get_conn()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, tuple(sel))
+
+        rows = cursor.fetchall()
+        cursor.close()
+    finally:
+        conn.close()
 
     df = pd.DataFrame(rows)
 
@@ -120,4 +132,3 @@ def ensure_session():
 
 
 main()
-conn.close()
\ No newline at end of file
@@ -4,11 +4,13 @@ MySQL의 dochicar.service_center 실데이터 연동
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from sqlalchemy import text
 from pathlib import Path
 import sys
 import os
+import re
 from datetime import datetime, time
 
 
@@ -18,6 +20,14 @@ if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
 from back.db.conn import get_engine  # noqa: E402
+from back.utils.regions import SIDO_NAMES, sigungu_options  # noqa: E402
+from back.utils.geocode import COORD_DONG, COORD_SIDO, COORD_SIGUNGU  # noqa: E402
+from back.db.ohj.geo_index import GridIndex, cell_deg_for_zoom, cluster_points  # noqa: E402
+from back.db.ohj.service_center_schema import (  # noqa: E402
+    FULLTEXT_COLUMNS,
+    has_fulltext_index,
+    open_at_condition,
+)
 
 
 st.set_page_config(
@@ -25,6 +35,19 @@ st.set_page_config(
     page_icon="🔧"
 )
 
+# n-gram 전문 검색 최소 단어 길이 (MySQL ngram_token_size 기본값)
+NGRAM_MIN_LEN = 2
+# 검색 결과 건수는 이 값까지만 셈 (넘으면 "N건 이상")
+COUNT_CAP = 10000
+PAGE_SIZES = [20, 50, 100, 200]
+# 정렬 방식: 관련도순은 전문 검색어가 있을 때만 적용 (없으면 이름순)
+SORT_OPTIONS = {"관련도순": "relevance", "이름순": "name"}
+# 지도로 보내는 클러스터 마커 최대 개수
+MAX_MAP_MARKERS = 300
+# 근사 좌표 단계별 '위치' 표시 (시도 단위는 지도/주변 검색에서 제외되고 목록에만 나옴)
+COORD_APPROX_LABELS = {COORD_DONG: "근사(읍면동)", COORD_SIGUNGU: "근사(시군구)", COORD_SIDO: "근사(시도)"}
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
 
 def _get_service_type_mapping() -> dict:
     """정비소 유형 코드를 실제 명칭으로 매핑"""
@@ -101,65 +124,162 @@ def _calculate_zoom_level(map_df: pd.DataFrame) -> int:
         return 16
 
 
-def _search_service_centers(keyword: str, service_type: int, brand: str, operating_only: bool) -> pd.DataFrame:
-    """서비스센터 검색. 이름/주소에 키워드 LIKE, 유형/브랜드/운영상태 필터 적용"""
-    engine = get_engine()
-    type_mapping = _get_service_type_mapping()
+@st.cache_data(ttl=600, show_spinner=False)
+def _fulltext_available() -> bool:
+    """service_center 에 n-gram 전문 인덱스가 있는지 (03 적재 스크립트가 생성)"""
+    with get_engine().connect() as conn:
+        return has_fulltext_index(conn)
+
+
+def _split_terms(*texts) -> tuple[list[str], list[str]]:
+    """검색어를 공백 단위 단어로 나눠 (전문 검색 단어, LIKE 단어) 로 분리
+
+    n-gram 토큰보다 짧은 단어(1글자)는 전문 인덱스로 찾을 수 없어 LIKE 로 처리
+    """
+    ft_terms, like_terms = [], []
+    for value in texts:
+        for term in _BOOLEAN_OPERATORS.sub(" ", value or "").split():
+            (ft_terms if len(term) >= NGRAM_MIN_LEN else like_terms).append(term)
+    return ft_terms, like_terms
+
+
+def _match_sql() -> str:
+    """이름/주소 n-gram 전문 검색 조건 (WHERE 필터와 관련도 점수에 같이 사용)"""
+    return f"MATCH({', '.join(FULLTEXT_COLUMNS)}) AGAINST (:ft IN BOOLEAN MODE)"
+
 
+def _build_search_filter(
+    keyword: str, service_type: int, brand: str, operating_only: bool, open_at: time | None = None,
+    sido: str | None = None, sigungu: str | None = None
+) -> tuple[str, dict]:
+    """검색 조건 → (WHERE 절, 파라미터). 이름/주소 n-gram 전문 검색, 지역/유형/브랜드/운영상태 필터"""
     conditions = []
     params = {}
 
-    # 키워드 검색
-    if keyword:
-        conditions.append("(name_ko LIKE :kw OR addr_road LIKE :kw)")
-        params["kw"] = f"%{keyword.strip()}%"
+    # 지역 필터 (적재 시 주소에서 파싱해 둔 컬럼 → 인덱스 동등 조건)
+    if sido:
+        conditions.append("sido = :sido")
+        params["sido"] = sido
+        if sigungu:
+            conditions.append("sigungu = :sigungu")
+            params["sigungu"] = sigungu
+
+    # 키워드 + 브랜드 검색: 모든 단어를 포함하는 정비소 (전문 인덱스가 없으면 LIKE)
+    ft_terms, like_terms = _split_terms(keyword, brand if brand != "전체" else None)
+    if ft_terms and not _fulltext_available():
+        ft_terms, like_terms = [], ft_terms + like_terms
+
+    if ft_terms:
+        conditions.append(_match_sql())
+        params["ft"] = " ".join(f'+"{term}"' for term in ft_terms)
+
+    for i, term in enumerate(like_terms):
+        conditions.append(f"(name_ko LIKE :kw{i} OR addr_road LIKE :kw{i} OR addr_jibun LIKE :kw{i})")
+        params[f"kw{i}"] = f"%{term}%"
 
     # 정비 유형 필터
     if service_type:
         conditions.append("type_code = :type_code")
         params["type_code"] = service_type
 
-    # 브랜드 필터
-    if brand and brand != "전체":
-        conditions.append("(name_ko LIKE :brand OR addr_road LIKE :brand)")
-        params["brand"] = f"%{brand}%"
-
-    # 운영중인 정비소만 필터
+    # 운영중인 정비소만 필터 (기준 시각 미지정 시 현재 시각, 운영시간 정보가 없는 곳은 포함)
     if operating_only:
-        current_time = datetime.now().time()
-        current_hour = current_time.hour
-        conditions.append("""
+        at = open_at or datetime.now().time()
+        conditions.append(f"""
             (status_code = 1 OR status_code IS NULL) AND
-            (
-                (open_time IS NULL AND close_time IS NULL) OR
-                (
-                    open_time IS NOT NULL AND close_time IS NOT NULL AND
-                    TIME(open_time) <= :current_time AND TIME(close_time) >= :current_time
-                )
-            )
+            (open_min IS NULL OR {open_at_condition("t_min")})
         """)
-        params["current_time"] = current_time.strftime("%H:%M")
+        params["t_min"] = at.hour * 60 + at.minute
 
     where_sql = " AND ".join(conditions) if conditions else "1=1"
+    return where_sql, params
+
+
+def _page_order(params: dict, sort: str) -> str:
+    """실제 적용할 정렬 ('relevance' 는 전문 검색어가 있을 때만)"""
+    return "relevance" if sort == "relevance" and "ft" in params else "name"
+
 
-    sql = text(f"""
-        SELECT
-            name_ko AS 정비소명,
-            addr_road AS 도로명주소,
-            phone AS 전화번호,
-            type_code,
-            lat, lon,
-            open_time,
-            close_time
-        FROM service_center
-        WHERE {where_sql}
-        ORDER BY name_ko
-        LIMIT 1000
-    """)
+def _page_cursor(row, order: str) -> tuple:
+    """페이지 마지막 행 → 다음 페이지 키셋 커서"""
+    if order == "relevance":
+        return float(row["score"]), int(row["id"])
+    return row["정비소명"], int(row["id"])
+
+
+def _fetch_page(
+    where_sql: str, params: dict, after: tuple | None, page_size: int, order: str = "name"
+) -> tuple[pd.DataFrame, bool]:
+    """키셋 페이지 조회. after 다음 행부터 page_size 건, (결과, 다음 페이지 존재 여부)
+
+    - name: (name_ko, id) 순. 인덱스 순서대로 마지막 행 위치에서 바로 이어 읽으므로 뒤쪽 페이지도 첫 페이지와 같은 비용
+    - relevance: (전문 검색 점수 DESC, id) 순. 점수는 인덱스로 정렬할 수 없어 페이지마다
+      일치하는 행 전체를 정렬하지만, 전문 검색 결과 안에서만 정렬하므로 관련도순을 유지
+    """
+    engine = get_engine()
+    params = dict(params, limit=page_size + 1)
+    columns_sql = """
+        id,
+        name_ko AS 정비소명,
+        addr_road AS 도로명주소,
+        phone AS 전화번호,
+        type_code,
+        lat, lon, coord_approx,
+        open_time,
+        close_time
+    """
+
+    if order == "relevance":
+        # 점수를 SELECT 목록에서 한 번 계산하고 바깥에서 (score, id) 로 이어 읽기
+        seek_sql = ""
+        if after is not None:
+            seek_sql = "WHERE score < :after_score OR (score = :after_score AND id > :after_id)"
+            params.update(after_score=after[0], after_id=after[1])
+        sql = text(f"""
+            SELECT * FROM (
+                SELECT {columns_sql}, {_match_sql()} AS score
+                FROM service_center
+                WHERE {where_sql}
+            ) t
+            {seek_sql}
+            ORDER BY score DESC, id
+            LIMIT :limit
+        """)
+    else:
+        seek_sql = ""
+        if after is not None:
+            seek_sql = "AND (name_ko > :after_name OR (name_ko = :after_name AND id > :after_id))"
+            params.update(after_name=after[0], after_id=after[1])
+        sql = text(f"""
+            SELECT {columns_sql}
+            FROM service_center
+            WHERE {where_sql} {seek_sql}
+            ORDER BY name_ko, id
+            LIMIT :limit
+        """)
 
     with engine.connect() as conn:
         df = pd.read_sql(sql, conn, params=params)
-    
+
+    has_next = len(df) > page_size
+    return _decorate_results(df.iloc[:page_size].copy()), has_next
+
+
+def _estimate_count(where_sql: str, params: dict, cap: int = COUNT_CAP) -> tuple[int, bool]:
+    """검색 결과 건수 (cap 건까지만 세고 넘으면 (cap, True))"""
+    engine = get_engine()
+    with engine.connect() as conn:
+        count = conn.execute(
+            text(f"SELECT COUNT(*) FROM (SELECT 1 FROM service_center WHERE {where_sql} LIMIT :cap) t"),
+            dict(params, cap=cap + 1),
+        ).scalar()
+    return min(count, cap), count > cap
+
+
+def _decorate_results(df: pd.DataFrame) -> pd.DataFrame:
+    """검색 결과에 정비유형 명칭/운영시간 표시 컬럼 추가"""
+    type_mapping = _get_service_type_mapping()
+
     # 정비 유형을 실제 명칭으로 변환
     if not df.empty:
         df['정비유형'] = df['type_code'].map(type_mapping).fillna('미분류')
@@ -171,10 +291,185 @@ def _search_service_centers(keyword: str, service_type: int, brand: str, operati
         # 빈 값 처리
         df['도로명주소'] = df['도로명주소'].fillna('-')
         df['전화번호'] = df['전화번호'].fillna('-')
+
+        # 주소로 채운 근사 좌표 표시 (지역 중심 좌표라 실제 위치와 다를 수 있음)
+        if 'coord_approx' in df.columns:
+            df['위치'] = df['coord_approx'].map(COORD_APPROX_LABELS).fillna('')
     
     return df
 
 
+def _data_version() -> tuple:
+    """service_center 데이터 버전 (행 수, 최종 수정 시각) - 바뀌면 공간 인덱스 재생성"""
+    engine = get_engine()
+    with engine.connect() as conn:
+        count, updated = conn.execute(text("""
+            SELECT COUNT(*), MAX(updated_at) FROM service_center
+        """)).one()
+    return int(count), str(updated)
+
+
+@st.cache_resource(show_spinner="공간 인덱스 생성 중...")
+def _load_geo_index(version: tuple) -> GridIndex:
+    """좌표가 있는 정비소 전체로 격자 공간 인덱스 생성 (데이터 버전당 한 번)
+
+    시도 대표 좌표로 채운 행(COORD_SIDO)은 실제 위치와 수십 km 떨어질 수 있어 제외
+    """
+    engine = get_engine()
+    with engine.connect() as conn:
+        points = pd.read_sql(text("""
+            SELECT id, lat, lon
+            FROM service_center
+            WHERE lat IS NOT NULL AND lon IS NOT NULL AND coord_approx < :coord_sido
+        """), conn, params={"coord_sido": COORD_SIDO})
+    return GridIndex(points["id"], points["lat"], points["lon"])
+
+
+def _search_nearby(lat: float, lon: float, radius_km: float, limit: int) -> pd.DataFrame:
+    """기준 좌표 반경 radius_km 안의 정비소 (가까운 순 최대 limit 건, 반경 0이면 최근접 limit 건)"""
+    index = _load_geo_index(_data_version())
+    if radius_km > 0:
+        ids, dist = index.within(lat, lon, radius_km, limit=limit)
+    else:
+        ids, dist = index.nearest(lat, lon, n=limit)
+
+    columns = ["정비소명", "도로명주소", "전화번호", "type_code", "lat", "lon", "coord_approx", "open_time", "close_time"]
+    if len(ids) == 0:
+        return pd.DataFrame(columns=columns)
+
+    # 인덱스로 고른 id 만 PK 로 조회
+    engine = get_engine()
+    params = {f"id{i}": int(v) for i, v in enumerate(ids)}
+    placeholders = ", ".join(f":{k}" for k in params)
+    with engine.connect() as conn:
+        df = pd.read_sql(text(f"""
+            SELECT
+                id,
+                name_ko AS 정비소명,
+                addr_road AS 도로명주소,
+                phone AS 전화번호,
+                type_code,
+                lat, lon, coord_approx,
+                open_time,
+                close_time
+            FROM service_center
+            WHERE id IN ({placeholders})
+        """), conn, params=params)
+
+    # 거리순 정렬 유지
+    distance = pd.Series(dist, index=ids)
+    df["거리(km)"] = df["id"].map(distance).round(2)
+    df = df.sort_values("거리(km)").drop(columns=["id"]).reset_index(drop=True)
+    return _decorate_results(df)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_points(where_sql: str, params: dict) -> pd.DataFrame:
+    """검색 조건에 맞는 전체 정비소 좌표 (지도 클러스터 계산용, 서버에만 보관, 시도 단위 추정 좌표 제외)"""
+    engine = get_engine()
+    with engine.connect() as conn:
+        return pd.read_sql(text(f"""
+            SELECT lat, lon
+            FROM service_center
+            WHERE {where_sql} AND lat IS NOT NULL AND lon IS NOT NULL AND coord_approx < :coord_sido
+        """), conn, params=dict(params, coord_sido=COORD_SIDO))
+
+
+def _drill_into_cluster(clusters: pd.DataFrame):
+    """클러스터 선택 시 해당 클러스터 범위로 지도 확대"""
+    choice = st.session_state.cluster_selector
+    if choice is None:
+        return
+    c = clusters.iloc[choice]
+    st.session_state.map_bounds = (c["lat_min"], c["lat_max"], c["lon_min"], c["lon_max"])
+    st.session_state.cluster_selector = None
+
+
+def _render_cluster_map(points: pd.DataFrame):
+    """좌표를 줌 레벨별 격자 클러스터로 묶어 지도 표시 (마커 수 MAX_MAP_MARKERS 이하)"""
+    view = points.rename(columns={"lat": "latitude", "lon": "longitude"}).astype("float64")
+
+    # 클러스터 확대 중이면 해당 범위만
+    bounds = st.session_state.map_bounds
+    if bounds is not None:
+        lat_min, lat_max, lon_min, lon_max = bounds
+        view = view[
+            view["latitude"].between(lat_min, lat_max) & view["longitude"].between(lon_min, lon_max)
+        ]
+
+    # 검색 결과에 따른 지도 줌 레벨 결정 → 같은 줌 기준으로 클러스터링
+    zoom_level = _calculate_zoom_level(view)
+    clusters = cluster_points(view["latitude"], view["longitude"], zoom_level, max_clusters=MAX_MAP_MARKERS)
+
+    # 마커 크기(m): 격자 한 칸 크기 기준, 개수가 많을수록 크게
+    cell_m = cell_deg_for_zoom(zoom_level) * 111_000
+    clusters["size"] = (cell_m / 2) * np.sqrt(clusters["count"] / clusters["count"].max()).clip(lower=0.2)
+    st.map(clusters, latitude="latitude", longitude="longitude", size="size", zoom=zoom_level)
+    st.caption(f"정비소 {len(view):,}곳 → 지도 마커 {len(clusters):,}개")
+
+    # 클러스터 드릴다운
+    multi = clusters[clusters["count"] > 1].reset_index(drop=True)
+    d1, d2 = st.columns([4, 1])
+    with d1:
+        if not multi.empty:
+            st.selectbox(
+                "클러스터 확대",
+                [None] + list(range(len(multi))),
+                format_func=lambda i: "확대할 클러스터 선택" if i is None else
+                    f"{multi.at[i, 'count']:,}곳 (위도 {multi.at[i, 'latitude']:.3f}, 경도 {multi.at[i, 'longitude']:.3f})",
+                key="cluster_selector",
+                on_change=_drill_into_cluster,
+                args=(multi,),
+            )
+    with d2:
+        if bounds is not None and st.button("전체 지도", use_container_width=True):
+            st.session_state.map_bounds = None
+            st.rerun()
+
+
+def _go_page(step: int):
+    """이전(-1)/다음(+1) 페이지 이동. 버튼 on_click 콜백이라 화면을 그리기 전에 실행됨"""
+    query = st.session_state.search_query
+    df = st.session_state.search_results
+    cursors = query["cursors"]
+    if step > 0:
+        if not query["has_next"] or df.empty:
+            return
+        cursors.append(_page_cursor(df.iloc[-1], query["order"]))
+    else:
+        if len(cursors) == 1:
+            return
+        cursors.pop()
+
+    page, has_next = _fetch_page(query["where_sql"], query["params"], cursors[-1], query["page_size"], query["order"])
+    if page.empty and len(cursors) > 1:
+        # 그사이 행이 지워져 다음 페이지가 비었으면 현재 페이지에 머묾 (빈 페이지로 넘어가지 않음)
+        cursors.pop()
+        query["has_next"] = False
+        return
+
+    query["has_next"] = has_next
+    st.session_state.search_results = page
+    st.session_state.selected_center = None
+
+
+def _render_pager(query: dict) -> pd.DataFrame:
+    """이전/다음 페이지 버튼 (키셋 커서 스택). 현재 페이지 결과 반환"""
+    page_no = len(query["cursors"])
+    total = f"{query['total']:,}건 이상" if query["capped"] else f"{query['total']:,}건"
+    last_page = None if query["capped"] else max(1, -(-query["total"] // query["page_size"]))
+
+    p1, p2, p3 = st.columns([1, 3, 1])
+    with p1:
+        st.button("◀ 이전", disabled=page_no == 1, on_click=_go_page, args=(-1,), use_container_width=True)
+    with p2:
+        pages = f"{page_no} / {last_page}" if last_page else f"{page_no}"
+        st.caption(f"총 {total} 검색됨 · {pages} 페이지")
+    with p3:
+        st.button("다음 ▶", disabled=not query["has_next"], on_click=_go_page, args=(1,), use_container_width=True)
+    return st.session_state.search_results
+
+
 def main():
     st.title("🔧 정비소 현황")
     st.markdown("도치카 DB에 적재된 실데이터를 검색하고 지도에서 확인하세요.")
@@ -182,8 +477,15 @@ def main():
     # 세션 상태 초기화
     if 'search_results' not in st.session_state:
         st.session_state.search_results = None
+    if 'map_bounds' not in st.session_state:
+        st.session_state.map_bounds = None  # 클러스터 확대 범위 (lat_min, lat_max, lon_min, lon_max)
+    if 'search_query' not in st.session_state:
+        st.session_state.search_query = None  # 키워드 검색 조건/건수/페이지 커서
     if 'selected_center' not in st.session_state:
         st.session_state.selected_center = None
+    if 'open_at' not in st.session_state:
+        # 영업 기준 시각 기본값은 처음 한 번만 현재 시각으로 (이후 rerun 에서는 사용자가 고른 값 유지)
+        st.session_state.open_at = datetime.now().time().replace(second=0, microsecond=0)
 
     # 필터 영역
     st.subheader("🔍 정비소 검색")
@@ -198,7 +500,7 @@ def main():
     brand_options = ["전체"] + _get_brand_keywords()
 
     # 검색 필터와 버튼을 같은 라인에 배치
-    col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 1, 1])
+    col1, col2, col3, col4, col5, col6 = st.columns([2, 2, 2, 1, 1, 1])
 
     with col1:
         keyword = st.text_input("검색어", placeholder="정비소명, 주소")
@@ -213,21 +515,80 @@ def main():
     with col4:
         operating_only = st.checkbox("영업중", value=False)
 
+    # 지역 필터
+    r1, r2, r3, _ = st.columns([2, 2, 2, 2])
+    with r1:
+        sido = st.selectbox("시도", ["전체"] + SIDO_NAMES)
+        sido = None if sido == "전체" else sido
+    with r2:
+        sigungu = st.selectbox("시군구", ["전체"] + sigungu_options(sido), disabled=sido is None)
+        sigungu = None if sigungu == "전체" else sigungu
+    with r3:
+        sort = SORT_OPTIONS[st.selectbox("정렬", list(SORT_OPTIONS), help="관련도순은 검색어가 있을 때만 적용")]
+
+    # 영업 기준 시각 (기본: 페이지를 처음 연 시각)
+    open_at = None
+    if operating_only:
+        open_at = st.time_input("영업 기준 시각", key="open_at")
+
     with col5:
+        page_size = st.selectbox("페이지당", PAGE_SIZES, index=1)
+
+    with col6:
         search_clicked = st.button("🔎 검색", type="primary", use_container_width=True)
 
-    # 검색 실행
+    # 위치 기반 검색 (기본 좌표: 서울시청)
+    with st.expander("📍 내 주변 정비소 찾기"):
+        n1, n2, n3, n4, n5 = st.columns([2, 2, 2, 1, 1])
+        with n1:
+            center_lat = st.number_input("위도", value=37.5665, format="%.6f")
+        with n2:
+            center_lon = st.number_input("경도", value=126.9780, format="%.6f")
+        with n3:
+            radius_km = st.slider("반경(km, 0이면 가장 가까운 순)", 0.0, 50.0, 3.0, step=0.5)
+        with n4:
+            nearby_limit = st.number_input("최대 건수", min_value=1, max_value=1000, value=20)
+        with n5:
+            nearby_clicked = st.button("📍 주변 검색", use_container_width=True)
+
+    if nearby_clicked:
+        with st.spinner("주변 정비소 검색 중..."):
+            st.session_state.search_results = _search_nearby(
+                center_lat, center_lon, radius_km, int(nearby_limit)
+            )
+        st.session_state.search_query = None
+        st.session_state.map_bounds = None
+        st.session_state.selected_center = None
+
+    # 검색 실행: 조건/건수만 저장하고 결과는 한 페이지씩 조회
     if search_clicked:
         with st.spinner("검색 중..."):
-            df = _search_service_centers(
+            where_sql, params = _build_search_filter(
                 keyword=keyword, 
                 service_type=service_type, 
                 brand=brand,
-                operating_only=operating_only
+                operating_only=operating_only,
+                open_at=open_at,
+                sido=sido,
+                sigungu=sigungu
             )
-        
-        # 검색 결과를 세션 상태에 저장
+            order = _page_order(params, sort)
+            total, capped = _estimate_count(where_sql, params)
+            df, has_next = _fetch_page(where_sql, params, None, page_size, order)
+
+        # 세션에는 현재 페이지와 페이지 시작 커서만 저장 (검색 건수와 무관하게 일정한 크기)
+        st.session_state.search_query = {
+            "where_sql": where_sql,
+            "params": params,
+            "page_size": page_size,
+            "order": order,
+            "total": total,
+            "capped": capped,
+            "cursors": [None],  # 각 페이지 시작 직전 (name_ko, id) 또는 (score, id)
+            "has_next": has_next,
+        }
         st.session_state.search_results = df
+        st.session_state.map_bounds = None
         st.session_state.selected_center = None  # 검색 시 선택 초기화
 
     # 검색 결과가 있으면 표시
@@ -237,26 +598,31 @@ def main():
         if df.empty:
             st.warning("검색 결과가 없습니다. 검색 조건을 변경해보세요.")
         else:
-            st.caption(f"총 {len(df):,}건 검색됨")
-            
+            query = st.session_state.search_query
+            if query is None:
+                st.caption(f"총 {len(df):,}건 검색됨")
+            else:
+                df = _render_pager(query)
+
             # 데이터 테이블 표시 (영업상태 컬럼 제외)
-            display_df = df.drop(columns=["lat", "lon", "type_code", "open_time", "close_time"])
+            display_df = df.drop(columns=["id", "score", "lat", "lon", "coord_approx", "type_code", "open_time", "close_time"], errors="ignore")
             st.dataframe(display_df, use_container_width=True)
 
-            # 지도 표시
+            # 지도 표시: 현재 페이지가 아닌 검색 결과 전체 좌표를 서버에서 클러스터링
             st.subheader("🗺️ 지도")
+            if query is None:
+                points = df[["lat", "lon"]].dropna()
+            else:
+                points = _fetch_points(query["where_sql"], query["params"])
             map_df = df.dropna(subset=["lat", "lon"]).copy()
-            
+
+            if not points.empty:
+                _render_cluster_map(points)
+
             if not map_df.empty:
                 # 좌표 컬럼명 변경
                 map_df = map_df.rename(columns={"lat": "latitude", "lon": "longitude"})
                 
-                # 검색 결과에 따른 지도 줌 레벨 결정
-                zoom_level = _calculate_zoom_level(map_df)
-                
-                # 지도 표시 (검색 결과에 맞게 fit)
-                st.map(map_df[["latitude", "longitude"]], zoom=zoom_level)
-                
                 # 정비소 선택을 위한 selectbox
                 st.subheader("📋 정비소 선택")
                 